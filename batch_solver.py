@@ -0,0 +1,168 @@
+"""
+Resolución en lote de archivos de tableros con un pool de procesos
+"""
+
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from board import Board
+from loader import load_board_from_file
+from puzzle_pack import PackReader
+from solver import NumberLinkSolver
+
+# Extensión de los contenedores binarios; sus puzzles se nombran "archivo.nlpk#N"
+PACK_SUFFIX = ".nlpk"
+
+# Contenedores abiertos en este proceso (se reutilizan entre tableros)
+_PACK_READERS = {}
+
+
+def expand_inputs(inputs):
+    """
+    Convierte directorios, patrones glob y rutas en una lista ordenada de archivos
+
+    Args:
+        inputs: Lista de rutas; un directorio aporta sus ``*.txt`` y un
+            patrón (``generated_*.txt``) los archivos que coincidan. Un
+            contenedor ``.nlpk`` aporta una entrada ``archivo.nlpk#N`` por puzzle
+
+    Returns:
+        list: Rutas de archivo sin duplicados, en orden alfabético
+    """
+    files = set()
+    for item in inputs:
+        if os.path.isdir(item):
+            files.update(glob.glob(os.path.join(item, "*.txt")))
+        elif glob.has_magic(item):
+            files.update(path for path in glob.glob(item) if os.path.isfile(path))
+        else:
+            files.add(item)
+
+    expanded = []
+    for path in sorted(files):
+        if path.endswith(PACK_SUFFIX) and os.path.isfile(path):
+            with PackReader(path) as reader:
+                expanded.extend(f"{path}#{i}" for i in range(len(reader)))
+        else:
+            expanded.append(path)
+    return expanded
+
+
+def load_board(path):
+    """Carga un tablero de un archivo de texto o de una entrada ``archivo.nlpk#N``"""
+    container, sep, index = path.rpartition("#")
+    if sep and container.endswith(PACK_SUFFIX):
+        reader = _PACK_READERS.get(container)
+        if reader is None:
+            reader = _PACK_READERS[container] = PackReader(container)
+        return reader.board(int(index))
+    return Board(*load_board_from_file(path))
+
+
+def paths_by_number(board, paths):
+    """Asocia cada camino al número de su par (valor de su primera celda)"""
+    return {board.get_cell(*path[0]): path for path in paths}
+
+
+def checkpoint_file(checkpoint_dir, path):
+    """Punto de control de un tablero dentro de ``checkpoint_dir``"""
+    name = path.replace(os.sep, "_").replace("#", "_")
+    return os.path.join(checkpoint_dir, name + ".nlck")
+
+
+def solve_file(path, time_limit=60, require_all_cells=False, engine="exhaustivo",
+               orders=None, cancel_token=None, cache_path=None, checkpoint_dir=None):
+    """
+    Resuelve un archivo de tablero y devuelve un resultado serializable a JSON
+
+    ``cancel_token`` (CancellationToken) permite abortar la resolución desde
+    otro hilo; solo tiene efecto en el mismo proceso. ``cache_path`` es el
+    archivo SQLite de la caché de soluciones (cada proceso abre el suyo).
+    Con ``checkpoint_dir`` una búsqueda exhaustiva que agota el tiempo deja
+    ahí su punto de control, y la siguiente llamada para el mismo archivo la
+    continúa en lugar de empezar de cero.
+
+    Returns:
+        dict: file, success, paths ({numero: [[r, c], ...]}, base 0),
+        nodes_explored, elapsed, order_name, engine, cache_hit, resumed,
+        checkpoint (archivo guardado o None) y error (None si todo fue bien)
+    """
+    result = {
+        "file": path,
+        "success": False,
+        "paths": {},
+        "nodes_explored": 0,
+        "elapsed": 0.0,
+        "order_name": None,
+        "engine": engine,
+        "cache_hit": False,
+        "resumed": False,
+        "checkpoint": None,
+        "error": None,
+    }
+    start_time = time.perf_counter()
+    try:
+        board = load_board(path)
+        checkpoint = None if checkpoint_dir is None else checkpoint_file(checkpoint_dir, path)
+        solver = NumberLinkSolver(time_limit=time_limit, require_all_cells=require_all_cells,
+                                  engine=engine, orders=orders, cancel_token=cancel_token,
+                                  solution_cache=cache_path, checkpoint_path=checkpoint)
+        try:
+            if checkpoint is not None and os.path.exists(checkpoint):
+                result["resumed"] = True
+                success, paths = solver.resume(checkpoint)
+            else:
+                success, paths = solver.resolver_tablero(board)
+        finally:
+            if solver.solution_cache is not None:
+                solver.solution_cache.close()
+        stats = solver.get_statistics()
+        result["success"] = success
+        result["paths"] = {
+            str(number): [list(cell) for cell in cells]
+            for number, cells in paths_by_number(board, paths).items()
+        }
+        result["nodes_explored"] = stats["nodes_explored"]
+        result["order_name"] = stats["order_name"]
+        result["cache_hit"] = stats["cache_hit"]
+        if solver.search_state is not None:
+            result["checkpoint"] = checkpoint
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["elapsed"] = time.perf_counter() - start_time
+    return result
+
+
+def iter_batch(files, workers=None, cancel_token=None, **solve_options):
+    """
+    Resuelve los archivos en paralelo y genera cada resultado en cuanto termina
+
+    Args:
+        files: Lista de rutas de tableros
+        workers: Número de procesos; None = os.cpu_count(), 1 = sin pool
+        cancel_token: CancellationToken opcional. Al activarlo se dejan de
+            lanzar tableros; sin pool también se aborta el tablero en curso
+        **solve_options: Argumentos de ``solve_file`` (time_limit, ...)
+
+    Yields:
+        dict: Resultado de ``solve_file`` (el orden es el de finalización)
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        for path in files:
+            if cancel_token is not None and cancel_token.is_cancelled():
+                return
+            yield solve_file(path, cancel_token=cancel_token, **solve_options)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(solve_file, path, **solve_options) for path in files]
+        for future in as_completed(futures):
+            if cancel_token is not None and cancel_token.is_cancelled():
+                for pending in futures:
+                    pending.cancel()
+                return
+            yield future.result()
@@ -0,0 +1,197 @@
+"""
+Benchmark reproducible del solver por tamaño de tablero y densidad de pares
+
+Genera un corpus con semilla fija usando el método constructivo de
+BoardGenerator (todos los tableros tienen solución), ejecuta cada
+configuración del solver varias veces y escribe resultados en JSON. Si se
+indica una línea base, las configuraciones cuya mediana empeore más de la
+tolerancia se reportan como regresiones.
+"""
+
+import json
+import math
+import platform
+import statistics
+import time
+import tracemalloc
+
+from board_generator import BoardGenerator
+from solver import NumberLinkSolver
+
+# Configuraciones de solver disponibles: nombre -> argumentos de NumberLinkSolver
+SOLVER_CONFIGS = {
+    "exhaustivo": {"engine": "exhaustivo"},
+    "dinamico": {"engine": "exhaustivo", "orders": ["dinamico"]},
+    "bitboard": {"engine": "bitboard"},
+}
+
+DEFAULT_SIZES = (5, 7, 10, 15, 20)
+DEFAULT_DENSITIES = (0.08, 0.15)
+
+
+def generate_corpus(sizes, densities, per_config, seed=0):
+    """
+    Genera el corpus de tableros del benchmark
+
+    Args:
+        sizes: Lados de tablero a cubrir
+        densities: Pares por celda (num_pares = densidad * lado^2, mínimo 2)
+        per_config: Tableros por combinación tamaño/densidad
+        seed: Semilla global; el mismo valor produce el mismo corpus
+
+    Returns:
+        list: Tuplas (size, density, board)
+    """
+    corpus = []
+    for size in sizes:
+        for density in densities:
+            num_pairs = max(2, round(size * size * density))
+            generator = BoardGenerator(size, num_pairs, seed=f"{seed}-{size}-{density}")
+            for _ in range(per_config):
+                board = generator.generate_constructive_board()
+                if board is not None:
+                    corpus.append((size, density, board))
+    return corpus
+
+
+def _percentile(values, fraction):
+    """Percentil por rango más cercano de una lista no vacía"""
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def _peak_memory(solver, board):
+    """Pico de memoria (bytes) asignada por Python durante una resolución"""
+    tracemalloc.start()
+    try:
+        solver.resolver_tablero(board)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run_benchmark(corpus, configs, require_modes=(False, True), repeat=3, time_limit=10):
+    """
+    Ejecuta cada configuración sobre el corpus
+
+    Los tiempos se miden sin tracemalloc; el pico de memoria se obtiene en una
+    pasada adicional para no distorsionar las mediciones.
+
+    Returns:
+        list: Un dict por (config, require_all_cells, size, density) con
+        median_time, p95_time, mean_nodes, nodes_per_sec, peak_memory_kb,
+        solved y boards
+    """
+    groups = {}
+    for size, density, board in corpus:
+        groups.setdefault((size, density), []).append(board)
+
+    results = []
+    for config_name in configs:
+        options = SOLVER_CONFIGS[config_name]
+        for require_all_cells in require_modes:
+            for (size, density), boards in sorted(groups.items()):
+                times = []
+                nodes = []
+                peaks = []
+                solved = 0
+                for board in boards:
+                    for run in range(repeat):
+                        solver = NumberLinkSolver(time_limit=time_limit,
+                                                  require_all_cells=require_all_cells,
+                                                  **options)
+                        start = time.perf_counter()
+                        success, _ = solver.resolver_tablero(board)
+                        times.append(time.perf_counter() - start)
+                        nodes.append(solver.nodes_explored)
+                        if run == 0 and success:
+                            solved += 1
+                    solver = NumberLinkSolver(time_limit=time_limit,
+                                              require_all_cells=require_all_cells, **options)
+                    peaks.append(_peak_memory(solver, board))
+
+                total_time = sum(times)
+                results.append({
+                    "config": config_name,
+                    "require_all_cells": require_all_cells,
+                    "size": size,
+                    "density": density,
+                    "boards": len(boards),
+                    "solved": solved,
+                    "median_time": statistics.median(times),
+                    "p95_time": _percentile(times, 0.95),
+                    "mean_nodes": statistics.mean(nodes),
+                    "nodes_per_sec": sum(nodes) / total_time if total_time > 0 else 0.0,
+                    "peak_memory_kb": max(peaks) / 1024,
+                })
+    return results
+
+
+def _result_key(result):
+    return (result["config"], result["require_all_cells"], result["size"], result["density"])
+
+
+def compare_to_baseline(results, baseline, tolerance=0.25, min_delta=0.005):
+    """
+    Compara los resultados con una línea base
+
+    Una entrada es regresión si su mediana supera la de la línea base en más
+    de ``tolerance`` (fracción) y en más de ``min_delta`` segundos (para
+    ignorar ruido en tiempos muy pequeños), o si resuelve menos tableros.
+
+    Returns:
+        list: Descripciones de las regresiones encontradas
+    """
+    reference = {_result_key(entry): entry for entry in baseline.get("results", [])}
+    regressions = []
+    for result in results:
+        base = reference.get(_result_key(result))
+        if base is None:
+            continue
+        name = "{} all_cells={} {}x{} densidad={}".format(
+            result["config"], result["require_all_cells"],
+            result["size"], result["size"], result["density"],
+        )
+        slower = result["median_time"] - base["median_time"]
+        if slower > min_delta and result["median_time"] > base["median_time"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: mediana {result['median_time']:.4f}s vs {base['median_time']:.4f}s"
+            )
+        if result["solved"] < base["solved"]:
+            regressions.append(f"{name}: resueltos {result['solved']} vs {base['solved']}")
+    return regressions
+
+
+def benchmark_report(sizes=DEFAULT_SIZES, densities=DEFAULT_DENSITIES, per_config=3,
+                     repeat=3, seed=0, time_limit=10, configs=("exhaustivo", "bitboard"),
+                     require_modes=(False, True)):
+    """Genera el corpus, ejecuta el benchmark y devuelve el informe completo"""
+    corpus = generate_corpus(sizes, densities, per_config, seed=seed)
+    return {
+        "meta": {
+            "seed": seed,
+            "sizes": list(sizes),
+            "densities": list(densities),
+            "per_config": per_config,
+            "repeat": repeat,
+            "time_limit": time_limit,
+            "configs": list(configs),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+        },
+        "results": run_benchmark(corpus, configs, require_modes=require_modes,
+                                 repeat=repeat, time_limit=time_limit),
+    }
+
+
+def load_report(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_report(report, path):
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
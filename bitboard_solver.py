@@ -0,0 +1,377 @@
+"""
+Motor alternativo de NumberLink basado en bitboards (enteros de Python)
+
+Cada celda es un bit ``r * cols + c``. El conjunto de celdas libres es un
+entero y los vecinos de un conjunto se obtienen con desplazamientos y
+máscaras, de modo que el flood-fill de alcanzabilidad opera sobre todo el
+tablero a la vez. Cada camino crece celda a celda desde sus dos extremos
+("cabezas") hasta que se tocan, aplicando propagación unitaria: si una
+cabeza tiene un único movimiento posible se aplica sin ramificar.
+"""
+
+from deadline import Deadline
+
+
+class SearchTimeout(Exception):
+    """Se alcanzó el tiempo límite o se canceló la búsqueda"""
+
+
+class BitGrid:
+    """
+    Operaciones de conjuntos de celdas sobre un tablero rows x cols
+
+    Las máscaras se precalculan una vez por tamaño; usar ``BitGrid.for_size``
+    para compartir la instancia.
+    """
+
+    _cache = {}
+
+    def __init__(self, rows, cols):
+        self.rows = rows
+        self.cols = cols
+        self.full = (1 << (rows * cols)) - 1
+        first_col = 0
+        last_col = 0
+        for r in range(rows):
+            first_col |= 1 << (r * cols)
+            last_col |= 1 << (r * cols + cols - 1)
+        self.not_first_col = self.full & ~first_col
+        self.not_last_col = self.full & ~last_col
+
+    @classmethod
+    def for_size(cls, rows, cols):
+        grid = cls._cache.get((rows, cols))
+        if grid is None:
+            grid = cls._cache[(rows, cols)] = cls(rows, cols)
+        return grid
+
+    def neighbors(self, mask):
+        """Conjunto de celdas adyacentes a alguna celda de ``mask``"""
+        cols = self.cols
+        return (
+            ((mask & self.not_last_col) << 1)
+            | ((mask & self.not_first_col) >> 1)
+            | (mask << cols)
+            | (mask >> cols)
+        ) & self.full
+
+    def flood(self, seed, allowed):
+        """Componente de ``allowed`` alcanzable desde ``seed`` (seed ⊆ allowed)"""
+        region = seed
+        while True:
+            grown = (region | self.neighbors(region)) & allowed
+            if grown == region:
+                return region
+            region = grown
+
+    def regions(self, mask):
+        """Genera las componentes conexas de ``mask``"""
+        while mask:
+            region = self.flood(mask & -mask, mask)
+            mask &= ~region
+            yield region
+
+    def neighbor_counts(self, mask):
+        """
+        Devuelve (al_menos_2, al_menos_3): celdas con al menos dos / tres
+        vecinos ortogonales dentro de ``mask``
+        """
+        cols = self.cols
+        full = self.full
+        right = (mask >> 1) & self.not_last_col
+        left = (mask << 1) & self.not_first_col & full
+        down = mask >> cols
+        up = (mask << cols) & full
+        at_least_two = (
+            (right & (left | down | up))
+            | (left & (down | up))
+            | (down & up)
+        )
+        at_least_three = (
+            (right & left & (down | up))
+            | (down & up & (right | left))
+        )
+        return at_least_two, at_least_three
+
+
+class BitboardEngine:
+    """Búsqueda celda a celda con propagación y podas sobre bitboards"""
+
+    def __init__(self, board, pairs, require_all_cells=False, time_limit=None,
+                 deadline=None):
+        """
+        Args:
+            board: Tablero (Board) en su estado inicial
+            pairs: Lista de tuplas ((r1,c1), (r2,c2), numero) a conectar
+            require_all_cells: Si True, la solución debe cubrir todas las celdas
+            time_limit: Segundos máximos de búsqueda; None = sin límite
+            deadline: Deadline compartido (con su aviso de cancelación); si se
+                indica, sustituye a ``time_limit``
+        """
+        self.rows = board.rows
+        self.cols = board.cols
+        self.pairs = list(pairs)
+        self.require_all_cells = require_all_cells
+        self.deadline = Deadline(time_limit) if deadline is None else deadline
+        self.nodes_explored = 0
+
+        cols = self.cols
+        self.grid = BitGrid.for_size(self.rows, cols)
+        self._neighbors = self.grid.neighbors
+
+        self.free = board.empty_mask
+        # Cabezas actuales de cada color: [extremo_inicial, extremo_final]
+        self.ends = [
+            [start[0] * cols + start[1], end[0] * cols + end[1]]
+            for start, end, _ in self.pairs
+        ]
+        # Celdas recorridas desde cada extremo, en orden
+        self.paths = [[[a], [b]] for a, b in self.ends]
+        # Celdas de cada color sin contar las cabezas actuales
+        self.trails = [0] * len(self.pairs)
+        self.done = [a == b for a, b in self.ends]
+
+    def _pending_ends(self):
+        """Bitboard con las cabezas de todos los colores sin terminar"""
+        mask = 0
+        for k, (a, b) in enumerate(self.ends):
+            if not self.done[k]:
+                mask |= (1 << a) | (1 << b)
+        return mask
+
+    # ------------------------------------------------------------------------- #
+    # PODA
+    # ------------------------------------------------------------------------- #
+    def _is_feasible(self):
+        """
+        Comprueba que las dos cabezas de cada color pendiente sigan conectadas
+        por celdas libres y, si se exige cubrir el tablero, que ninguna región
+        libre quede sin un color que pueda recorrerla.
+        """
+        free = self.free
+        pending = [k for k in range(len(self.pairs)) if not self.done[k]]
+
+        # Etiquetado de regiones libres: cada color pendiente necesita una
+        # región que toque sus dos cabezas (o que las cabezas sean vecinas)
+        routed = [False] * len(self.pairs)
+        for k in pending:
+            a, b = self.ends[k]
+            if self._neighbors(1 << a) >> b & 1:
+                routed[k] = True
+
+        for region in self.grid.regions(free):
+            border = self._neighbors(region)
+            served = False
+            for k in pending:
+                a, b = self.ends[k]
+                if border >> a & 1 and border >> b & 1:
+                    routed[k] = True
+                    served = True
+            if self.require_all_cells and not served:
+                return False
+
+        for k in pending:
+            if not routed[k]:
+                return False
+        return True
+
+    # ------------------------------------------------------------------------- #
+    # MOVIMIENTOS
+    # ------------------------------------------------------------------------- #
+    def _moves(self, k, j):
+        """
+        Celdas a las que puede avanzar la cabeza j del color k
+
+        Si no hay que cubrir el tablero, se descartan las celdas vecinas del
+        propio camino: ese camino admite un atajo que solo libera celdas, y la
+        rama que toma el atajo ya se explora por separado.
+        """
+        head_nbrs = self._neighbors(1 << self.ends[k][j])
+        moves = head_nbrs & self.free
+        if not self.require_all_cells:
+            moves &= ~self._neighbors(self.trails[k])
+        return moves | (head_nbrs & (1 << self.ends[k][1 - j]))
+
+    def _apply(self, k, j, cell):
+        """Avanza la cabeza j del color k a ``cell``; devuelve lo necesario para deshacer"""
+        undo = (k, j, self.ends[k][j], self.free, self.trails[k], self.done[k])
+        if cell == self.ends[k][1 - j]:
+            # Las dos cabezas se unen: el camino está completo
+            self.done[k] = True
+        else:
+            self.paths[k][j].append(cell)
+            self.trails[k] |= 1 << self.ends[k][j]
+            self.free &= ~(1 << cell)
+            self.ends[k][j] = cell
+        return undo
+
+    def _undo(self, undo):
+        k, j, head, free, trail, done = undo
+        if self.ends[k][j] != head:
+            self.paths[k][j].pop()
+        self.ends[k][j] = head
+        self.free = free
+        self.trails[k] = trail
+        self.done[k] = done
+
+    def _forced_move(self):
+        """
+        Busca un movimiento forzado. Devuelve ``(k, j, celda)``, None si no hay
+        ninguno, o False si el estado es contradictorio.
+
+        - Una cabeza con una única salida avanza por ella.
+        - Si hay que cubrir el tablero, una celda libre con menos de dos
+          vecinos utilizables (libres o cabezas) no puede rellenarse, y una con
+          exactamente dos, uno de ellos una cabeza, es el siguiente paso de esa
+          cabeza.
+        """
+        for k in range(len(self.pairs)):
+            if self.done[k]:
+                continue
+            for j in (0, 1):
+                moves = self._moves(k, j)
+                if not moves:
+                    return False
+                if moves & (moves - 1) == 0:
+                    return k, j, moves.bit_length() - 1
+
+        if self.require_all_cells and self.free:
+            at_least_two, at_least_three = self.grid.neighbor_counts(
+                self.free | self._pending_ends()
+            )
+            if self.free & ~at_least_two:
+                return False
+            corridors = self.free & ~at_least_three
+            if corridors:
+                for k in range(len(self.pairs)):
+                    if self.done[k]:
+                        continue
+                    for j in (0, 1):
+                        forced = self._neighbors(1 << self.ends[k][j]) & corridors
+                        if forced:
+                            return k, j, (forced & -forced).bit_length() - 1
+        return None
+
+    def _propagate(self, trail):
+        """Aplica movimientos forzados hasta un punto fijo; False si hay contradicción"""
+        while True:
+            forced = self._forced_move()
+            if forced is None:
+                return True
+            if forced is False:
+                return False
+            trail.append(self._apply(*forced))
+
+    def _ordered_moves(self, k, j, moves):
+        """
+        Primero la unión con la otra cabeza. Si hay que cubrir el tablero,
+        después las celdas con menos salidas libres (Warnsdorff); si no, las
+        más cercanas a la otra cabeza.
+        """
+        cols = self.cols
+        other = self.ends[k][1 - j]
+        other_r, other_c = divmod(other, cols)
+        options = []
+        while moves:
+            low = moves & -moves
+            moves ^= low
+            cell = low.bit_length() - 1
+            if cell == other:
+                options.append((-1, cell))
+            elif self.require_all_cells:
+                exits = bin(self._neighbors(low) & self.free).count("1")
+                options.append((exits, cell))
+            else:
+                r, c = divmod(cell, cols)
+                options.append((abs(r - other_r) + abs(c - other_c), cell))
+        options.sort()
+        return [cell for _, cell in options]
+
+    def _most_constrained(self):
+        """MRV: la cabeza pendiente con menos movimientos disponibles"""
+        best = None
+        best_moves = 0
+        best_key = None
+        cols = self.cols
+        for k in range(len(self.pairs)):
+            if self.done[k]:
+                continue
+            a, b = self.ends[k]
+            gap = abs(a // cols - b // cols) + abs(a % cols - b % cols)
+            for j in (0, 1):
+                moves = self._moves(k, j)
+                key = (bin(moves).count("1"), gap)
+                if best_key is None or key < best_key:
+                    best, best_moves, best_key = (k, j), moves, key
+        return best, best_moves
+
+    # ------------------------------------------------------------------------- #
+    # BÚSQUEDA
+    # ------------------------------------------------------------------------- #
+    def _search(self):
+        """
+        Búsqueda en profundidad con pila explícita
+
+        Cada nivel avanza una cabeza una celda, así que la profundidad crece
+        con el área del tablero; la recursión agotaría la pila de Python.
+        Cada marco guarda ``[propagación, k, j, celdas restantes, movimiento
+        en curso]``.
+        """
+        stack = []
+        while True:
+            # Entrar en un nodo: propagar, podar y, si sigue abierto, apilarlo
+            self.nodes_explored += 1
+            if self.deadline.tick():
+                raise SearchTimeout()
+
+            trail = []
+            frame = None
+            if self._propagate(trail) and self._is_feasible():
+                if all(self.done):
+                    if not (self.require_all_cells and self.free):
+                        return True
+                else:
+                    (k, j), moves = self._most_constrained()
+                    frame = [trail, k, j, iter(self._ordered_moves(k, j, moves)), None]
+            if frame is None:
+                for undo in reversed(trail):
+                    self._undo(undo)
+            else:
+                stack.append(frame)
+
+            # Siguiente movimiento del nivel más profundo que aún tenga alternativas
+            while stack:
+                frame = stack[-1]
+                trail, k, j, cells, undo = frame
+                if undo is not None:
+                    self._undo(undo)
+                cell = next(cells, None)
+                if cell is not None:
+                    frame[4] = self._apply(k, j, cell)
+                    break
+                stack.pop()
+                for undo in reversed(trail):
+                    self._undo(undo)
+            else:
+                return False
+
+    def solve(self):
+        """
+        Ejecuta la búsqueda
+
+        Returns:
+            list | None: Caminos (listas de (r, c)) en el orden de ``pairs``,
+            o None si no hay solución o se agotó el tiempo
+        """
+        try:
+            found = self._search()
+        except SearchTimeout:
+            return None
+        if not found:
+            return None
+        cols = self.cols
+        result = []
+        for forward, backward in self.paths:
+            cells = forward + backward[::-1] if forward[0] != backward[0] else forward
+            result.append([(idx // cols, idx % cols) for idx in cells])
+        return result
@@ -1,128 +1,332 @@
-import copy
+from array import array
+from zobrist import cell_keys, mix64, number_key
+
+# Tablas de vecinos precalculadas por dimensiones (rows, cols). Se comparten
+# entre todos los tableros del mismo tamaño porque son de solo lectura.
+_NEIGHBOR_CACHE = {}
+
+
+def _neighbor_tables(rows, cols):
+    """
+    Devuelve (vecinos_por_indice, vecinos_por_coordenada) para un tablero rows x cols
+
+    vecinos_por_indice[i] es una tupla de índices planos adyacentes a la celda i,
+    y vecinos_por_coordenada[i] la misma lista expresada como tuplas (r, c).
+    """
+    key = (rows, cols)
+    tables = _NEIGHBOR_CACHE.get(key)
+    if tables is None:
+        by_index = []
+        by_coord = []
+        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # arriba, abajo, izq, der
+        for r in range(rows):
+            for c in range(cols):
+                idx_list = []
+                coord_list = []
+                for dr, dc in directions:
+                    new_r, new_c = r + dr, c + dc
+                    if 0 <= new_r < rows and 0 <= new_c < cols:
+                        idx_list.append(new_r * cols + new_c)
+                        coord_list.append((new_r, new_c))
+                by_index.append(tuple(idx_list))
+                by_coord.append(tuple(coord_list))
+        tables = (tuple(by_index), tuple(by_coord))
+        _NEIGHBOR_CACHE[key] = tables
+    return tables
+
 
 class Board:
-    """Clase que representa el estado del tablero de NumberLink"""
-    
+    """Clase que representa el estado del tablero de NumberLink
+
+    El estado se guarda en un arreglo plano ``cells`` indexado por
+    ``r * cols + c``. Los cambios hechos con ``push_path`` quedan registrados
+    en una pila (trail) y se deshacen con ``pop_path`` sin copiar el tablero.
+    El número de celdas vacías (``empty_count``) y su bitset (``empty_mask``,
+    bit ``i`` = celda plana ``i``) se mantienen al marcar y desmarcar, igual
+    que un hash Zobrist de 64 bits del estado (``state_hash``).
+    """
+
+    __slots__ = (
+        "rows", "cols", "size", "cells", "original", "number_positions",
+        "neighbors", "coord_neighbors", "empty_count", "empty_mask",
+        "_zobrist", "_hash", "_trail", "_marks",
+    )
+
     # Estados posibles de una celda
     EMPTY = 0
     VISITED = -1
-    
+
     def __init__(self, board_data, number_positions):
         """
         Constructor del tablero
-        
+
         Args:
             board_data: Matriz 2D con los números iniciales
             number_positions: Diccionario {numero: [(r1,c1), (r2,c2)]}
         """
         self.rows = len(board_data)
         self.cols = len(board_data[0]) if board_data else 0
-        self.grid = copy.deepcopy(board_data)
-        self.number_positions = copy.deepcopy(number_positions)
-        self.original_grid = copy.deepcopy(board_data)  # Para referencia
-        
+        self.size = self.rows * self.cols
+        self.cells = array("h", (value for row in board_data for value in row))
+        self.original = array("h", self.cells)  # Para referencia
+        self.number_positions = {
+            number: list(positions) for number, positions in number_positions.items()
+        }
+        self.neighbors, self.coord_neighbors = _neighbor_tables(self.rows, self.cols)
+        self.empty_count = 0
+        self.empty_mask = 0
+        for idx, value in enumerate(self.cells):
+            if value == self.EMPTY:
+                self.empty_count += 1
+                self.empty_mask |= 1 << idx
+        self._zobrist = cell_keys(self.size)
+        self._hash = 0     # XOR de las claves de las celdas que difieren del original
+        self._trail = []   # Pila de (índice, valor_anterior)
+        self._marks = []   # (longitud del trail, clave de etiqueta) por camino marcado
+
     def copy(self):
-        """Crea una copia profunda del tablero"""
+        """Crea una copia independiente del tablero (sin historial de deshacer)"""
         new_board = Board.__new__(Board)
         new_board.rows = self.rows
         new_board.cols = self.cols
-        new_board.grid = copy.deepcopy(self.grid)
-        new_board.number_positions = copy.deepcopy(self.number_positions)
-        new_board.original_grid = copy.deepcopy(self.original_grid)
+        new_board.size = self.size
+        new_board.cells = array("h", self.cells)
+        new_board.original = self.original  # Nunca se modifica: se comparte
+        new_board.number_positions = {
+            number: list(positions) for number, positions in self.number_positions.items()
+        }
+        new_board.neighbors = self.neighbors
+        new_board.coord_neighbors = self.coord_neighbors
+        new_board.empty_count = self.empty_count
+        new_board.empty_mask = self.empty_mask
+        new_board._zobrist = self._zobrist
+        new_board._hash = self._hash
+        new_board._trail = []
+        new_board._marks = []
         return new_board
-    
+
+    # ------------------------------------------------------------------------- #
+    # ACCESO A CELDAS
+    # ------------------------------------------------------------------------- #
+    def index(self, r, c):
+        """Índice plano de la celda (r, c)"""
+        return r * self.cols + c
+
+    def get_cell(self, r, c):
+        """Valor actual de la celda (r, c)"""
+        return self.cells[r * self.cols + c]
+
+    @property
+    def grid(self):
+        """Vista del estado actual como matriz 2D (copia, solo lectura)"""
+        cols = self.cols
+        return [list(self.cells[r * cols:(r + 1) * cols]) for r in range(self.rows)]
+
+    @property
+    def original_grid(self):
+        """Vista de los números iniciales como matriz 2D (copia, solo lectura)"""
+        cols = self.cols
+        return [list(self.original[r * cols:(r + 1) * cols]) for r in range(self.rows)]
+
     def is_valid_move(self, r, c, number):
         """
         Verifica si es válido moverse a la celda (r,c) para el número dado
-        
+
         Args:
             r: fila
             c: columna
             number: número que se está conectando
-            
+
         Returns:
             bool: True si el movimiento es válido
         """
         # Verificar límites
         if r < 0 or r >= self.rows or c < 0 or c >= self.cols:
             return False
-            
-        cell_value = self.grid[r][c]
-        
+
+        cell_value = self.cells[r * self.cols + c]
+
         # La celda está vacía
         if cell_value == self.EMPTY:
             return True
-            
+
         # La celda ya fue visitada
         if cell_value == self.VISITED:
             return False
-            
+
         # La celda contiene el mismo número que estamos conectando
         if cell_value == number:
             return True
-            
+
         # La celda contiene un número diferente
         return False
-    
+
     def mark_cell(self, r, c, state):
         """
         Marca una celda con un estado específico
-        
+
         Args:
             r: fila
             c: columna
             state: nuevo estado de la celda
         """
-        self.grid[r][c] = state
-        
+        self._set(r * self.cols + c, state)
+
     def unmark_cell(self, r, c):
         """
         Desmarca una celda, restaurando su valor original
-        
+
         Args:
             r: fila
             c: columna
         """
-        self.grid[r][c] = self.original_grid[r][c]
-        
+        idx = r * self.cols + c
+        self._set(idx, self.original[idx])
+
+    def _set(self, idx, value):
+        """Escribe una celda manteniendo el contador, el bitset de vacías y el hash"""
+        old = self.cells[idx]
+        original = self.original[idx]
+        if (old != original) != (value != original):
+            self._hash ^= self._zobrist[idx]
+        if old == self.EMPTY and value != self.EMPTY:
+            self.empty_count -= 1
+            self.empty_mask &= ~(1 << idx)
+        elif old != self.EMPTY and value == self.EMPTY:
+            self.empty_count += 1
+            self.empty_mask |= 1 << idx
+        self.cells[idx] = value
+
+    # ------------------------------------------------------------------------- #
+    # MARCADO CON DESHACER (TRAIL)
+    # ------------------------------------------------------------------------- #
+    def push_path(self, path, state=VISITED, label=None):
+        """
+        Marca con ``state`` las celdas vacías de un camino y registra el cambio
+
+        Args:
+            path: Lista de tuplas (r, c)
+            state: valor a escribir en las celdas vacías
+            label: número del par que conecta el camino; si se indica, forma
+                parte del hash del estado (mismas celdas ocupadas por pares
+                distintos dan hashes distintos)
+        """
+        if state == self.EMPTY:
+            self._marks.append((len(self._trail), 0))
+            return
+        cells = self.cells
+        original = self.original
+        keys = self._zobrist
+        cols = self.cols
+        trail = self._trail
+        label_key = 0 if label is None else number_key(label)
+        self._marks.append((len(trail), label_key))
+        cleared = 0
+        delta = label_key
+        for r, c in path:
+            idx = r * cols + c
+            old = cells[idx]
+            if old == self.EMPTY:
+                trail.append((idx, old))
+                cells[idx] = state
+                cleared |= 1 << idx
+                if (old != original[idx]) != (state != original[idx]):
+                    delta ^= keys[idx]
+        self._hash ^= delta
+        if cleared:
+            self.empty_count -= bin(cleared).count("1")
+            self.empty_mask &= ~cleared
+
+    def push_values(self, changes, label=None):
+        """
+        Escribe valores arbitrarios (también sobre extremos) con deshacer
+
+        A diferencia de ``push_path`` no se limita a celdas vacías: sirve para
+        mover la cabeza de un camino (la celda anterior pasa a VISITED y la
+        nueva toma el número). Se deshace con ``pop_path``.
+
+        Args:
+            changes: Lista de tuplas (r, c, valor)
+            label: número asociado al cambio (entra en el hash del estado)
+        """
+        trail = self._trail
+        cells = self.cells
+        cols = self.cols
+        label_key = 0 if label is None else number_key(label)
+        self._marks.append((len(trail), label_key))
+        for r, c, value in changes:
+            idx = r * cols + c
+            trail.append((idx, cells[idx]))
+            self._set(idx, value)
+        self._hash ^= label_key
+
+    def pop_path(self):
+        """Deshace el último ``push_path`` restaurando las celdas modificadas"""
+        trail = self._trail
+        mark, label_key = self._marks.pop()
+        while len(trail) > mark:
+            idx, old = trail.pop()
+            self._set(idx, old)
+        self._hash ^= label_key
+
+    def trail_depth(self):
+        """Número de caminos marcados pendientes de deshacer"""
+        return len(self._marks)
+
+    # ------------------------------------------------------------------------- #
+    # HASHING
+    # ------------------------------------------------------------------------- #
+    def state_hash(self):
+        """
+        Hash Zobrist de 64 bits del estado actual
+
+        Combina las celdas cuyo valor difiere del tablero inicial y las
+        etiquetas de los caminos marcados con ``push_path``. Se mantiene de
+        forma incremental, así que consultarlo es O(1).
+        """
+        return self._hash
+
+    def puzzle_hash(self):
+        """
+        Hash de 64 bits de la definición del puzzle (dimensiones y extremos)
+
+        No depende del orden de ``number_positions`` ni del estado actual.
+        """
+        keys = self._zobrist
+        cols = self.cols
+        result = mix64((self.rows << 32) | self.cols)
+        for number, positions in self.number_positions.items():
+            label = number_key(number)
+            for r, c in positions:
+                result ^= mix64(keys[r * cols + c] ^ label)
+        return result
+
     def get_neighbors(self, r, c):
         """
         Obtiene las celdas adyacentes (arriba, abajo, izquierda, derecha)
-        
+
         Args:
             r: fila
             c: columna
-            
+
         Returns:
             list: Lista de tuplas (r, c) de celdas adyacentes válidas
         """
-        neighbors = []
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # arriba, abajo, izq, der
-        
-        for dr, dc in directions:
-            new_r, new_c = r + dr, c + dc
-            if 0 <= new_r < self.rows and 0 <= new_c < self.cols:
-                neighbors.append((new_r, new_c))
-                
-        return neighbors
-    
+        return list(self.coord_neighbors[r * self.cols + c])
+
     def is_complete(self):
         """
         Verifica si el tablero está completamente resuelto
-        
+
         Returns:
             bool: True si todas las celdas están ocupadas
         """
-        for r in range(self.rows):
-            for c in range(self.cols):
-                if self.grid[r][c] == self.EMPTY:
-                    return False
-        return True
-    
+        return self.empty_count == 0
+
     def get_pairs(self):
         """
         Obtiene la lista de pares de posiciones a conectar
-        
+
         Returns:
             list: Lista de tuplas ((r1,c1), (r2,c2), numero)
         """
@@ -131,14 +335,14 @@ class Board:
             if len(positions) == 2:
                 pairs.append((positions[0], positions[1], number))
         return pairs
-    
+
     def __str__(self):
         """Representación en string del tablero para debugging"""
         result = []
+        cols = self.cols
         for r in range(self.rows):
             row = []
-            for c in range(self.cols):
-                val = self.grid[r][c]
+            for val in self.cells[r * cols:(r + 1) * cols]:
                 if val == self.EMPTY:
                     row.append('.')
                 elif val == self.VISITED:
@@ -146,4 +350,4 @@ class Board:
                 else:
                     row.append(str(val))
             result.append(' '.join(row))
-        return '\n'.join(result)
\ No newline at end of file
+        return '\n'.join(result)
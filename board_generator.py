@@ -1,5 +1,14 @@
 """
 Generador de tableros aleatorios para NumberLink
+
+Hay dos métodos:
+
+- "aleatorio" (por defecto): coloca los extremos al azar y descarta las
+  colocaciones que el solver no resuelve en pocos segundos.
+- "constructivo": recubre la cuadrícula con un camino hamiltoniano
+  aleatorio, lo corta en segmentos y pone los extremos de cada segmento como
+  par. El tablero es resoluble por construcción (incluso cubriendo todas las
+  celdas) y no hace falta llamar al solver.
 """
 
 import random
@@ -9,9 +18,38 @@ from solver import NumberLinkSolver
 class BoardGenerator:
     """Genera tableros aleatorios válidos para NumberLink"""
     
-    def __init__(self, size, num_pairs):
+    METHODS = ("aleatorio", "constructivo")
+
+    # Longitud mínima (en celdas) de cada camino del método constructivo:
+    # con 3 celdas los extremos nunca son vecinos a lo largo del camino
+    MIN_PATH_LEN = 3
+
+    # Dificultad -> (pares respecto a num_pairs, dispersión de longitudes).
+    # Con dispersión 0 todos los caminos miden casi lo mismo; con 1 las
+    # longitudes son una composición aleatoria (caminos largos y enrevesados
+    # junto a otros cortos)
+    DIFFICULTY = {
+        'easy': (-1, 0.0),
+        'medium': (0, 0.5),
+        'hard': (1, 1.0),
+    }
+
+    def __init__(self, size, num_pairs, seed=None, rng=None, method="aleatorio"):
+        """
+        Args:
+            size: Lado del tablero (size x size)
+            num_pairs: Número de pares a colocar
+            seed: Semilla para obtener tableros reproducibles
+            rng: Generador random.Random a compartir (tiene prioridad sobre seed)
+            method: "aleatorio" o "constructivo" (ver docstring del módulo)
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"Método desconocido: {method!r} (opciones: {', '.join(self.METHODS)})")
         self.size = size
         self.num_pairs = num_pairs
+        self.rng = rng if rng is not None else random.Random(seed)
+        self.method = method
+        self.last_solution = None   # Caminos del último tablero constructivo
     
     def generate_random_board(self, max_attempts=100):
         """
@@ -20,6 +58,9 @@ class BoardGenerator:
         Returns:
             Board: Tablero generado o None si no se pudo generar
         """
+        if self.method == "constructivo":
+            return self.generate_constructive_board()
+
         for attempt in range(max_attempts):
             board = self._create_random_placement()
             if board and self._verify_solvable(board):
@@ -35,7 +76,7 @@ class BoardGenerator:
         
         # Colocar pares de números
         available_cells = [(r, c) for r in range(self.size) for c in range(self.size)]
-        random.shuffle(available_cells)
+        self.rng.shuffle(available_cells)
         
         for num in range(1, self.num_pairs + 1):
             if len(available_cells) < 2:
@@ -52,6 +93,115 @@ class BoardGenerator:
         
         return Board(board_data, number_positions)
     
+    # ------------------------------------------------------------------------- #
+    # MÉTODO CONSTRUCTIVO
+    # ------------------------------------------------------------------------- #
+    def generate_constructive_board(self, spread=0.5, num_pairs=None):
+        """
+        Genera un tablero resoluble por construcción
+
+        Args:
+            spread: Dispersión de las longitudes de los caminos (0 a 1)
+            num_pairs: Pares a colocar; por defecto ``self.num_pairs``
+
+        Returns:
+            Board: Tablero generado o None si los pares no caben (cada camino
+            necesita al menos MIN_PATH_LEN celdas). La solución queda en
+            ``self.last_solution``.
+        """
+        num_pairs = self.num_pairs if num_pairs is None else num_pairs
+        cells = self.size * self.size
+        if num_pairs < 1 or num_pairs * self.MIN_PATH_LEN > cells:
+            return None
+
+        walk = self._random_hamiltonian_path()
+        segments = []
+        offset = 0
+        for length in self._split_lengths(cells, num_pairs, spread):
+            segments.append(walk[offset:offset + length])
+            offset += length
+        # Los números no deben delatar el orden de los segmentos en el recorrido
+        self.rng.shuffle(segments)
+
+        board_data = [[0 for _ in range(self.size)] for _ in range(self.size)]
+        number_positions = {}
+        for num, segment in enumerate(segments, 1):
+            ends = [segment[0], segment[-1]]
+            for r, c in ends:
+                board_data[r][c] = num
+            number_positions[num] = ends
+
+        self.last_solution = segments
+        return Board(board_data, number_positions)
+
+    def _random_hamiltonian_path(self, moves_per_cell=10):
+        """
+        Camino hamiltoniano aleatorio de la cuadrícula
+
+        Parte de un recorrido en serpiente y aplica movimientos "backbite":
+        se elige un extremo y un vecino suyo en la cuadrícula, se une el extremo
+        a ese vecino y se invierte el tramo que queda suelto. Cada movimiento
+        conserva un camino hamiltoniano.
+
+        Returns:
+            list: Celdas (r, c) en orden de recorrido
+        """
+        n = self.size
+        rng = self.rng
+        path = []
+        for r in range(n):
+            row = [(r, c) for c in range(n)]
+            path.extend(row if r % 2 == 0 else reversed(row))
+        if len(path) < 2:
+            return path
+
+        position = {cell: i for i, cell in enumerate(path)}
+        last = len(path) - 1
+        for _ in range(moves_per_cell * len(path)):
+            at_head = rng.random() < 0.5
+            r, c = path[0] if at_head else path[last]
+            options = [
+                (nr, nc)
+                for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1))
+                if 0 <= nr < n and 0 <= nc < n
+            ]
+            i = position[rng.choice(options)]
+            if at_head:
+                if i == 1:
+                    continue
+                # path[0] pasa a ser vecino de path[i]: se invierte path[0:i]
+                path[:i] = path[i - 1::-1]
+                changed = range(i)
+            else:
+                if i == last - 1:
+                    continue
+                path[i + 1:] = path[:i:-1]
+                changed = range(i + 1, len(path))
+            for j in changed:
+                position[path[j]] = j
+        return path
+
+    def _split_lengths(self, total, count, spread):
+        """
+        Reparte ``total`` celdas en ``count`` longitudes >= MIN_PATH_LEN
+
+        ``spread`` mezcla un reparto equitativo (0) con una composición
+        aleatoria uniforme (1).
+        """
+        rng = self.rng
+        extra = total - count * self.MIN_PATH_LEN
+        cuts = sorted(rng.sample(range(extra + count - 1), count - 1))
+        random_parts = [b - a - 1 for a, b in zip([-1] + cuts, cuts + [extra + count - 1])]
+
+        parts = [
+            int((1 - spread) * extra / count + spread * part)
+            for part in random_parts
+        ]
+        # Las celdas perdidas al redondear se reparten al azar
+        for _ in range(extra - sum(parts)):
+            parts[rng.randrange(count)] += 1
+        return [self.MIN_PATH_LEN + part for part in parts]
+
     def _verify_solvable(self, board):
         """Verifica si el tablero tiene solución"""
         solver = NumberLinkSolver(time_limit=5)  # Límite corto para verificación
@@ -69,26 +219,38 @@ class BoardGenerator:
             Board: Tablero generado
         """
         # Ajustar parámetros según dificultad
-        if difficulty == 'easy':
+        delta, spread = self.DIFFICULTY.get(difficulty, self.DIFFICULTY['medium'])
+        if delta < 0:
             # Menos pares, más espacio
-            actual_pairs = max(2, self.num_pairs - 1)
-        elif difficulty == 'hard':
+            actual_pairs = max(2, self.num_pairs + delta)
+        elif delta > 0:
             # Más pares, menos espacio
-            actual_pairs = min(self.num_pairs + 1, (self.size * self.size) // 4)
+            actual_pairs = min(self.num_pairs + delta, (self.size * self.size) // 4)
         else:
             actual_pairs = self.num_pairs
         
-        temp_generator = BoardGenerator(self.size, actual_pairs)
+        if self.method == "constructivo":
+            return self.generate_constructive_board(spread=spread, num_pairs=actual_pairs)
+
+        temp_generator = BoardGenerator(self.size, actual_pairs, rng=self.rng, method=self.method)
         return temp_generator.generate_random_board()
     
     def save_to_file(self, board, filename):
         """Guarda el tablero en un archivo"""
         with open(filename, 'w') as f:
-            f.write(f"{board.rows},{board.cols}\n")
-            
-            for number, positions in board.number_positions.items():
-                for r, c in positions:
-                    f.write(f"{r+1},{c+1},{number}\n")
+            f.write(format_board(board))
+
+
+def format_board(board):
+    """
+    Texto del tablero en el formato de archivo (``filas,columnas`` y una
+    línea ``fila,columna,numero`` por extremo, en base 1)
+    """
+    lines = [f"{board.rows},{board.cols}\n"]
+    for number, positions in board.number_positions.items():
+        for r, c in positions:
+            lines.append(f"{r+1},{c+1},{number}\n")
+    return "".join(lines)
 
 def generate_test_boards():
     """Genera varios tableros de prueba"""
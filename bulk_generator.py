@@ -0,0 +1,151 @@
+"""
+Generación masiva de tableros con un pool de procesos
+
+Cada tarea del pool genera un bloque de tableros con su propia semilla y el
+método constructivo de BoardGenerator (sin llamadas al solver). Los
+tableros equivalentes por simetría o renombrado de números (misma forma
+canónica) se descartan y, si se pide, también los que no tienen solución
+única. Los puzzles se escriben por lotes en un único archivo de texto, uno
+tras otro en el formato habitual.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from board_generator import BoardGenerator, format_board
+from solver import NumberLinkSolver
+from symmetry import canonical_hash
+
+
+def generate_chunk(size, num_pairs, difficulty, seed, count, unique=False, time_limit=5):
+    """
+    Genera un bloque de tableros (se ejecuta en un proceso del pool)
+
+    Args:
+        size: Lado del tablero
+        num_pairs: Pares base (la dificultad los ajusta)
+        difficulty: 'easy', 'medium' o 'hard'
+        seed: Semilla del bloque
+        count: Tableros a intentar
+        unique: Si True, se descartan los que no tienen solución única
+            cubriendo todas las celdas
+        time_limit: Segundos por comprobación de unicidad
+
+    Returns:
+        tuple: (lista de (huella_canonica, texto), descartados_por_unicidad)
+    """
+    generator = BoardGenerator(size, num_pairs, seed=seed, method="constructivo")
+    records = []
+    rejected = 0
+    for _ in range(count):
+        board = generator.generate_with_difficulty(difficulty)
+        if board is None:
+            raise ValueError(f"No caben {num_pairs} pares en un tablero {size}x{size}")
+        if unique:
+            solver = NumberLinkSolver(time_limit=time_limit, require_all_cells=True)
+            if not solver.is_unique(board):
+                rejected += 1
+                continue
+        records.append((canonical_hash(board), format_board(board)))
+    return records, rejected
+
+
+def iter_bulk(size, count, difficulty="medium", num_pairs=None, workers=None, seed=0,
+              unique=False, chunk_size=100, time_limit=5, max_attempts=None, stats=None):
+    """
+    Genera hasta ``count`` puzzles distintos
+
+    Los bloques se procesan en orden de envío, así que el resultado solo
+    depende de la semilla y no del número de procesos.
+
+    Args:
+        num_pairs: Pares base; por defecto, ``size``
+        workers: Número de procesos; None = os.cpu_count(), 1 = sin pool
+        chunk_size: Tableros por tarea del pool
+        max_attempts: Tableros a generar como máximo (por defecto 20 * count)
+        stats: Dict opcional donde se acumulan generated, duplicates y
+            not_unique
+
+    Yields:
+        tuple: (huella_canonica, texto) de cada puzzle nuevo
+    """
+    if num_pairs is None:
+        num_pairs = size
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if max_attempts is None:
+        max_attempts = 20 * count
+    if stats is None:
+        stats = {}
+    for name in ("generated", "duplicates", "not_unique"):
+        stats.setdefault(name, 0)
+
+    def chunk_args(index):
+        return (size, num_pairs, difficulty, f"{seed}-{size}-{difficulty}-{index}",
+                chunk_size, unique, time_limit)
+
+    max_chunks = -(-max_attempts // chunk_size)
+    seen = set()
+    produced = 0
+
+    def accept(result):
+        nonlocal produced
+        records, rejected = result
+        stats["generated"] += len(records) + rejected
+        stats["not_unique"] += rejected
+        for key, text in records:
+            if produced >= count:
+                return
+            if key in seen:
+                stats["duplicates"] += 1
+                continue
+            seen.add(key)
+            produced += 1
+            yield key, text
+
+    if workers <= 1:
+        for index in range(max_chunks):
+            if produced >= count:
+                return
+            yield from accept(generate_chunk(*chunk_args(index)))
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        next_index = 0
+        while produced < count:
+            # Se mantienen dos bloques por proceso en vuelo
+            while len(pending) < 2 * workers and next_index < max_chunks:
+                pending.append(pool.submit(generate_chunk, *chunk_args(next_index)))
+                next_index += 1
+            if not pending:
+                break
+            yield from accept(pending.popleft().result())
+        for future in pending:
+            future.cancel()
+
+
+def write_bulk(puzzles, path, batch_size=1000):
+    """
+    Escribe los puzzles en ``path`` por lotes de ``batch_size``
+
+    Args:
+        puzzles: Iterable de (huella, texto) como el de ``iter_bulk``
+
+    Returns:
+        int: Puzzles escritos
+    """
+    written = 0
+    batch = []
+    with open(path, "w") as f:
+        for _, text in puzzles:
+            batch.append(text)
+            if len(batch) >= batch_size:
+                f.writelines(batch)
+                f.flush()
+                written += len(batch)
+                batch = []
+        f.writelines(batch)
+        written += len(batch)
+    return written
@@ -0,0 +1,121 @@
+"""
+Puntos de control de la búsqueda exhaustiva en disco
+
+Formato (little-endian):
+
+    cabecera  : magic "NLCK", versión u16, reservado u16,
+                longitud de los metadatos u32, niveles u32, claves u32
+    metadatos : JSON UTF-8 con el tablero (filas, columnas, pares) y el resto
+                del ``search_state`` (heurística en curso y seleccionadas,
+                opciones del solver, nivel pendiente, hash del puzzle)
+    niveles   : niveles x u16, candidatos consumidos en cada nivel de la pila
+    claves    : claves x u64, tabla de transposición de la menos a la más
+                recientemente usada
+
+Los caminos colocados no se guardan: la enumeración de candidatos es
+determinista, así que se recolocan a partir de la posición de cada nivel.
+El archivo se escribe en uno temporal y se renombra, de modo que un proceso
+interrumpido a mitad de escritura nunca deja un punto de control corrupto.
+"""
+
+import json
+import os
+import signal
+import struct
+from contextlib import contextmanager
+
+from board import Board
+
+MAGIC = b"NLCK"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHHIII")
+
+
+class CheckpointFormatError(ValueError):
+    """El archivo no es un punto de control NLCK válido"""
+
+
+def save_checkpoint(path, board, state):
+    """
+    Escribe un punto de control
+
+    Args:
+        path: Archivo de destino (se reemplaza de forma atómica)
+        board: Tablero que se estaba resolviendo
+        state: ``NumberLinkSolver.search_state`` de la búsqueda cortada
+    """
+    positions = state["positions"]
+    keys = state["transposition"]
+    metadata = {
+        name: value for name, value in state.items()
+        if name not in ("positions", "transposition")
+    }
+    metadata["board"] = {
+        "rows": board.rows,
+        "cols": board.cols,
+        "pairs": [
+            [number, r1, c1, r2, c2]
+            for number, ((r1, c1), (r2, c2)) in board.number_positions.items()
+        ],
+    }
+    encoded = json.dumps(metadata, separators=(",", ":")).encode("utf-8")
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, 0, len(encoded), len(positions), len(keys)))
+        f.write(encoded)
+        f.write(struct.pack("<%dH" % len(positions), *positions))
+        f.write(struct.pack("<%dQ" % len(keys), *keys))
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path):
+    """
+    Lee un punto de control
+
+    Returns:
+        tuple: (tablero, estado) listos para ``resolver_tablero(board,
+        resume_from=estado)`` o ``NumberLinkSolver.resume``
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < _HEADER.size:
+        raise CheckpointFormatError(f"{path}: archivo demasiado corto")
+    magic, version, _, meta_len, levels, num_keys = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise CheckpointFormatError(f"{path}: no es un punto de control NLCK")
+    if version != VERSION:
+        raise CheckpointFormatError(f"{path}: versión {version} no soportada")
+    offset = _HEADER.size
+    if offset + meta_len + 2 * levels + 8 * num_keys != len(data):
+        raise CheckpointFormatError(f"{path}: tamaño inconsistente con la cabecera")
+
+    state = json.loads(data[offset:offset + meta_len].decode("utf-8"))
+    offset += meta_len
+    state["positions"] = list(struct.unpack_from("<%dH" % levels, data, offset))
+    offset += 2 * levels
+    state["transposition"] = list(struct.unpack_from("<%dQ" % num_keys, data, offset))
+
+    spec = state.pop("board")
+    board_data = [[0] * spec["cols"] for _ in range(spec["rows"])]
+    number_positions = {}
+    for number, r1, c1, r2, c2 in spec["pairs"]:
+        board_data[r1][c1] = board_data[r2][c2] = number
+        number_positions[number] = [(r1, c1), (r2, c2)]
+    return Board(board_data, number_positions), state
+
+
+@contextmanager
+def cancel_on_signals(solver, signals=(signal.SIGTERM, signal.SIGINT)):
+    """
+    Mientras dura el bloque, las señales indicadas cancelan la resolución en
+    curso en lugar de terminar el proceso; con ``checkpoint_path`` el solver
+    guarda su punto de control antes de volver. Solo desde el hilo principal.
+    """
+    previous = {sig: signal.signal(sig, lambda *_: solver.cancel()) for sig in signals}
+    try:
+        yield solver
+    finally:
+        for sig, handler in previous.items():
+            signal.signal(sig, handler)
@@ -0,0 +1,112 @@
+"""
+Plazo de búsqueda con reloj monótono y aviso de cancelación cooperativo
+
+El bucle de búsqueda llama a ``Deadline.tick()`` una vez por nodo. El reloj
+(``time.perf_counter``) y el aviso de cancelación solo se consultan cada
+``stride`` nodos; el intervalo se ajusta a la velocidad observada para
+comprobar aproximadamente cada ``TARGET_INTERVAL`` segundos.
+"""
+
+import threading
+import time
+
+
+class CancellationToken:
+    """
+    Aviso de cancelación que otro hilo (o proceso) puede activar
+
+    Por defecto envuelve un ``threading.Event``; para compartirlo entre
+    procesos se le puede pasar un ``multiprocessing.Event``.
+    """
+
+    def __init__(self, event=None):
+        self.event = threading.Event() if event is None else event
+
+    def cancel(self):
+        """Pide que la búsqueda en curso termine cuanto antes"""
+        self.event.set()
+
+    def is_cancelled(self):
+        return self.event.is_set()
+
+
+class Deadline:
+    """Límite de tiempo y cancelación comprobados cada ``stride`` nodos"""
+
+    TARGET_INTERVAL = 0.01   # Segundos deseados entre dos comprobaciones
+    MIN_STRIDE = 1
+    MAX_STRIDE = 8192
+
+    def __init__(self, time_limit=None, token=None, start=None, stride=1, on_sample=None):
+        """
+        Args:
+            time_limit: Segundos disponibles; None = sin límite de tiempo
+            token: CancellationToken a consultar (opcional)
+            start: Instante ``time.perf_counter()`` inicial; por defecto, ahora
+            stride: Nodos entre las primeras comprobaciones
+            on_sample: Función opcional que ``tick()`` llama con el instante
+                de cada lectura del reloj (aprovecha el mismo muestreo para,
+                p. ej., informar del progreso sin coste por nodo)
+        """
+        self.start = time.perf_counter() if start is None else start
+        self.time_limit = time_limit
+        self.limit_at = None if time_limit is None else self.start + time_limit
+        self.token = token
+        self.stride = stride
+        self.reason = None           # "timeout" o "cancelled" al vencer
+        self.on_sample = on_sample
+        self._countdown = stride
+        self._last_sample = self.start
+
+    def tick(self):
+        """
+        Se llama una vez por nodo. Devuelve True si el plazo venció o se
+        canceló la búsqueda; solo mira el reloj cada ``stride`` llamadas.
+        """
+        self._countdown -= 1
+        if self._countdown > 0:
+            return False
+
+        now = time.perf_counter()
+        interval = now - self._last_sample
+        self._last_sample = now
+        # Ajuste del intervalo: duplicar si se comprueba demasiado a menudo,
+        # reducir a la mitad si pasa demasiado tiempo entre comprobaciones
+        if interval < self.TARGET_INTERVAL / 2:
+            self.stride = min(self.stride * 2, self.MAX_STRIDE)
+        elif interval > self.TARGET_INTERVAL * 2:
+            self.stride = max(self.stride // 2, self.MIN_STRIDE)
+        self._countdown = self.stride
+        if self.on_sample is not None:
+            self.on_sample(now)
+        return self._check(now)
+
+    def expired(self):
+        """Comprobación inmediata (fuera del bucle caliente)"""
+        return self._check(time.perf_counter())
+
+    def _check(self, now):
+        if self.reason is None:
+            if self.token is not None and self.token.is_cancelled():
+                self.reason = "cancelled"
+            elif self.limit_at is not None and now >= self.limit_at:
+                self.reason = "timeout"
+        if self.reason is not None:
+            # Una vez vencido, cada llamada a tick() lo informa
+            self._countdown = 0
+            return True
+        return False
+
+    @property
+    def cancelled(self):
+        return self.reason == "cancelled"
+
+    def elapsed(self):
+        """Segundos transcurridos desde el inicio"""
+        return time.perf_counter() - self.start
+
+    def remaining(self):
+        """Segundos restantes (None si no hay límite de tiempo)"""
+        if self.limit_at is None:
+            return None
+        return max(0.0, self.limit_at - time.perf_counter())
@@ -1,23 +1,155 @@
+"""
+Lectura de tableros en formato de texto
+
+Cada puzzle empieza con una línea ``filas,columnas`` seguida de una línea
+``fila,columna,numero`` (base 1) por extremo. Un archivo puede contener
+varios puzzles seguidos: cada línea de dos campos abre uno nuevo.
+"""
+
+from board import Board
+
+# Mayor número de par representable en el arreglo de celdas del tablero
+MAX_NUMBER = 32767
+
+
+class BoardFormatError(ValueError):
+    """Error de formato con el archivo y la línea donde se detectó"""
+
+    def __init__(self, source, line, message):
+        self.source = source
+        self.line = line
+        self.message = message
+        super().__init__(f"{source}:{line}: {message}")
+
+
+def _parse_fields(text, source, line_no):
+    try:
+        return [int(field) for field in text.split(",")]
+    except ValueError:
+        raise BoardFormatError(
+            source, line_no, f"se esperaban enteros separados por comas: {text.strip()!r}"
+        ) from None
+
+
+def _finish(puzzle, source):
+    """Comprueba que cada número aparece exactamente dos veces"""
+    _, _, number_positions, first_line = puzzle
+    for number, positions in number_positions.items():
+        if len(positions) != 2:
+            raise BoardFormatError(
+                source, first_line[number],
+                f"el número {number} aparece una sola vez (cada número necesita dos extremos)",
+            )
+
+
+def iter_puzzles(lines, source="<texto>"):
+    """
+    Analiza puzzles de forma incremental a partir de un iterable de líneas
+
+    Args:
+        lines: Iterable de líneas (un archivo abierto, una lista, ...)
+        source: Nombre usado en los mensajes de error
+
+    Yields:
+        tuple: (board_data, number_positions) de cada puzzle, en el formato
+        de ``load_board_from_file``
+
+    Raises:
+        BoardFormatError: Línea mal formada, coordenadas fuera del tablero,
+            celda repetida o número que no aparece exactamente dos veces
+    """
+    for board_data, number_positions, _ in _iter_puzzles(lines, source):
+        yield board_data, number_positions
+
+
+def _iter_puzzles(lines, source):
+    """Como ``iter_puzzles``, añadiendo la línea de cabecera de cada puzzle"""
+    puzzle = None          # (board_data, dims, number_positions, primera línea por número)
+    occupied = {}          # celda -> línea que la ocupó
+    header_line = None
+    for line_no, text in enumerate(lines, 1):
+        if not text or text.isspace():
+            continue
+        fields = _parse_fields(text, source, line_no)
+
+        if len(fields) == 2:
+            if puzzle is not None:
+                _finish(puzzle, source)
+                yield puzzle[0], puzzle[2], header_line
+            header_line = line_no
+            rows, cols = fields
+            if rows < 1 or cols < 1:
+                raise BoardFormatError(source, line_no, f"dimensiones no válidas: {rows}x{cols}")
+            puzzle = ([[0] * cols for _ in range(rows)], (rows, cols), {}, {})
+            occupied = {}
+            continue
+
+        if len(fields) != 3:
+            raise BoardFormatError(
+                source, line_no,
+                f"se esperaban 2 campos (filas,columnas) o 3 (fila,columna,numero), hay {len(fields)}",
+            )
+        if puzzle is None:
+            raise BoardFormatError(source, line_no, "falta la línea filas,columnas antes de los extremos")
+
+        board_data, (rows, cols), number_positions, first_line = puzzle
+        r, c, number = fields
+        if not (1 <= r <= rows and 1 <= c <= cols):
+            raise BoardFormatError(source, line_no, f"celda ({r},{c}) fuera del tablero {rows}x{cols}")
+        if not 1 <= number <= MAX_NUMBER:
+            raise BoardFormatError(source, line_no, f"número {number} fuera de rango (1..{MAX_NUMBER})")
+        cell = (r - 1, c - 1)
+        if cell in occupied:
+            raise BoardFormatError(
+                source, line_no, f"la celda ({r},{c}) ya está ocupada (línea {occupied[cell]})"
+            )
+        positions = number_positions.setdefault(number, [])
+        if len(positions) == 2:
+            raise BoardFormatError(
+                source, line_no,
+                f"el número {number} aparece más de dos veces (línea {first_line[number]})",
+            )
+
+        # Convertir a índices base 0
+        occupied[cell] = line_no
+        first_line.setdefault(number, line_no)
+        board_data[cell[0]][cell[1]] = number
+        positions.append(cell)
+
+    if puzzle is not None:
+        _finish(puzzle, source)
+        yield puzzle[0], puzzle[2], header_line
+
+
+def iter_boards(path):
+    """
+    Genera los tableros (Board) de un archivo con uno o varios puzzles,
+    leyéndolo línea a línea
+    """
+    with open(path, "r") as f:
+        for board_data, number_positions in iter_puzzles(f, source=path):
+            yield Board(board_data, number_positions)
+
+
 def load_board_from_file(path):
+    """
+    Carga un archivo con un único puzzle
+
+    Returns:
+        tuple: (board_data, number_positions)
+
+    Raises:
+        BoardFormatError: Si el archivo no contiene exactamente un puzzle
+            válido
+    """
     with open(path, "r") as f:
-        lines = [line.strip() for line in f if line.strip()]
-    
-    # Limpiar espacios extra y dividir por comas
-    first_line = lines[0].replace(" ", "").split(",")
-    rows, cols = map(int, first_line)
-    
-    board_data = [[0 for _ in range(cols)] for _ in range(rows)]
-    number_positions = {}
-
-    for line in lines[1:]:
-        # Limpiar espacios extra antes de dividir
-        clean_line = line.replace(" ", "").split(",")
-        r, c, number = map(int, clean_line)
-        
-        # Convertir a índices base 0
-        board_data[r - 1][c - 1] = number
-        if number not in number_positions:
-            number_positions[number] = []
-        number_positions[number].append((r - 1, c - 1))
-    
-    return board_data, number_positions
\ No newline at end of file
+        puzzles = _iter_puzzles(f, path)
+        first = next(puzzles, None)
+        if first is None:
+            raise BoardFormatError(path, 1, "el archivo no contiene ningún tablero")
+        for _, _, header_line in puzzles:
+            raise BoardFormatError(
+                path, header_line, "el archivo contiene varios tableros; usar iter_boards"
+            )
+    board_data, number_positions, _ = first
+    return board_data, number_positions
@@ -0,0 +1,318 @@
+"""
+Interfaz de línea de comandos de NumberLink
+
+Uso:
+    python -m numberlink solve ejemplo*.txt generated_*.txt -j 8 --time-limit 30
+    python -m numberlink solve dificiles/ --time-limit 600 --checkpoint-dir puntos/
+    python -m numberlink bench --sizes 5,7,10 --baseline bench_baseline.json
+    python -m numberlink generate --size 7 --count 10000 --difficulty hard -o corpus.txt
+    python -m numberlink pack generated_*.txt -o corpus.nlpk
+    python -m numberlink unpack corpus.nlpk -o corpus.txt
+    python -m numberlink check tableros/
+    python -m numberlink serve --port 8765 -j 4 --time-limit 30
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import benchmark
+import service
+from batch_solver import expand_inputs, iter_batch
+from bulk_generator import iter_bulk, write_bulk
+from loader import BoardFormatError, iter_boards
+from puzzle_pack import PackFormatError, pack_to_text, text_to_pack
+from solver import NumberLinkSolver
+
+
+def _parse_orders(value):
+    return [name.strip() for name in value.split(",") if name.strip()]
+
+
+def _parse_ints(value):
+    return [int(item) for item in value.split(",") if item.strip()]
+
+
+def _parse_floats(value):
+    return [float(item) for item in value.split(",") if item.strip()]
+
+
+def _parse_configs(value):
+    names = _parse_orders(value)
+    unknown = [name for name in names if name not in benchmark.SOLVER_CONFIGS]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"configuraciones desconocidas: {', '.join(unknown)}")
+    return names
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="numberlink", description="Herramientas de NumberLink")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    solve = commands.add_parser(
+        "solve",
+        help="Resuelve archivos de tableros y emite una línea JSON por resultado",
+    )
+    solve.add_argument("inputs", nargs="+",
+                       help="Archivos, directorios o patrones glob de tableros")
+    solve.add_argument("-j", "--workers", type=int, default=None,
+                       help="Procesos en paralelo (por defecto, uno por CPU)")
+    solve.add_argument("--time-limit", type=float, default=60,
+                       help="Segundos máximos por tablero (por defecto 60)")
+    solve.add_argument("--all-cells", action="store_true",
+                       help="Exigir que la solución cubra todas las celdas")
+    solve.add_argument("--engine", choices=NumberLinkSolver.ENGINES, default="exhaustivo",
+                       help="Motor de búsqueda (bitboard solo se usa con --all-cells; "
+                            "sin cobertura total resuelve el exhaustivo)")
+    solve.add_argument("--orders", type=_parse_orders, default=None,
+                       help="Heurísticas a probar, separadas por comas")
+    solve.add_argument("--cache", default=None,
+                       help="Archivo SQLite de caché de soluciones (se crea si no existe)")
+    solve.add_argument("--checkpoint-dir", default=None,
+                       help="Directorio de puntos de control: los tableros que agotan el "
+                            "tiempo se continúan en la siguiente ejecución")
+    solve.add_argument("-o", "--output", default=None,
+                       help="Archivo de salida JSONL (por defecto, salida estándar)")
+    solve.set_defaults(handler=cmd_solve)
+
+    bench = commands.add_parser(
+        "bench",
+        help="Benchmark reproducible por tamaño y densidad de pares",
+    )
+    bench.add_argument("--sizes", type=_parse_ints, default=list(benchmark.DEFAULT_SIZES),
+                       help="Lados de tablero separados por comas")
+    bench.add_argument("--densities", type=_parse_floats,
+                       default=list(benchmark.DEFAULT_DENSITIES),
+                       help="Pares por celda separados por comas")
+    bench.add_argument("--per-config", type=int, default=3,
+                       help="Tableros por combinación tamaño/densidad")
+    bench.add_argument("--repeat", type=int, default=3,
+                       help="Ejecuciones por tablero y configuración")
+    bench.add_argument("--seed", type=int, default=0, help="Semilla del corpus")
+    bench.add_argument("--time-limit", type=float, default=10,
+                       help="Segundos máximos por resolución")
+    bench.add_argument("--configs", type=_parse_configs, default=["exhaustivo", "bitboard"],
+                       help=f"Configuraciones: {', '.join(benchmark.SOLVER_CONFIGS)}")
+    bench.add_argument("--all-cells", choices=("on", "off", "both"), default="both",
+                       help="Modos de require_all_cells a medir")
+    bench.add_argument("-o", "--output", default=None,
+                       help="Archivo JSON de resultados (por defecto, salida estándar)")
+    bench.add_argument("--baseline", default=None,
+                       help="Archivo JSON de línea base contra el que comparar")
+    bench.add_argument("--tolerance", type=float, default=0.25,
+                       help="Empeoramiento relativo admitido de la mediana (0.25 = 25%%)")
+    bench.set_defaults(handler=cmd_bench)
+
+    generate = commands.add_parser(
+        "generate",
+        help="Genera muchos puzzles distintos (salvo simetría) en un único archivo",
+    )
+    generate.add_argument("--size", type=int, required=True, help="Lado del tablero")
+    generate.add_argument("--count", type=int, required=True, help="Puzzles a generar")
+    generate.add_argument("--difficulty", choices=("easy", "medium", "hard"), default="medium",
+                          help="Dificultad (número de pares y reparto de longitudes)")
+    generate.add_argument("--pairs", type=int, default=None,
+                          help="Pares base (por defecto, el lado del tablero)")
+    generate.add_argument("--unique", action="store_true",
+                          help="Conservar solo puzzles con solución única (todas las celdas)")
+    generate.add_argument("--seed", type=int, default=0, help="Semilla global")
+    generate.add_argument("-j", "--workers", type=int, default=None,
+                          help="Procesos en paralelo (por defecto, uno por CPU)")
+    generate.add_argument("--chunk-size", type=int, default=100,
+                          help="Tableros por tarea del pool")
+    generate.add_argument("--batch-size", type=int, default=1000,
+                          help="Puzzles por escritura en disco")
+    generate.add_argument("--time-limit", type=float, default=5,
+                          help="Segundos por comprobación de unicidad")
+    generate.add_argument("-o", "--output", required=True, help="Archivo de salida")
+    generate.set_defaults(handler=cmd_generate)
+
+    pack = commands.add_parser("pack", help="Empaqueta archivos de texto en un contenedor .nlpk")
+    pack.add_argument("inputs", nargs="+",
+                      help="Archivos, directorios o patrones glob de tableros")
+    pack.add_argument("-o", "--output", required=True, help="Contenedor de salida")
+    pack.set_defaults(handler=cmd_pack)
+
+    unpack = commands.add_parser("unpack", help="Convierte un contenedor .nlpk a texto")
+    unpack.add_argument("input", help="Contenedor .nlpk")
+    unpack.add_argument("-o", "--output", required=True,
+                        help="Archivo de texto con los puzzles concatenados")
+    unpack.set_defaults(handler=cmd_unpack)
+
+    check = commands.add_parser(
+        "check", help="Valida archivos de texto de tableros sin resolverlos",
+    )
+    check.add_argument("inputs", nargs="+",
+                       help="Archivos, directorios o patrones glob de tableros")
+    check.set_defaults(handler=cmd_check)
+
+    serve = commands.add_parser(
+        "serve", help="Servicio local HTTP/JSON de resolución con un pool de procesos",
+    )
+    serve.add_argument("--host", default="127.0.0.1", help="Dirección de escucha")
+    serve.add_argument("--port", type=int, default=service.DEFAULT_PORT,
+                       help=f"Puerto TCP (por defecto {service.DEFAULT_PORT})")
+    serve.add_argument("--unix", default=None,
+                       help="Ruta de un socket Unix (sustituye a --host/--port)")
+    serve.add_argument("-j", "--workers", type=int, default=None,
+                       help="Procesos de resolución (por defecto, uno por CPU)")
+    serve.add_argument("--time-limit", type=float, default=60,
+                       help="Plazo de las peticiones que no indican uno (por defecto 60)")
+    serve.add_argument("--max-time-limit", type=float, default=600,
+                       help="Plazo máximo admitido por petición (por defecto 600)")
+    serve.add_argument("--max-queue", type=int, default=1000,
+                       help="Peticiones en cola antes de responder 503")
+    serve.set_defaults(handler=cmd_serve)
+
+    return parser
+
+
+def cmd_solve(args):
+    files = expand_inputs(args.inputs)
+    if not files:
+        print("No se encontraron archivos de tableros", file=sys.stderr)
+        return 2
+
+    if args.checkpoint_dir:
+        os.makedirs(args.checkpoint_dir, exist_ok=True)
+
+    out = open(args.output, "w") if args.output else sys.stdout
+    failures = 0
+    try:
+        for result in iter_batch(
+            files,
+            workers=args.workers,
+            time_limit=args.time_limit,
+            require_all_cells=args.all_cells,
+            engine=args.engine,
+            orders=args.orders,
+            cache_path=args.cache,
+            checkpoint_dir=args.checkpoint_dir,
+        ):
+            if not result["success"]:
+                failures += 1
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print(f"{len(files) - failures}/{len(files)} tableros resueltos", file=sys.stderr)
+    return 0 if failures == 0 else 1
+
+
+def cmd_bench(args):
+    require_modes = {"on": (True,), "off": (False,), "both": (False, True)}[args.all_cells]
+    report = benchmark.benchmark_report(
+        sizes=args.sizes,
+        densities=args.densities,
+        per_config=args.per_config,
+        repeat=args.repeat,
+        seed=args.seed,
+        time_limit=args.time_limit,
+        configs=args.configs,
+        require_modes=require_modes,
+    )
+
+    if args.output:
+        benchmark.save_report(report, args.output)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.baseline:
+        regressions = benchmark.compare_to_baseline(
+            report["results"], benchmark.load_report(args.baseline), tolerance=args.tolerance
+        )
+        if regressions:
+            print("REGRESIONES DE RENDIMIENTO:", file=sys.stderr)
+            for line in regressions:
+                print(f"  {line}", file=sys.stderr)
+            return 1
+        print("Sin regresiones respecto a la línea base", file=sys.stderr)
+    return 0
+
+
+def cmd_generate(args):
+    stats = {}
+    puzzles = iter_bulk(
+        args.size,
+        args.count,
+        difficulty=args.difficulty,
+        num_pairs=args.pairs,
+        workers=args.workers,
+        seed=args.seed,
+        unique=args.unique,
+        chunk_size=args.chunk_size,
+        time_limit=args.time_limit,
+        stats=stats,
+    )
+    written = write_bulk(puzzles, args.output, batch_size=args.batch_size)
+    print(
+        f"{written}/{args.count} puzzles escritos en {args.output} "
+        f"(generados: {stats['generated']}, duplicados: {stats['duplicates']}, "
+        f"sin solución única: {stats['not_unique']})",
+        file=sys.stderr,
+    )
+    return 0 if written == args.count else 1
+
+
+def cmd_pack(args):
+    files = expand_inputs(args.inputs)
+    if not files:
+        print("No se encontraron archivos de tableros", file=sys.stderr)
+        return 2
+    try:
+        count = text_to_pack(files, args.output)
+    except (BoardFormatError, PackFormatError, OSError) as e:
+        print(e, file=sys.stderr)
+        return 1
+    print(f"{count} puzzles empaquetados en {args.output}", file=sys.stderr)
+    return 0
+
+
+def cmd_unpack(args):
+    try:
+        count = pack_to_text(args.input, args.output)
+    except (PackFormatError, OSError) as e:
+        print(e, file=sys.stderr)
+        return 1
+    print(f"{count} puzzles escritos en {args.output}", file=sys.stderr)
+    return 0
+
+
+def cmd_check(args):
+    files = expand_inputs(args.inputs)
+    puzzles = 0
+    failures = 0
+    for path in files:
+        try:
+            puzzles += sum(1 for _ in iter_boards(path))
+        except (BoardFormatError, OSError) as e:
+            failures += 1
+            print(e, file=sys.stderr)
+    print(f"{len(files) - failures}/{len(files)} archivos válidos ({puzzles} tableros)",
+          file=sys.stderr)
+    return 0 if failures == 0 else 1
+
+
+def cmd_serve(args):
+    service.run_service(
+        host=args.host,
+        port=args.port,
+        unix_path=args.unix,
+        workers=args.workers,
+        default_time_limit=args.time_limit,
+        max_time_limit=args.max_time_limit,
+        max_queue=args.max_queue,
+    )
+    return 0
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,287 @@
+"""
+Enumeración perezosa de caminos entre dos extremos de un tablero NumberLink
+"""
+
+from collections import deque
+from board import Board
+from bitboard_solver import BitGrid
+
+
+def iter_paths(board, start, end, number, max_len=None, max_paths=None, deadline=None):
+    """
+    Genera caminos simples de ``start`` a ``end`` en orden de longitud creciente
+
+    Es un BFS sobre caminos parciales. Cada nodo es una tupla
+    ``(indice, nodo_padre, longitud, visitados)`` donde ``visitados`` es una
+    máscara de bits de índices planos, de modo que los prefijos comunes se
+    comparten y extender un camino cuesta O(1) en lugar de copiar listas.
+    Los caminos se reconstruyen solo cuando se entregan.
+
+    El tablero no debe cambiar entre dos ``next()`` consecutivos; el
+    backtracking del solver lo garantiza deshaciendo cada camino antes de
+    pedir el siguiente.
+
+    Args:
+        board: Tablero sobre el que se buscan los caminos
+        start: Celda inicial (r, c)
+        end: Celda final (r, c)
+        number: Número que se está conectando
+        max_len: Longitud máxima (en celdas) de los caminos; None = sin límite
+        max_paths: Número máximo de caminos a generar; None = sin límite
+        deadline: Deadline opcional; la enumeración se corta cuando vence
+            (una sola llamada puede explorar muchísimos caminos parciales)
+
+    Yields:
+        list: Camino como lista de tuplas (r, c), de start a end
+    """
+    if start == end:
+        yield [start]
+        return
+
+    cols = board.cols
+    cells = board.cells
+    neighbors = board.neighbors
+    empty = Board.EMPTY
+    if max_len is None:
+        max_len = board.size
+    if max_paths is None:
+        max_paths = -1
+
+    start_idx = start[0] * cols + start[1]
+    end_idx = end[0] * cols + end[1]
+
+    produced = 0
+    queue = deque()
+    queue.append((start_idx, None, 1, 1 << start_idx))
+    popleft = queue.popleft
+    append = queue.append
+
+    tick = None if deadline is None else deadline.tick
+
+    while queue:
+        if tick is not None and tick():
+            return
+        node = popleft()
+        cur, _, length, visited = node
+        if cur == end_idx:
+            path = []
+            while node is not None:
+                idx = node[0]
+                path.append((idx // cols, idx % cols))
+                node = node[1]
+            path.reverse()
+            yield path
+            produced += 1
+            if produced == max_paths:
+                return
+            continue
+        if length >= max_len:
+            continue
+        for nbr in neighbors[cur]:
+            bit = 1 << nbr
+            if visited & bit:
+                continue
+            value = cells[nbr]
+            if value == empty or value == number:
+                append((nbr, node, length + 1, visited | bit))
+
+
+def _distancias(board, source, free):
+    """
+    Distancia (en pasos) desde ``source`` hasta cada celda de ``free``
+
+    BFS por capas sobre el bitset de celdas vacías. Las celdas que no se
+    alcanzan quedan con ``board.size`` (mayor que cualquier camino simple).
+    """
+    grid = BitGrid.for_size(board.rows, board.cols)
+    dist = [board.size] * board.size
+    seen = 1 << source
+    frontier = seen
+    step = 0
+    while frontier:
+        step += 1
+        frontier = grid.neighbors(frontier) & free & ~seen
+        seen |= frontier
+        layer = frontier
+        while layer:
+            low = layer & -layer
+            dist[low.bit_length() - 1] = step
+            layer ^= low
+    return dist
+
+
+def iter_paths_bidirectional(board, start, end, number, max_len=None, max_paths=None,
+                             deadline=None):
+    """
+    Mismos caminos que ``iter_paths``, del más corto al más largo, creciendo
+    desde los dos extremos
+
+    Un camino de ``k`` pasos se forma uniendo un camino parcial de
+    ``ceil(k/2)`` pasos desde ``start`` con otro de ``floor(k/2)`` pasos desde
+    ``end`` que acaban en la misma celda y no comparten ninguna otra. Solo se
+    guardan las dos capas de la profundidad actual, así que la frontera es
+    del orden de la raíz cuadrada de la del BFS unidireccional. Como en A*,
+    un parcial se descarta si sus pasos más la distancia (por celdas vacías)
+    hasta el extremo opuesto superan ``max_len``; las celdas desde las que no
+    se alcanza ese extremo nunca se expanden.
+
+    Dentro de una misma longitud el orden no coincide con el de
+    ``iter_paths``. Los argumentos son los de ``iter_paths``.
+
+    Yields:
+        list: Camino como lista de tuplas (r, c), de start a end
+    """
+    if start == end:
+        yield [start]
+        return
+
+    cols = board.cols
+    cells = board.cells
+    neighbors = board.neighbors
+    empty = Board.EMPTY
+    if max_len is None:
+        max_len = board.size
+    if max_paths is None:
+        max_paths = -1
+    max_steps = max_len - 1
+    tick = None if deadline is None else deadline.tick
+
+    start_idx = start[0] * cols + start[1]
+    end_idx = end[0] * cols + end[1]
+    free = board.empty_mask
+
+    produced = 0
+    if max_steps >= 1 and end_idx in neighbors[start_idx]:
+        yield [start, end]
+        produced += 1
+        if produced == max_paths:
+            return
+
+    to_end = _distancias(board, end_idx, free)
+    to_start = _distancias(board, start_idx, free)
+
+    def expand(layer, depth, dist):
+        """Capa ``depth + 1`` de caminos parciales (None si vence el plazo)"""
+        grown = []
+        limit = max_steps - depth - 1
+        for node in layer:
+            if tick is not None and tick():
+                return None
+            cur, _, visited = node
+            for nbr in neighbors[cur]:
+                bit = 1 << nbr
+                if visited & bit or cells[nbr] != empty or dist[nbr] > limit:
+                    continue
+                grown.append((nbr, node, visited | bit))
+        return grown
+
+    # Nodos (celda, padre, visitados); las capas 0 son los propios extremos
+    forward = [(start_idx, None, 1 << start_idx)]
+    backward = [(end_idx, None, 1 << end_idx)]
+    forward_depth = backward_depth = 0
+    by_tip = {}
+
+    for steps in range(2, max_steps + 1):
+        # Cada longitud alarga en un paso una de las dos mitades
+        if forward_depth < (steps + 1) // 2:
+            forward = expand(forward, forward_depth, to_end)
+            forward_depth += 1
+        if backward_depth < steps // 2:
+            backward = expand(backward, backward_depth, to_start)
+            backward_depth += 1
+            if backward is not None:
+                # Índice de la capa hacia atrás: celda de unión -> visitados -> nodos.
+                # Los parciales con el mismo conjunto de celdas se comprueban una vez
+                by_tip = {}
+                for node in backward:
+                    by_tip.setdefault(node[0], {}).setdefault(node[2], []).append(node)
+        if not forward or not backward:
+            return
+
+        # Grupos compatibles por (celda de unión, visitados) de la capa hacia delante
+        compatible = {}
+        for node in forward:
+            if tick is not None and tick():
+                return
+            tip, _, visited = node
+            groups = compatible.get((tip, visited))
+            if groups is None:
+                groups = []
+                tip_bit = 1 << tip
+                for mask, partners in by_tip.get(tip, {}).items():
+                    if tick is not None and tick():
+                        return
+                    if visited & mask == tip_bit:
+                        groups.append(partners)
+                compatible[(tip, visited)] = groups
+            for partners in groups:
+                for other in partners:
+                    path = []
+                    head = node
+                    while head is not None:
+                        path.append((head[0] // cols, head[0] % cols))
+                        head = head[1]
+                    path.reverse()
+                    head = other[1]
+                    while head is not None:
+                        path.append((head[0] // cols, head[0] % cols))
+                        head = head[1]
+                    yield path
+                    produced += 1
+                    if produced == max_paths:
+                        return
+
+
+def iter_all_paths(board, start, end, number):
+    """
+    Genera todos los caminos simples de ``start`` a ``end`` (búsqueda en profundidad)
+
+    A diferencia de ``iter_paths`` no hay orden por longitud ni límites, y la
+    memoria es proporcional a la longitud del camino actual en lugar de a la
+    frontera del BFS. Es el enumerador que necesita el conteo de soluciones,
+    donde hay que recorrer todos los candidatos de cada par. Una rama se
+    abandona en cuanto ``end`` deja de ser alcanzable por celdas vacías
+    (flood-fill sobre ``board.empty_mask``).
+
+    Yields:
+        list: Camino como lista de tuplas (r, c), de start a end
+    """
+    if start == end:
+        yield [start]
+        return
+
+    cols = board.cols
+    cells = board.cells
+    neighbors = board.neighbors
+    empty = Board.EMPTY
+    grid = BitGrid.for_size(board.rows, cols)
+
+    start_idx = start[0] * cols + start[1]
+    end_idx = end[0] * cols + end[1]
+    end_bit = 1 << end_idx
+    free = board.empty_mask
+
+    path = [start_idx]
+    visited = 1 << start_idx
+    stack = [iter(neighbors[start_idx])]
+    while stack:
+        for nbr in stack[-1]:
+            bit = 1 << nbr
+            if visited & bit:
+                continue
+            if nbr == end_idx:
+                yield [(idx // cols, idx % cols) for idx in path] + [end]
+                continue
+            if cells[nbr] != empty:
+                continue
+            # El extremo final debe seguir alcanzable desde la nueva cabeza
+            allowed = (free & ~visited) | end_bit
+            if not grid.flood(bit, allowed) & end_bit:
+                continue
+            path.append(nbr)
+            visited |= bit
+            stack.append(iter(neighbors[nbr]))
+            break
+        else:
+            stack.pop()
+            visited &= ~(1 << path.pop())
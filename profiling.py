@@ -0,0 +1,163 @@
+"""
+Contadores de perfilado de la búsqueda exhaustiva
+
+``NumberLinkSolver(profile=True)`` sustituye en la propia instancia los
+métodos del camino caliente por envoltorios que miden tiempo y llamadas
+(``SearchProfile.timed``). Sin perfilado no hay envoltorios ni
+comprobaciones en el bucle: el coste es nulo.
+
+Los resultados se exportan como JSON o como pilas colapsadas
+(``raiz;heuristica;fase microsegundos``), el formato que leen flamegraph.pl,
+speedscope o inferno.
+"""
+
+import json
+import time
+
+ROOT = "resolver_tablero"
+
+
+class SearchProfile:
+    """Tiempos por fase y heurística y contadores por nivel de la búsqueda"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.order = None          # Heurística en curso (nombre)
+        self.totals = {}           # heuristica -> segundos totales
+        self.phases = {}           # (heuristica, fase) -> [llamadas, segundos, aciertos]
+        self.nodes = []            # Nodos visitados por nivel
+        self.expanded = []         # Nodos que generaron candidatos, por nivel
+        self.count_prunes = []     # Nodos cortados por la cota de celdas libres, por nivel
+        self.candidates = []       # Por nivel: {candidatos generados: nodos}
+
+    # ------------------------------------------------------------------------- #
+    # REGISTRO
+    # ------------------------------------------------------------------------- #
+    def _level(self, idx):
+        while len(self.nodes) <= idx:
+            self.nodes.append(0)
+            self.expanded.append(0)
+            self.count_prunes.append(0)
+            self.candidates.append({})
+
+    def add(self, phase, seconds, hit=False):
+        """Suma una llamada de ``phase`` a la heurística en curso"""
+        entry = self.phases.get((self.order, phase))
+        if entry is None:
+            entry = self.phases[(self.order, phase)] = [0, 0.0, 0]
+        entry[0] += 1
+        entry[1] += seconds
+        if hit:
+            entry[2] += 1
+
+    def add_total(self, seconds):
+        self.totals[self.order] = self.totals.get(self.order, 0.0) + seconds
+
+    def node(self, idx, expanded, count_pruned):
+        """Registra un nodo del nivel ``idx``"""
+        self._level(idx)
+        self.nodes[idx] += 1
+        if expanded:
+            self.expanded[idx] += 1
+        if count_pruned:
+            self.count_prunes[idx] += 1
+
+    def candidate_count(self, idx, produced):
+        """Un nodo del nivel ``idx`` terminó de generar ``produced`` candidatos"""
+        self._level(idx)
+        histogram = self.candidates[idx]
+        histogram[produced] = histogram.get(produced, 0) + 1
+
+    def timed(self, phase, func, hit=None):
+        """
+        Envoltorio de ``func`` que registra cada llamada en ``phase``
+
+        ``hit`` es un predicado opcional sobre el resultado que cuenta la
+        llamada como acierto (p. ej. una poda que corta la rama).
+        """
+        clock = time.perf_counter
+
+        def wrapper(*args, **kwargs):
+            start = clock()
+            result = func(*args, **kwargs)
+            self.add(phase, clock() - start, hit is not None and hit(result))
+            return result
+        return wrapper
+
+    def timed_candidates(self, idx, candidates):
+        """Iterador de candidatos que mide ``enumeracion`` y cuenta lo generado"""
+        clock = time.perf_counter
+        produced = 0
+        try:
+            while True:
+                start = clock()
+                path = next(candidates, None)
+                self.add("enumeracion", clock() - start)
+                if path is None:
+                    return
+                produced += 1
+                yield path
+        finally:
+            self.candidate_count(idx, produced)
+
+    # ------------------------------------------------------------------------- #
+    # EXPORTACIÓN
+    # ------------------------------------------------------------------------- #
+    def to_dict(self):
+        """Resumen serializable a JSON"""
+        orders = {}
+        for (order, phase), (calls, seconds, hits) in sorted(
+            self.phases.items(), key=lambda item: (str(item[0][0]), item[0][1])
+        ):
+            orders.setdefault(str(order), {})[phase] = {
+                "calls": calls,
+                "seconds": seconds,
+                "hits": hits,
+                "hit_rate": hits / calls if calls else 0.0,
+            }
+        depths = []
+        for idx, nodes in enumerate(self.nodes):
+            children = self.nodes[idx + 1] if idx + 1 < len(self.nodes) else 0
+            expanded = self.expanded[idx]
+            depths.append({
+                "depth": idx,
+                "nodes": nodes,
+                "expanded": expanded,
+                "count_prunes": self.count_prunes[idx],
+                "branching": children / expanded if expanded else 0.0,
+                "candidates": {
+                    str(count): times for count, times in sorted(self.candidates[idx].items())
+                },
+            })
+        return {
+            "totals": {str(order): seconds for order, seconds in self.totals.items()},
+            "phases": orders,
+            "depths": depths,
+        }
+
+    def collapsed_stacks(self):
+        """
+        Líneas ``resolver_tablero;heuristica[;fase] microsegundos``; la línea
+        sin fase es el tiempo propio de la heurística (total menos fases)
+        """
+        lines = []
+        for order, total in self.totals.items():
+            spent = 0.0
+            for (phase_order, phase), (_, seconds, _) in sorted(
+                self.phases.items(), key=lambda item: item[0][1]
+            ):
+                if phase_order == order:
+                    spent += seconds
+                    lines.append(f"{ROOT};{order};{phase} {round(seconds * 1e6)}")
+            lines.append(f"{ROOT};{order} {max(0, round((total - spent) * 1e6))}")
+        return lines
+
+    def save_json(self, path):
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def save_collapsed(self, path):
+        with open(path, "w") as f:
+            f.writelines(line + "\n" for line in self.collapsed_stacks())
@@ -0,0 +1,235 @@
+"""
+Contenedor binario de muchos puzzles con índice de desplazamientos
+
+Formato (little-endian):
+
+    cabecera  : magic "NLPK", versión u16, reservado u16, cantidad u32,
+                desplazamiento del índice u64
+    registros : uno por puzzle, seguidos
+                filas u16, columnas u16, pares u16, flags u16
+                pares x (numero u16, r1 u16, c1 u16, r2 u16, c2 u16)
+                solución opcional: un color por celda (u8, o u16 si algún
+                número es mayor que 255), 0 = celda vacía
+    índice    : cantidad x u64 con el desplazamiento de cada registro
+
+El lector usa ``mmap`` y el índice, de modo que el puzzle N se decodifica
+sin recorrer los anteriores.
+"""
+
+import mmap
+import os
+import struct
+
+from board import Board
+from board_generator import format_board
+from loader import MAX_NUMBER, iter_boards
+
+MAGIC = b"NLPK"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHHIQ")
+_RECORD = struct.Struct("<HHHH")
+_PAIR = struct.Struct("<HHHHH")
+_OFFSET = struct.Struct("<Q")
+
+# Flags de registro
+HAS_SOLUTION = 1
+WIDE_COLORS = 2      # La solución usa u16 por celda
+
+
+class PackFormatError(ValueError):
+    """El archivo no es un contenedor NLPK válido"""
+
+
+def solution_grid(board, paths):
+    """Matriz de colores (número de par por celda, 0 = vacía) de una solución"""
+    grid = [[0] * board.cols for _ in range(board.rows)]
+    for path in paths:
+        number = board.get_cell(*path[0])
+        for r, c in path:
+            grid[r][c] = number
+    return grid
+
+
+class PackWriter:
+    """
+    Escribe puzzles uno tras otro; el índice y la cabecera definitiva se
+    escriben al cerrar (usar como gestor de contexto)
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "wb")
+        self._offsets = []
+        self._file.write(_HEADER.pack(MAGIC, VERSION, 0, 0, 0))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def add(self, board, paths=None):
+        """
+        Añade un puzzle y, opcionalmente, su solución
+
+        Args:
+            board: Tablero (se guardan dimensiones y extremos)
+            paths: Caminos de la solución (listas de (r, c)) o None
+        """
+        pairs = [
+            (number, positions)
+            for number, positions in board.number_positions.items()
+            if len(positions) == 2
+        ]
+        numbers = [number for number, _ in pairs]
+        if numbers and (min(numbers) < 1 or max(numbers) > MAX_NUMBER):
+            raise ValueError(f"Los números de par deben estar entre 1 y {MAX_NUMBER}")
+
+        flags = 0
+        wide = bool(numbers) and max(numbers) > 0xFF
+        if paths is not None:
+            flags |= HAS_SOLUTION | (WIDE_COLORS if wide else 0)
+
+        chunks = [_RECORD.pack(board.rows, board.cols, len(pairs), flags)]
+        for number, ((r1, c1), (r2, c2)) in pairs:
+            chunks.append(_PAIR.pack(number, r1, c1, r2, c2))
+        if paths is not None:
+            colors = [value for row in solution_grid(board, paths) for value in row]
+            fmt = "<%d%s" % (len(colors), "H" if wide else "B")
+            chunks.append(struct.pack(fmt, *colors))
+
+        self._offsets.append(self._file.tell())
+        self._file.write(b"".join(chunks))
+
+    def close(self):
+        if self._file.closed:
+            return
+        index_offset = self._file.tell()
+        self._file.write(b"".join(_OFFSET.pack(offset) for offset in self._offsets))
+        self._file.seek(0)
+        self._file.write(_HEADER.pack(MAGIC, VERSION, 0, len(self._offsets), index_offset))
+        self._file.close()
+
+
+class PackReader:
+    """Acceso aleatorio a un contenedor NLPK mediante mmap"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            # mmap no admite archivos vacíos: el tamaño se comprueba antes
+            if os.fstat(f.fileno()).st_size < _HEADER.size:
+                raise PackFormatError(f"{path}: archivo demasiado corto")
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, count, index_offset = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise PackFormatError(f"{path}: no es un contenedor NLPK")
+        if version != VERSION:
+            self.close()
+            raise PackFormatError(f"{path}: versión {version} no soportada")
+        if index_offset + count * _OFFSET.size > len(self._map):
+            self.close()
+            raise PackFormatError(f"{path}: índice truncado")
+        self._count = count
+        self._index_offset = index_offset
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, i):
+        return self.board(i)
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self.board(i)
+
+    def close(self):
+        self._map.close()
+
+    def _offset(self, i):
+        if not -self._count <= i < self._count:
+            raise IndexError(f"puzzle {i} fuera de rango (hay {self._count})")
+        if i < 0:
+            i += self._count
+        return _OFFSET.unpack_from(self._map, self._index_offset + i * _OFFSET.size)[0]
+
+    def _decode(self, i):
+        """Devuelve (filas, columnas, number_positions, flags, desplazamiento_solución)"""
+        offset = self._offset(i)
+        rows, cols, num_pairs, flags = _RECORD.unpack_from(self._map, offset)
+        offset += _RECORD.size
+        number_positions = {}
+        for number, r1, c1, r2, c2 in _PAIR.iter_unpack(
+            self._map[offset:offset + num_pairs * _PAIR.size]
+        ):
+            number_positions[number] = [(r1, c1), (r2, c2)]
+        return rows, cols, number_positions, flags, offset + num_pairs * _PAIR.size
+
+    def board(self, i):
+        """Tablero del puzzle ``i``"""
+        rows, cols, number_positions, _, _ = self._decode(i)
+        board_data = [[0] * cols for _ in range(rows)]
+        for number, positions in number_positions.items():
+            for r, c in positions:
+                board_data[r][c] = number
+        return Board(board_data, number_positions)
+
+    def solution(self, i):
+        """Matriz de colores de la solución del puzzle ``i``, o None si no se guardó"""
+        rows, cols, _, flags, offset = self._decode(i)
+        if not flags & HAS_SOLUTION:
+            return None
+        fmt = "<%d%s" % (rows * cols, "H" if flags & WIDE_COLORS else "B")
+        colors = struct.unpack_from(fmt, self._map, offset)
+        return [list(colors[r * cols:(r + 1) * cols]) for r in range(rows)]
+
+
+# ------------------------------------------------------------------------- #
+# CONVERSIÓN DESDE / HACIA TEXTO
+# ------------------------------------------------------------------------- #
+def text_to_pack(text_paths, pack_path):
+    """
+    Empaqueta archivos de texto (``filas,columnas`` + ``r,c,numero``); cada
+    archivo puede contener varios puzzles y se lee de forma incremental
+
+    Si una entrada falla (archivo inexistente o mal formado) se borra el
+    contenedor a medio escribir y se propaga el error.
+
+    Returns:
+        int: Puzzles escritos
+    """
+    writer = PackWriter(pack_path)
+    try:
+        with writer:
+            for path in text_paths:
+                for board in iter_boards(path):
+                    writer.add(board)
+    except BaseException:
+        os.remove(pack_path)
+        raise
+    return len(writer)
+
+
+def pack_to_text(pack_path, text_path):
+    """
+    Escribe todos los puzzles del contenedor en un archivo de texto, uno tras
+    otro (cada línea ``filas,columnas`` empieza un puzzle nuevo)
+
+    Returns:
+        int: Puzzles escritos
+    """
+    with PackReader(pack_path) as reader, open(text_path, "w") as out:
+        for board in reader:
+            out.write(format_board(board))
+        return len(reader)
@@ -0,0 +1,652 @@
+"""
+Servicio local de resolución: HTTP/JSON sobre TCP o socket Unix
+
+Un proceso de larga vida acepta puzzles, los encola y los reparte entre un
+pool de procesos creados al arrancar: cada uno importa el solver una sola
+vez y resuelve un tablero tras otro. El plazo de cada petición cuenta desde
+que llega (incluye el tiempo en cola) y la petición se puede cancelar
+mientras espera o mientras se resuelve; cerrar la conexión también la
+cancela.
+
+API (una petición por conexión):
+
+    POST   /solve       Resuelve un puzzle. Cuerpo JSON:
+                        {"board": texto del formato de archivo, o
+                                  {"rows": R, "cols": C,
+                                   "pairs": {"N": [[r1, c1], [r2, c2]]}} en base 0,
+                         "id" (opcional), "time_limit", "require_all_cells",
+                         "engine", "orders", "forced_moves"}
+                        o el texto del puzzle con ``Content-Type: text/plain``
+                        y las opciones en la query string
+                        (``?time_limit=5&all_cells=1&orders=distancia,borde``)
+    DELETE /jobs/<id>   Cancela una petición en cola o en curso
+    GET    /status      Procesos vivos, peticiones en cola y en curso
+
+La respuesta de /solve es ``{"id", "success", "paths", "statistics",
+"stop_reason", "queued", "elapsed", "error"}`` con los caminos por número en
+base 0, como en ``batch_solver.solve_file``. ``ServiceClient`` es el
+cliente incluido y ``BackgroundService`` arranca el servicio en un hilo.
+"""
+
+import asyncio
+import http.client
+import itertools
+import json
+import multiprocessing
+import signal
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+
+from batch_solver import paths_by_number
+from board import Board
+from board_generator import format_board
+from deadline import CancellationToken
+from loader import iter_puzzles
+from solver import NumberLinkSolver
+
+DEFAULT_PORT = 8765
+
+# Tamaño máximo del cuerpo de una petición
+MAX_BODY = 1 << 20
+
+# Opciones de NumberLinkSolver que acepta /solve
+OPTIONS = ("time_limit", "require_all_cells", "engine", "orders", "forced_moves")
+
+# Valores de texto admitidos para las opciones booleanas
+TRUE_WORDS = ("1", "true", "yes", "si", "sí")
+FALSE_WORDS = ("0", "false", "no")
+
+
+class ServiceError(Exception):
+    """Error de una petición, con su código de estado HTTP"""
+
+    def __init__(self, status, message):
+        self.status = status
+        self.message = message
+        super().__init__(f"{status}: {message}")
+
+
+def parse_flag(name, value):
+    """Booleano JSON o una de las palabras de TRUE_WORDS / FALSE_WORDS"""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        word = value.strip().lower()
+        if word in TRUE_WORDS:
+            return True
+        if word in FALSE_WORDS:
+            return False
+    raise ServiceError(400, f"{name} debe ser un booleano, no {value!r}")
+
+
+def parse_board(spec):
+    """
+    Tablero a partir del texto del formato de archivo o del diccionario JSON
+    ``{"rows", "cols", "pairs"}`` (base 0); ambos pasan por la validación de
+    ``loader.iter_puzzles``
+    """
+    if isinstance(spec, dict):
+        try:
+            lines = [f"{int(spec['rows'])},{int(spec['cols'])}"]
+            for number, cells in spec["pairs"].items():
+                for r, c in cells:
+                    lines.append(f"{int(r) + 1},{int(c) + 1},{int(number)}")
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            raise ServiceError(400, f"tablero JSON mal formado: {e!r}") from None
+    elif isinstance(spec, str):
+        lines = spec.splitlines()
+    else:
+        raise ServiceError(400, "falta el tablero ('board')")
+    try:
+        puzzles = list(iter_puzzles(lines, source="<petición>"))
+    except ValueError as e:
+        raise ServiceError(400, str(e)) from None
+    if len(puzzles) != 1:
+        raise ServiceError(400, f"se esperaba un tablero y hay {len(puzzles)}")
+    return Board(*puzzles[0])
+
+
+def _trabajador_servicio(conn, cancel_event):
+    """
+    Proceso del pool: resuelve los tableros que llegan por ``conn`` hasta
+    recibir None. ``cancel_event`` es el aviso de cancelación compartido con
+    el servicio, que lo limpia antes de cada tablero.
+    """
+    # Ctrl+C llega a todo el grupo de procesos; solo el servicio debe atenderlo
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    token = CancellationToken(cancel_event)
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            return
+        if task is None:
+            return
+        board, options = task
+        result = {"success": False, "paths": {}, "statistics": None,
+                  "stop_reason": None, "error": None}
+        try:
+            solver = NumberLinkSolver(cancel_token=token, **options)
+            success, paths = solver.resolver_tablero(board)
+            stats = solver.get_statistics()
+            result["success"] = success
+            result["paths"] = {
+                str(number): [list(cell) for cell in cells]
+                for number, cells in paths_by_number(board, paths).items()
+            }
+            result["statistics"] = stats
+            result["stop_reason"] = stats["stop_reason"]
+        except Exception as e:
+            result["error"] = f"{type(e).__name__}: {e}"
+        conn.send(result)
+
+
+class _Worker:
+    """Proceso del pool, su tubería y su aviso de cancelación"""
+
+    def __init__(self, ctx):
+        self.ctx = ctx
+        self.job = None
+        self.spawn()
+
+    def spawn(self):
+        self.conn, child = self.ctx.Pipe()
+        self.cancel_event = self.ctx.Event()
+        self.process = self.ctx.Process(target=_trabajador_servicio,
+                                        args=(child, self.cancel_event), daemon=True)
+        self.process.start()
+        child.close()
+
+    def respawn(self):
+        """Sustituye un proceso muerto o colgado por uno nuevo"""
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.conn.close()
+        self.spawn()
+
+    def stop(self, timeout):
+        self.cancel_event.set()
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class _Job:
+    """Petición de /solve en cola o en curso"""
+
+    __slots__ = ("id", "board", "options", "arrival", "deadline", "started",
+                 "future", "worker")
+
+    def __init__(self, job_id, board, options, future):
+        self.id = job_id
+        self.board = board
+        self.options = options
+        self.arrival = time.perf_counter()
+        self.deadline = self.arrival + options["time_limit"]
+        self.started = None
+        self.future = future
+        self.worker = None
+
+
+class SolverService:
+    """
+    Cola de peticiones y pool de procesos de resolución detrás de un
+    servidor asyncio (TCP o socket Unix)
+
+    Todo el estado (cola, peticiones, procesos) se modifica desde el bucle de
+    eventos; solo las lecturas bloqueantes de las tuberías van a hilos.
+    """
+
+    # Segundos de margen tras el plazo antes de matar un proceso que no responde
+    KILL_GRACE = 2.0
+
+    # Segundos que se espera a cada proceso al parar el servicio
+    STOP_TIMEOUT = 5.0
+
+    def __init__(self, workers=None, default_time_limit=60, max_time_limit=600,
+                 max_queue=1000):
+        """
+        Args:
+            workers: Procesos de resolución; None = os.cpu_count()
+            default_time_limit: Plazo de las peticiones que no indican uno
+            max_time_limit: Plazo máximo admitido (los mayores se recortan)
+            max_queue: Peticiones en cola admitidas; por encima se responde 503
+        """
+        self.num_workers = workers or multiprocessing.cpu_count()
+        self.default_time_limit = default_time_limit
+        self.max_time_limit = max_time_limit
+        self.max_queue = max_queue
+        self.address = None        # (host, puerto) o ruta del socket Unix
+        self.completed = 0
+        self._jobs = {}
+        self._ids = itertools.count(1)
+        self._workers = []
+        self._dispatchers = []
+        self._server = None
+        self._queue = None
+        self._executor = None
+
+    # ------------------------------------------------------------------------- #
+    # CICLO DE VIDA
+    # ------------------------------------------------------------------------- #
+    async def start(self, host="127.0.0.1", port=DEFAULT_PORT, unix_path=None):
+        """Crea los procesos y empieza a escuchar (port=0 elige uno libre)"""
+        ctx = multiprocessing.get_context()
+        self._workers = [_Worker(ctx) for _ in range(self.num_workers)]
+        self._executor = ThreadPoolExecutor(max_workers=self.num_workers)
+        self._queue = asyncio.Queue(self.max_queue)
+        self._dispatchers = [asyncio.ensure_future(self._dispatch(worker))
+                             for worker in self._workers]
+        if unix_path is not None:
+            self._server = await asyncio.start_unix_server(self._handle, path=unix_path)
+            self.address = unix_path
+        else:
+            self._server = await asyncio.start_server(self._handle, host, port)
+            self.address = self._server.sockets[0].getsockname()[:2]
+
+    async def stop(self):
+        """Deja de escuchar, cancela lo pendiente y termina los procesos"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for job in list(self._jobs.values()):
+            self.cancel(job.id)
+        for task in self._dispatchers:
+            task.cancel()
+        await asyncio.gather(*self._dispatchers, return_exceptions=True)
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(
+            loop.run_in_executor(None, worker.stop, self.STOP_TIMEOUT)
+            for worker in self._workers
+        ))
+        self._executor.shutdown(wait=True)
+
+    # ------------------------------------------------------------------------- #
+    # PETICIONES
+    # ------------------------------------------------------------------------- #
+    def solver_options(self, raw):
+        """Opciones de NumberLinkSolver validadas, con el plazo recortado"""
+        unknown = sorted(set(raw) - set(OPTIONS))
+        if unknown:
+            raise ServiceError(400, f"opciones desconocidas: {', '.join(unknown)}")
+        try:
+            time_limit = float(raw.get("time_limit", self.default_time_limit))
+        except (TypeError, ValueError):
+            raise ServiceError(400, "time_limit debe ser un número") from None
+        if not time_limit > 0:
+            raise ServiceError(400, "time_limit debe ser positivo")
+        options = {
+            "time_limit": min(time_limit, self.max_time_limit),
+            "require_all_cells": parse_flag("require_all_cells",
+                                            raw.get("require_all_cells", False)),
+            "engine": raw.get("engine", "exhaustivo"),
+            "orders": raw.get("orders"),
+            "forced_moves": raw.get("forced_moves", "nodo"),
+        }
+        try:
+            NumberLinkSolver(**options)
+        except (TypeError, ValueError) as e:
+            raise ServiceError(400, str(e)) from None
+        return options
+
+    def new_id(self):
+        job_id = str(next(self._ids))
+        while job_id in self._jobs:
+            job_id = str(next(self._ids))
+        return job_id
+
+    async def submit(self, board, options=None, job_id=None):
+        """
+        Encola un tablero y espera su resultado (también sin HTTP)
+
+        Si la tarea que espera se cancela, la petición se cancela con ella.
+
+        Returns:
+            dict: Respuesta de /solve
+        """
+        options = self.solver_options(options or {})
+        job_id = self.new_id() if job_id is None else str(job_id)
+        if job_id in self._jobs:
+            raise ServiceError(409, f"ya hay una petición con id {job_id!r}")
+        job = _Job(job_id, board, options, asyncio.get_running_loop().create_future())
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise ServiceError(503, "cola de peticiones llena") from None
+        self._jobs[job_id] = job
+        try:
+            return await asyncio.shield(job.future)
+        except asyncio.CancelledError:
+            self.cancel(job_id)
+            raise
+        finally:
+            self._jobs.pop(job_id, None)
+
+    def cancel(self, job_id):
+        """
+        Cancela una petición en cola (responde sin resolverla) o en curso
+        (su proceso se detiene en el siguiente muestreo del plazo)
+
+        Returns:
+            bool: False si no hay ninguna petición pendiente con ese id
+        """
+        job = self._jobs.get(job_id)
+        if job is None or job.future.done():
+            return False
+        if job.worker is not None:
+            job.worker.cancel_event.set()
+        else:
+            job.future.set_result(self._response(job, {"stop_reason": "cancelled"}))
+        return True
+
+    def status(self):
+        return {
+            "workers": len(self._workers),
+            "alive": sum(1 for worker in self._workers if worker.process.is_alive()),
+            "queued": self._queue.qsize(),
+            "running": sorted(worker.job.id for worker in self._workers if worker.job),
+            "completed": self.completed,
+        }
+
+    def _response(self, job, result):
+        now = time.perf_counter()
+        response = {
+            "id": job.id,
+            "success": False,
+            "paths": {},
+            "statistics": None,
+            "stop_reason": None,
+            "queued": (now if job.started is None else job.started) - job.arrival,
+            "elapsed": now - job.arrival,
+            "error": None,
+        }
+        response.update(result)
+        self.completed += 1
+        return response
+
+    async def _dispatch(self, worker):
+        """Lleva las peticiones de la cola al proceso ``worker``, una a una"""
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await self._queue.get()
+            if job.future.done():
+                continue                      # Cancelada mientras esperaba
+            job.started = time.perf_counter()
+            remaining = job.deadline - job.started
+            if remaining <= 0:
+                job.future.set_result(self._response(job, {"stop_reason": "timeout"}))
+                continue
+
+            worker.cancel_event.clear()
+            worker.job, job.worker = job, worker
+            worker.conn.send((job.board, dict(job.options, time_limit=remaining)))
+            reply = loop.run_in_executor(self._executor, worker.conn.recv)
+            try:
+                result = await asyncio.wait_for(asyncio.shield(reply),
+                                                remaining + self.KILL_GRACE)
+            except asyncio.TimeoutError:
+                worker.process.kill()
+                await asyncio.gather(reply, return_exceptions=True)
+                worker.respawn()
+                result = {"stop_reason": "timeout",
+                          "error": "el proceso no respondió a tiempo y se reinició"}
+            except (EOFError, OSError):
+                worker.respawn()
+                result = {"error": "el proceso de resolución terminó inesperadamente"}
+            finally:
+                worker.job, job.worker = None, None
+            if not job.future.done():
+                job.future.set_result(self._response(job, result))
+
+    # ------------------------------------------------------------------------- #
+    # HTTP
+    # ------------------------------------------------------------------------- #
+    async def _handle(self, reader, writer):
+        try:
+            try:
+                method, target, headers, body = await self._read_request(reader)
+                status, payload = await self._route(method, target, headers, body, reader)
+            except ServiceError as e:
+                status, payload = e.status, {"error": e.message}
+            if status is not None:
+                data = json.dumps(payload).encode("utf-8")
+                writer.write(
+                    f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: close\r\n\r\n".encode("latin-1") + data
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader):
+        line = await reader.readline()
+        if not line:
+            raise ConnectionError("conexión cerrada sin petición")
+        parts = line.decode("latin-1").split()
+        if len(parts) != 3:
+            raise ServiceError(400, "línea de petición no válida")
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            raise ServiceError(400, "Content-Length no válido") from None
+        if length > MAX_BODY:
+            raise ServiceError(413, f"cuerpo mayor de {MAX_BODY} bytes")
+        body = await reader.readexactly(length) if length > 0 else b""
+        return parts[0].upper(), parts[1], headers, body
+
+    async def _route(self, method, target, headers, body, reader):
+        """(estado, respuesta) de la petición; (None, None) si el cliente se fue"""
+        url = urlsplit(target)
+        if url.path == "/solve":
+            if method != "POST":
+                raise ServiceError(405, "usar POST /solve")
+            board, options, job_id = self._read_solve(headers, body, url.query)
+            return await self._solve_until_disconnect(board, options, job_id, reader)
+        if url.path == "/status":
+            if method != "GET":
+                raise ServiceError(405, "usar GET /status")
+            return 200, self.status()
+        if url.path.startswith("/jobs/"):
+            if method != "DELETE":
+                raise ServiceError(405, "usar DELETE /jobs/<id>")
+            job_id = unquote(url.path[len("/jobs/"):])
+            if not self.cancel(job_id):
+                raise ServiceError(404, f"no hay ninguna petición pendiente con id {job_id!r}")
+            return 200, {"id": job_id, "cancelled": True}
+        raise ServiceError(404, f"ruta desconocida: {url.path}")
+
+    def _read_solve(self, headers, body, query):
+        """(tablero, opciones, id) de una petición /solve"""
+        content_type = headers.get("content-type", "application/json").split(";")[0].strip()
+        if content_type == "text/plain":
+            params = {name: values[-1] for name, values in parse_qs(query).items()}
+            job_id = params.pop("id", None)
+            raw = {}
+            for name, value in params.items():
+                if name == "all_cells":
+                    raw["require_all_cells"] = parse_flag("all_cells", value)
+                elif name == "orders":
+                    raw["orders"] = [order for order in value.split(",") if order]
+                else:
+                    raw[name] = value
+            spec = body.decode("utf-8", errors="replace")
+        else:
+            try:
+                request = json.loads(body)
+            except ValueError as e:
+                raise ServiceError(400, f"JSON no válido: {e}") from None
+            if not isinstance(request, dict):
+                raise ServiceError(400, "el cuerpo JSON debe ser un objeto")
+            spec = request.pop("board", None)
+            job_id = request.pop("id", None)
+            raw = request
+        return parse_board(spec), self.solver_options(raw), job_id
+
+    async def _solve_until_disconnect(self, board, options, job_id, reader):
+        """Resuelve y cancela la petición si el cliente cierra la conexión antes"""
+        job_id = self.new_id() if job_id is None else str(job_id)
+        task = asyncio.ensure_future(self.submit(board, options, job_id))
+        eof = asyncio.ensure_future(reader.read(1))
+        await asyncio.wait({task, eof}, return_when=asyncio.FIRST_COMPLETED)
+        if not task.done() and eof.done() and not eof.exception() and eof.result() == b"":
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            return None, None
+        eof.cancel()
+        return 200, await task
+
+
+class BackgroundService:
+    """
+    Servicio en un hilo con su propio bucle de eventos, como gestor de
+    contexto (pruebas y programas que no usan asyncio)
+
+        with BackgroundService(workers=2, port=0) as service:
+            client = ServiceClient(*service.address)
+    """
+
+    def __init__(self, host="127.0.0.1", port=DEFAULT_PORT, unix_path=None, **options):
+        self.service = SolverService(**options)
+        self._start_args = (host, port, unix_path)
+        self._loop = None
+        self._thread = None
+
+    def __enter__(self):
+        ready = threading.Event()
+        failure = []
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            try:
+                self._loop.run_until_complete(self.service.start(*self._start_args))
+            except Exception as e:
+                failure.append(e)
+                ready.set()
+                return
+            ready.set()
+            self._loop.run_forever()
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+        ready.wait()
+        if failure:
+            raise failure[0]
+        return self.service
+
+    def __exit__(self, *exc):
+        asyncio.run_coroutine_threadsafe(self.service.stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+
+def run_service(host="127.0.0.1", port=DEFAULT_PORT, unix_path=None, **options):
+    """Ejecuta el servicio hasta recibir SIGINT o SIGTERM"""
+
+    async def main():
+        service = SolverService(**options)
+        await service.start(host, port, unix_path)
+        print(f"Servicio escuchando en {service.address} con {service.num_workers} procesos",
+              flush=True)
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop.set)
+        await stop.wait()
+        await service.stop()
+
+    asyncio.run(main())
+
+
+# ------------------------------------------------------------------------- #
+# CLIENTE
+# ------------------------------------------------------------------------- #
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path, timeout=None):
+        super().__init__("localhost", timeout=timeout)
+        self.unix_path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            self.sock.settimeout(self.timeout)
+        self.sock.connect(self.unix_path)
+
+
+class ServiceClient:
+    """Cliente síncrono del servicio (TCP o socket Unix)"""
+
+    def __init__(self, host="127.0.0.1", port=DEFAULT_PORT, unix_path=None, timeout=None):
+        self.host = host
+        self.port = port
+        self.unix_path = unix_path
+        self.timeout = timeout
+
+    def _request(self, method, path, body=None):
+        if self.unix_path is not None:
+            conn = _UnixHTTPConnection(self.unix_path, timeout=self.timeout)
+        else:
+            conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        try:
+            headers = {"Content-Type": "application/json"} if body is not None else {}
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            payload = json.loads(response.read() or b"null")
+        finally:
+            conn.close()
+        if response.status != 200:
+            message = payload.get("error") if isinstance(payload, dict) else payload
+            raise ServiceError(response.status, message)
+        return payload
+
+    def solve(self, board, job_id=None, **options):
+        """
+        Resuelve un tablero y espera la respuesta
+
+        Args:
+            board: Board, texto del formato de archivo o diccionario JSON
+            job_id: Identificador para poder cancelarla desde otro hilo
+            **options: time_limit, require_all_cells, engine, orders, forced_moves
+
+        Returns:
+            dict: Respuesta de /solve
+
+        Raises:
+            ServiceError: Petición rechazada (tablero u opciones no válidos,
+                cola llena, id repetido)
+        """
+        if isinstance(board, Board):
+            board = format_board(board)
+        request = dict(options, board=board)
+        if job_id is not None:
+            request["id"] = job_id
+        return self._request("POST", "/solve", json.dumps(request).encode("utf-8"))
+
+    def cancel(self, job_id):
+        """True si había una petición pendiente con ese id (ServiceError 404 si no)"""
+        return self._request("DELETE", f"/jobs/{quote(str(job_id), safe='')}")["cancelled"]
+
+    def status(self):
+        return self._request("GET", "/status")
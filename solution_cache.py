@@ -0,0 +1,110 @@
+"""
+Caché persistente de soluciones indexada por forma canónica
+
+Las soluciones se guardan en SQLite en la orientación y numeración
+canónicas (ver symmetry.py), de modo que un tablero rotado, reflejado o con
+los números cambiados reutiliza la solución de cualquier otro de su clase.
+Al leer, los caminos se devuelven a la orientación del tablero consultado.
+"""
+
+import json
+import sqlite3
+
+from symmetry import INVERSE, canonical_form, hash_key, transform_cell, transformed_size
+
+
+class SolutionCache:
+    """
+    Soluciones en disco por (forma canónica, require_all_cells)
+
+    Cada proceso debe abrir su propia instancia (las conexiones SQLite no se
+    comparten entre procesos); varias instancias pueden usar el mismo archivo.
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path: Archivo SQLite (se crea si no existe); ":memory:" para pruebas
+        """
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._conn = sqlite3.connect(path, timeout=30)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS solutions ("
+            " canonical TEXT NOT NULL,"
+            " require_all_cells INTEGER NOT NULL,"
+            " paths TEXT NOT NULL,"
+            " PRIMARY KEY (canonical, require_all_cells))"
+        )
+        self._conn.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self._conn.execute("SELECT COUNT(*) FROM solutions").fetchone()[0]
+
+    def close(self):
+        self._conn.close()
+
+    @staticmethod
+    def _key(form):
+        key, _, _ = form
+        return hash_key(key)
+
+    def get(self, board, require_all_cells=False):
+        """
+        Solución guardada para ``board`` o None
+
+        Returns:
+            list | None: Caminos (listas de (r, c)) en la orientación de
+            ``board``, ordenados por número de par
+        """
+        form = canonical_form(board)
+        row = self._conn.execute(
+            "SELECT paths FROM solutions WHERE canonical = ? AND require_all_cells = ?",
+            (self._key(form), int(require_all_cells)),
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+
+        _, sym, relabel = form
+        inverse = INVERSE[sym]
+        rows, cols = transformed_size(sym, board.rows, board.cols)
+        canonical_paths = json.loads(row[0])
+        paths = []
+        for number in sorted(relabel):
+            cells = canonical_paths[relabel[number] - 1]
+            path = [transform_cell(tuple(cell), inverse, rows, cols) for cell in cells]
+            # Cada camino empieza en el primer extremo registrado del par
+            if path[0] != board.number_positions[number][0]:
+                path.reverse()
+            paths.append(path)
+        return paths
+
+    def put(self, board, paths, require_all_cells=False):
+        """Guarda la solución ``paths`` de ``board`` (en cualquier orden de pares)"""
+        form = canonical_form(board)
+        _, sym, relabel = form
+        canonical_paths = [None] * len(relabel)
+        for path in paths:
+            number = board.get_cell(*path[0])
+            canonical_paths[relabel[number] - 1] = [
+                list(transform_cell(cell, sym, board.rows, board.cols)) for cell in path
+            ]
+        self._conn.execute(
+            "INSERT OR REPLACE INTO solutions (canonical, require_all_cells, paths) VALUES (?, ?, ?)",
+            (self._key(form), int(require_all_cells), json.dumps(canonical_paths)),
+        )
+        self._conn.commit()
+
+    def get_statistics(self):
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self)}
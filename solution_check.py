@@ -0,0 +1,40 @@
+"""
+Comprobación de soluciones compartida por las pruebas
+"""
+
+from board import Board
+
+
+def is_path(cells):
+    """True si cada celda es vecina ortogonal de la anterior"""
+    return all(
+        abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1
+        for a, b in zip(cells, cells[1:])
+    )
+
+
+def check_solution(board, paths, require_all_cells=False):
+    """
+    Falla con AssertionError si ``paths`` no resuelve ``board``
+
+    Cada par queda unido por exactamente un camino simple (en cualquier orden
+    y sentido) que solo pasa por celdas vacías, y los caminos no se cruzan.
+    Con ``require_all_cells`` además cubren todo el tablero.
+    """
+    pairs = {frozenset((start, end)): number for start, end, number in board.get_pairs()}
+    assert len(paths) == len(pairs), f"{len(paths)} caminos para {len(pairs)} pares"
+    routed = set()
+    covered = set()
+    for path in paths:
+        ends = frozenset((path[0], path[-1]))
+        assert ends in pairs, f"{path[0]}-{path[-1]} no son los extremos de un par"
+        assert ends not in routed, f"el par {pairs[ends]} tiene dos caminos"
+        routed.add(ends)
+        assert is_path(path), f"el camino del par {pairs[ends]} no es continuo"
+        assert all(board.get_cell(*cell) == Board.EMPTY for cell in path[1:-1]), \
+            f"el camino del par {pairs[ends]} pisa una celda ocupada"
+        assert not covered & set(path), f"el camino del par {pairs[ends]} cruza otro"
+        covered.update(path)
+    if require_all_cells:
+        assert len(covered) == board.rows * board.cols, \
+            f"quedan {board.rows * board.cols - len(covered)} celdas sin cubrir"
@@ -1,11 +1,71 @@
 from board import Board
+import os
 import time
-from collections import deque
+import multiprocessing
+import queue
+from itertools import islice
+from path_search import iter_all_paths, iter_paths_bidirectional
+from bitboard_solver import BitboardEngine, BitGrid
+from transposition import TranspositionTable
+from deadline import CancellationToken, Deadline
+from solution_cache import SolutionCache
+from checkpoint import load_checkpoint, save_checkpoint
+from profiling import SearchProfile
+
+
+class SearchFrame:
+    """
+    Registro de la pila explícita del backtracking exhaustivo: un nivel por par
+
+    ``candidates`` es el iterador de caminos del par ``idx`` (None si hay que
+    regenerarlo saltando ``position`` candidatos, p. ej. al reanudar) y
+    ``mark`` la profundidad del trail del tablero al entrar en el nivel.
+    ``placed`` indica si el candidato número ``position`` está marcado en el
+    tablero y ``forced`` guarda lo necesario para deshacer los movimientos
+    forzados aplicados tras él: (deshacer, pares_previos, cotas_previas).
+    """
+
+    __slots__ = ("idx", "candidates", "mark", "position", "placed", "forced")
+
+    def __init__(self, idx, candidates, mark):
+        self.idx = idx
+        self.candidates = candidates
+        self.mark = mark
+        self.position = 0
+        self.placed = False
+        self.forced = None
+
 
 class NumberLinkSolver:
     """Solucionador EXHAUSTIVO para NumberLink con instrumentación de heurísticas"""
     
-    def __init__(self, time_limit=600, debug=False, require_all_cells=False):
+    # Motores de búsqueda disponibles. El bitboard está pensado para puzzles
+    # que cubren todo el tablero: sin require_all_cells crece celda a celda sin
+    # ninguna cota útil, así que esos puzzles los resuelve el exhaustivo
+    ENGINES = ("exhaustivo", "bitboard")
+
+    # Dónde se aplican los movimientos forzados del motor exhaustivo
+    FORCED_MODES = ("ninguno", "raiz", "nodo")
+
+    # Segundos que se espera a los procesos del portafolio tras una solución
+    PORTFOLIO_GRACE = 2.0
+
+    # Segundos entre comprobaciones de cancelación mientras se espera al portafolio
+    PORTFOLIO_POLL = 0.1
+
+    def __init__(self, time_limit=600, debug=False, require_all_cells=False,
+                 engine="exhaustivo", portfolio=False, orders=None, tt_size=100000,
+                 cancel_token=None, solution_cache=None, forced_moves="nodo",
+                 checkpoint_path=None, progress=None, progress_interval=0.5,
+                 profile=False):
+        if engine not in self.ENGINES:
+            raise ValueError(f"Motor desconocido: {engine!r} (opciones: {', '.join(self.ENGINES)})")
+        if forced_moves not in self.FORCED_MODES:
+            raise ValueError(
+                f"Modo de movimientos forzados desconocido: {forced_moves!r} "
+                f"(opciones: {', '.join(self.FORCED_MODES)})"
+            )
+
         # Métricas generales
         self.solutions_found = 0
         self.nodes_explored = 0
@@ -14,18 +74,87 @@ class NumberLinkSolver:
         self.time_limit = time_limit
         self.debug = debug
         self.require_all_cells = require_all_cells
+        self.engine = engine
+        self.portfolio = portfolio   # Ejecutar las heurísticas en paralelo
 
-        # Temporizador
+        # Temporizador (time.perf_counter) y plazo de la búsqueda en curso
         self.start_time = None
+        self._deadline = None
+
+        # Aviso de cancelación; otro hilo puede activarlo con cancel()
+        self.cancel_token = CancellationToken() if cancel_token is None else cancel_token
 
         # Instrumentación de heurísticas
         self.order_names = [
             "distancia",            # 0
             "borde",                # 1
             "flexibilidad",         # 2
-            "distancia_inversa"     # 3
+            "distancia_inversa",    # 3
+            "dinamico"              # 4 (MRV: se elige el par en cada nivel)
         ]
+        # Heurísticas a probar, por nombre y en orden; None = todas
+        if orders is not None:
+            unknown = [name for name in orders if name not in self.order_names]
+            if unknown:
+                raise ValueError(f"Heurísticas desconocidas: {', '.join(unknown)}")
+        self.orders = None if orders is None else list(orders)
         self.order_used = None     # Índice de la heurística que resolvió
+        self.nodes_by_order = {}   # Nodos explorados por cada heurística probada
+
+        # Cota inferior de celdas libres que necesitan los pares pendientes
+        self._min_free_cells = []
+
+        # Si es True, _resolver_exhaustivo elige el par de cada nivel (MRV)
+        self._dynamic_order = False
+
+        # Tabla de transposición de estados sin salida (tt_size=0 la desactiva)
+        self.tt_size = tt_size
+        self.transposition = None
+        self._aborted = False      # La búsqueda se cortó por tiempo o cancelación
+
+        # Movimientos forzados: antes de la búsqueda ("raiz") o además tras
+        # colocar cada camino ("nodo")
+        self.forced_moves = forced_moves
+        self.forced_cells = 0        # Celdas fijadas por el preproceso
+        self.forced_in_search = 0    # Celdas fijadas en los nodos de la búsqueda
+        self._prefijos = {}          # numero -> (prefijo desde start, prefijo desde end)
+        self._cerrados = []          # Pares unidos por movimientos forzados
+
+        # Caché persistente de soluciones (SolutionCache o ruta del archivo SQLite)
+        if isinstance(solution_cache, str):
+            solution_cache = SolutionCache(solution_cache)
+        self.solution_cache = solution_cache
+        self.cache_hit = False
+
+        # Pila explícita de la búsqueda exhaustiva (SearchFrame por nivel) y
+        # si falta entrar en el nivel siguiente al de la cima
+        self._pila = []
+        self._pendiente = False
+        # Estado de la búsqueda cortada por tiempo o cancelación (ver search_state)
+        self.search_state = None
+        # Archivo donde se guarda ese estado al cortarse la búsqueda (ver resume)
+        self.checkpoint_path = checkpoint_path
+
+        # Eventos de progreso (ver _emitir_progreso): función que recibe cada
+        # evento y segundos mínimos entre dos eventos "progress"
+        self.progress = progress
+        self.progress_interval = progress_interval
+        self.best_depth = 0          # Máximo de caminos colocados a la vez por la búsqueda
+        self._order_idx = None       # Heurística en curso
+        self._pairs_total = 0
+        self._next_progress = 0.0
+        self._progress_nodes = 0     # Nodos y tiempo del último evento "progress"
+        self._progress_time = 0.0
+
+        # Perfilado del camino caliente (SearchProfile); sin él no hay coste
+        self.profile = None
+        if profile:
+            self.profile = SearchProfile()
+            self._instrumentar()
+
+    def cancel(self):
+        """Cancela la resolución en curso (seguro desde otro hilo)"""
+        self.cancel_token.cancel()
 
     # ------------------------------------------------------------------------- #
     # UTILIDADES DE DEBUG
@@ -38,51 +167,149 @@ class NumberLinkSolver:
     # ------------------------------------------------------------------------- #
     # FUNCIÓN PRINCIPAL
     # ------------------------------------------------------------------------- #
-    def resolver_tablero(self, board):
-        """Intenta resolver el tablero probando varias órdenes heurísticas"""
-        self.start_time = time.time()
+    def resolver_tablero(self, board, resume_from=None):
+        """
+        Intenta resolver el tablero probando varias órdenes heurísticas
+
+        Si la búsqueda exhaustiva se corta por tiempo o cancelación, su estado
+        queda en ``self.search_state`` como datos planos (serializables con
+        JSON): heurística en curso, posición de cada nivel de la pila y tabla
+        de transposición.
+        Pasándolo como ``resume_from`` con el mismo tablero y configuración se
+        continúa desde ese punto, en este u otro proceso. Con
+        ``checkpoint_path`` el estado además se guarda en ese archivo, que se
+        borra cuando una búsqueda termina sin cortarse.
+        """
+        self.start_time = time.perf_counter()
+        # El progreso se muestrea en las mismas lecturas del reloj que el plazo
+        on_sample = None if self.progress is None else self._muestrear_progreso
+        self._deadline = Deadline(self.time_limit, self.cancel_token, start=self.start_time,
+                                  on_sample=on_sample)
+        self._reiniciar_estadisticas()
+        self._order_idx = None
+        self._pila = []
+        self._cerrados = []
+        self._pairs_total = len(board.get_pairs())
+        self._next_progress = self.start_time + self.progress_interval
+        self._progress_nodes = 0
+        self._progress_time = self.start_time
+
+        # Un tablero equivalente (rotado, reflejado o renombrado) ya resuelto
+        if self.solution_cache is not None:
+            cached = self.solution_cache.get(board, self.require_all_cells)
+            if cached is not None:
+                self.cache_hit = True
+                self.solutions_found = 1
+                self._debug_print("Solución recuperada de la caché")
+                if self.progress is not None:
+                    self._emitir_progreso("done", success=True)
+                return True, cached
+
+        success, paths = self._resolver_motor(board, resume_from)
+        if success and self.solution_cache is not None:
+            self.solution_cache.put(board, paths, self.require_all_cells)
+        if self.checkpoint_path is not None:
+            self._actualizar_checkpoint(board)
+        if self.progress is not None:
+            self._emitir_progreso("done", success=success)
+        return success, paths
+
+    def _reiniciar_estadisticas(self):
+        """Pone a cero lo que informa ``get_statistics()`` antes de cada búsqueda"""
         self.nodes_explored = 0
         self.solutions_found = 0
-        self.order_used = None            # reset
+        self.order_used = None
+        self.cache_hit = False
+        self.best_depth = 0
+        self.forced_cells = 0
+        self.forced_in_search = 0
+        self.nodes_by_order = {}
+        self.search_state = None
+        self._aborted = False
+        if self.profile is not None:
+            self.profile.reset()
+        self.transposition = TranspositionTable(self.tt_size) if self.tt_size else None
+        if self.profile is not None and self.transposition is not None:
+            self.transposition.contains = self.profile.timed(
+                "transposicion", self.transposition.contains, hit=bool)
+
+    def resume(self, checkpoint):
+        """
+        Continúa una búsqueda guardada con ``checkpoint_path``
+
+        Se adoptan las opciones de búsqueda del punto de control
+        (require_all_cells, movimientos forzados, heurísticas, tamaño de la
+        tabla de transposición); el límite de tiempo, la cancelación y
+        ``checkpoint_path`` son los de este solver. Si vuelve a cortarse, el
+        nuevo estado se guarda igual que en ``resolver_tablero``.
+
+        Args:
+            checkpoint: Ruta del archivo o tupla (tablero, estado) de
+                ``load_checkpoint``
+
+        Returns:
+            tuple: (éxito, caminos) como ``resolver_tablero``
+        """
+        if isinstance(checkpoint, tuple):
+            board, state = checkpoint
+        else:
+            board, state = load_checkpoint(checkpoint)
+        self.engine = "exhaustivo"
+        self.portfolio = False
+        self.require_all_cells = state["require_all_cells"]
+        self.forced_moves = state["forced_moves"]
+        self.orders = list(state["orders"])
+        self.tt_size = state["tt_size"]
+        return self.resolver_tablero(board, resume_from=state)
 
+    def _actualizar_checkpoint(self, board):
+        """Guarda el estado de una búsqueda cortada o borra el de una terminada"""
+        if self.search_state is not None:
+            save_checkpoint(self.checkpoint_path, board, self.search_state)
+        elif self._deadline.reason is None and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
+    def _resolver_motor(self, board, resume_from=None):
+        """Resuelve con el motor y las heurísticas configurados"""
         pairs = board.get_pairs()
-        paths = []
+        if resume_from is not None:
+            self._validar_reanudacion(board, resume_from)
 
         self._debug_print("=== BÚSQUEDA EXHAUSTIVA ===")
         self._debug_print(f"Tablero: {board.rows}x{board.cols}")
         self._debug_print(f"Pares: {len(pairs)}")
         self._debug_print(f"Tiempo límite: {self.time_limit}s")
 
-        # Lista de funciones / listas de ordenación
-        orderings = [
-            self._order_by_distance,
-            self._order_by_border_preference,
-            self._order_by_flexibility,
-            list(reversed(self._order_by_distance(pairs, board)))
-        ]
+        if self._motor_efectivo() == "bitboard":
+            return self._resolver_bitboard(board, pairs)
 
-        # Probar cada heurística hasta éxito o tiempo agotado
-        for order_idx, ordering_func in enumerate(orderings):
-            if time.time() - self.start_time > self.time_limit:
-                break
+        orderings = self._ordenaciones(pairs, board)
 
-            self._debug_print(f"\n--- Probando orden {order_idx + 1} ({self.order_names[order_idx]}) ---")
+        if self.portfolio:
+            return self._resolver_portafolio(board, orderings)
 
-            sorted_pairs = (
-                ordering_func(pairs, board) if callable(ordering_func) else ordering_func
-            )
+        # Al reanudar se salta a la heurística que se estaba probando
+        if resume_from is not None:
+            resumed = self.order_names.index(resume_from["order"])
+            while orderings[0][0] != resumed:
+                orderings.pop(0)
 
-            self._debug_print("Orden de pares:")
-            for i, (start, end, num) in enumerate(sorted_pairs):
-                dist = abs(start[0] - end[0]) + abs(start[1] - end[1])
-                self._debug_print(f"  {i+1}. Número {num}: {start} -> {end} (dist: {dist})")
+        # Probar cada heurística hasta éxito o tiempo agotado
+        for order_idx, sorted_pairs in orderings:
+            if self._deadline.expired():
+                break
 
-            # Copia fresca del tablero
-            working_board = board.copy()
-            paths_copy = []
+            nodes_before = self.nodes_explored
+            self._order_idx = order_idx
+            if self.progress is not None:
+                self._emitir_progreso("order")
+            paths_copy = self._resolver_con_orden(board, sorted_pairs, order_idx, resume_from)
+            resume_from = None
+            self.nodes_by_order[self.order_names[order_idx]] = self.nodes_explored - nodes_before
 
-            if self._resolver_exhaustivo(0, working_board, sorted_pairs, paths_copy):
+            if paths_copy is not None:
                 self.order_used = order_idx          # << registro de heurística ganadora
+                self.solutions_found = 1
                 self._debug_print(f"\n¡SOLUCIÓN ENCONTRADA con orden {order_idx + 1} ({self.order_names[order_idx]})!")
                 return True, paths_copy
 
@@ -90,6 +317,309 @@ class NumberLinkSolver:
         self._debug_print(f"Nodos explorados: {self.nodes_explored}")
         return False, []
 
+    # ------------------------------------------------------------------------- #
+    # EVENTOS DE PROGRESO
+    # ------------------------------------------------------------------------- #
+    def _emitir_progreso(self, kind, **extra):
+        """
+        Envía un evento a ``self.progress``
+
+        Cada evento es un diccionario con ``type`` ("order" al empezar cada
+        heurística, "progress" como mucho cada ``progress_interval`` segundos
+        y "done" al terminar), ``elapsed``, ``nodes``, ``nodes_per_sec``
+        (desde el evento "progress" anterior), ``order`` (heurística en
+        curso), ``depth`` (caminos colocados por la búsqueda en la rama
+        actual), ``best_depth`` (máximo de ``depth`` hasta ahora),
+        ``pairs_routed`` (pares unidos en la rama actual, contando los de los
+        movimientos forzados) y ``pairs_total``. "done" añade
+        ``success`` y ``stop_reason``.
+
+        Solo el motor exhaustivo sin portafolio informa de la profundidad; en
+        los demás casos se emiten únicamente "order" y "done".
+        """
+        now = time.perf_counter()
+        interval = now - self._progress_time
+        nodes = self.nodes_explored
+        depth = sum(1 for frame in self._pila if frame.placed)
+        event = {
+            "type": kind,
+            "elapsed": now - self.start_time,
+            "nodes": nodes,
+            "nodes_per_sec": (nodes - self._progress_nodes) / interval if interval > 0 else 0.0,
+            "order": None if self._order_idx is None else self.order_names[self._order_idx],
+            "depth": depth,
+            "best_depth": self.best_depth,
+            "pairs_routed": depth + len(self._cerrados),
+            "pairs_total": self._pairs_total,
+        }
+        if kind == "done":
+            event["stop_reason"] = self._deadline.reason
+        event.update(extra)
+        if kind == "progress":
+            self._progress_nodes = nodes
+            self._progress_time = now
+        self.progress(event)
+
+    def _muestrear_progreso(self, now):
+        """``on_sample`` del plazo: emite "progress" si ya toca"""
+        if now >= self._next_progress:
+            self._next_progress = now + self.progress_interval
+            self._emitir_progreso("progress")
+
+    # ------------------------------------------------------------------------- #
+    # PERFILADO
+    # ------------------------------------------------------------------------- #
+    def _instrumentar(self):
+        """
+        Sustituye en esta instancia los métodos del camino caliente por
+        envoltorios de ``self.profile``
+
+        Fases: enumeración de candidatos, poda global (acierto = rama
+        cortada), movimientos forzados (acierto = estado imposible) y su
+        deshacer, orden dinámico, marcado, desmarcado, comprobación de
+        completitud y tabla de transposición (acierto = estado conocido).
+        Por nivel se cuentan nodos, nodos expandidos, cortes por la cota de
+        celdas libres y el histograma de candidatos generados. Los procesos
+        del portafolio y el motor bitboard no se perfilan.
+        """
+        profile = self.profile
+        timed = profile.timed
+        self._poda_global = timed("poda_global", self._poda_global, hit=lambda ok: not ok)
+        self._forzar = timed("forzados", self._forzar, hit=lambda result: result[0] is None)
+        self._deshacer_forzados = timed("deshacer_forzados", self._deshacer_forzados)
+        self._elegir_par_mrv = timed("mrv", self._elegir_par_mrv)
+        self._marcar_camino = timed("marcado", self._marcar_camino)
+        self._desmarcar_camino = timed("desmarcado", self._desmarcar_camino)
+        self._tablero_completo = timed("completitud", self._tablero_completo,
+                                       hit=lambda complete: not complete)
+
+        resolver_con_orden = self._resolver_con_orden
+        entrar = self._entrar
+        clock = time.perf_counter
+
+        def resolver_con_orden_medido(board, sorted_pairs, order_idx, resume_from=None):
+            profile.order = self.order_names[order_idx]
+            start = clock()
+            try:
+                return resolver_con_orden(board, sorted_pairs, order_idx, resume_from)
+            finally:
+                profile.add_total(clock() - start)
+
+        def entrar_medido(idx, board, pairs):
+            count_pruned = idx < len(pairs) and board.empty_count < self._min_free_cells[idx]
+            depth = len(self._pila)
+            result = entrar(idx, board, pairs)
+            if self._aborted and self._pendiente:
+                return result          # El plazo venció antes de visitar el nodo
+            expanded = len(self._pila) > depth
+            profile.node(idx, expanded, count_pruned)
+            if expanded:
+                frame = self._pila[-1]
+                frame.candidates = profile.timed_candidates(idx, frame.candidates)
+            return result
+
+        self._resolver_con_orden = resolver_con_orden_medido
+        self._entrar = entrar_medido
+
+    def _motor_efectivo(self):
+        """Motor que resuelve de verdad (ver ENGINES)"""
+        if self.engine == "bitboard" and self.require_all_cells:
+            return "bitboard"
+        return "exhaustivo"
+
+    def _validar_reanudacion(self, board, state):
+        """ValueError si ``state`` no procede de este tablero y configuración"""
+        if self._motor_efectivo() != "exhaustivo" or self.portfolio:
+            raise ValueError("Solo se puede reanudar el motor exhaustivo sin portafolio")
+        if state["puzzle"] != board.puzzle_hash():
+            raise ValueError("El estado de búsqueda corresponde a otro tablero")
+        if state["require_all_cells"] != self.require_all_cells or \
+                state["forced_moves"] != self.forced_moves:
+            raise ValueError("El estado de búsqueda se generó con otra configuración")
+        names = self.order_names if self.orders is None else self.orders
+        if state["order"] not in names:
+            raise ValueError(f"La heurística {state['order']!r} no está seleccionada")
+
+    def _ordenaciones(self, pairs, board):
+        """
+        Pares ordenados por cada heurística seleccionada
+
+        Returns:
+            list: Tuplas (indice_en_order_names, lista_de_pares)
+        """
+        builders = [
+            lambda: self._order_by_distance(pairs, board),
+            lambda: self._order_by_border_preference(pairs, board),
+            lambda: self._order_by_flexibility(pairs, board),
+            lambda: list(reversed(self._order_by_distance(pairs, board))),
+            # El orden dinámico reordena en cada nivel; se parte de flexibilidad
+            lambda: self._order_by_flexibility(pairs, board),
+        ]
+        names = self.order_names if self.orders is None else self.orders
+        selected = [self.order_names.index(name) for name in names]
+        return [(order_idx, builders[order_idx]()) for order_idx in selected]
+
+    def _resolver_con_orden(self, board, sorted_pairs, order_idx, resume_from=None):
+        """
+        Ejecuta el backtracking con un orden de pares fijo
+
+        ``resume_from`` es un ``search_state`` de esta misma heurística: se
+        recupera la tabla de transposición y la pila se reconstruye antes de
+        seguir buscando.
+
+        Returns:
+            list | None: Caminos encontrados o None si no hubo solución
+        """
+        self._debug_print(f"\n--- Probando orden {order_idx + 1} ({self.order_names[order_idx]}) ---")
+
+        self._debug_print("Orden de pares:")
+        for i, (start, end, num) in enumerate(sorted_pairs):
+            dist = abs(start[0] - end[0]) + abs(start[1] - end[1])
+            self._debug_print(f"  {i+1}. Número {num}: {start} -> {end} (dist: {dist})")
+
+        # Copia fresca del tablero
+        working_board = board.copy()
+        paths_copy = []
+        sorted_pairs = list(sorted_pairs)
+        self._dynamic_order = self.order_names[order_idx] == "dinamico"
+        self._aborted = False
+        # Un estado sin salida solo se reaprovecha dentro de la misma heurística
+        if self.transposition is not None:
+            self.transposition.clear()
+            if resume_from is not None:
+                self.transposition.load(resume_from["transposition"])
+
+        # Preproceso: se fijan las celdas forzadas y se buscan caminos solo
+        # entre las cabezas resultantes
+        self._prefijos = {number: ([start], [end]) for start, end, number in sorted_pairs}
+        self._cerrados = []
+        self.forced_cells = 0
+        if self.forced_moves != "ninguno":
+            sorted_pairs, undo = self._forzar(working_board, sorted_pairs, 0)
+            if sorted_pairs is None:
+                return None
+            self.forced_cells = undo[3]
+            self._debug_print(f"Celdas fijadas por movimientos forzados: {self.forced_cells}")
+        self._min_free_cells = self._cota_celdas_libres(sorted_pairs)
+
+        if not self._poda_global(working_board, sorted_pairs, 0):
+            return None
+
+        # La búsqueda empieza con la pila vacía y el nivel 0 por visitar
+        self._pila = []
+        self._pendiente = True
+        if resume_from is not None:
+            self._reconstruir_pila(working_board, sorted_pairs, paths_copy,
+                                   resume_from["positions"], resume_from["pending"])
+        if self._resolver_exhaustivo(working_board, sorted_pairs, paths_copy):
+            return self._componer_caminos(working_board, paths_copy)
+        if self._aborted:
+            self.search_state = {
+                "order": self.order_names[order_idx],
+                "orders": list(self.order_names if self.orders is None else self.orders),
+                "positions": [frame.position for frame in self._pila],
+                "pending": self._pendiente,
+                "puzzle": board.puzzle_hash(),
+                "require_all_cells": self.require_all_cells,
+                "forced_moves": self.forced_moves,
+                "tt_size": self.tt_size,
+                "transposition": (
+                    [] if self.transposition is None else self.transposition.keys()
+                ),
+            }
+        return None
+
+    def _resolver_portafolio(self, board, orderings):
+        """
+        Lanza cada orden heurística en su propio proceso y se queda con la
+        primera solución. Al llegar una solución se avisa a los demás procesos
+        para que terminen; los que no respondan a tiempo se matan.
+        """
+        ctx = multiprocessing.get_context()
+        stop_event = ctx.Event()
+        results = ctx.Queue()
+        workers = {}
+        for order_idx, sorted_pairs in orderings:
+            proc = ctx.Process(
+                target=_trabajador_portafolio,
+                args=(board, sorted_pairs, order_idx, self._deadline.remaining(),
+                      self.require_all_cells, self.tt_size, self.forced_moves,
+                      stop_event, results),
+                daemon=True,
+            )
+            proc.start()
+            workers[order_idx] = proc
+
+        solution = None
+        pending = dict(workers)
+        grace_until = None
+        while pending:
+            # Una cancelación local se reenvía a los procesos
+            if self._deadline.expired() and not stop_event.is_set():
+                stop_event.set()
+            # Tras una solución, cancelación o agotado el tiempo solo se espera un margen corto
+            if stop_event.is_set() and grace_until is None:
+                grace_until = time.perf_counter() + self.PORTFOLIO_GRACE
+            if grace_until is not None and time.perf_counter() >= grace_until:
+                break
+            try:
+                order_idx, paths, nodes, tt_stats, forced = results.get(timeout=self.PORTFOLIO_POLL)
+            except queue.Empty:
+                # Un proceso muerto sin publicar (p. ej. matado por falta de
+                # memoria) no llegará a responder: no se le espera más
+                for idx, proc in list(pending.items()):
+                    if proc.exitcode not in (None, 0):
+                        self._debug_print(f"Orden {idx + 1} terminó sin resultado "
+                                          f"(código {proc.exitcode})")
+                        del pending[idx]
+                continue
+            pending.pop(order_idx, None)
+            self.nodes_by_order[self.order_names[order_idx]] = nodes
+            self.nodes_explored += nodes
+            self.forced_in_search += forced[1]
+            if tt_stats is not None and self.transposition is not None:
+                self.transposition.hits += tt_stats["hits"]
+                self.transposition.misses += tt_stats["misses"]
+                self.transposition.evictions += tt_stats["evictions"]
+            if paths is not None and solution is None:
+                solution = paths
+                self.order_used = order_idx
+                self.forced_cells = forced[0]
+                stop_event.set()
+                self._debug_print(f"\n¡SOLUCIÓN ENCONTRADA con orden {order_idx + 1} ({self.order_names[order_idx]})!")
+
+        stop_event.set()
+        for proc in workers.values():
+            proc.join(timeout=self.PORTFOLIO_GRACE)
+            if proc.is_alive():
+                proc.terminate()
+                proc.join()
+
+        if solution is None:
+            self._debug_print("\n=== NO SE ENCONTRÓ SOLUCIÓN ===")
+            self._debug_print(f"Nodos explorados: {self.nodes_explored}")
+            return False, []
+        self.solutions_found = 1
+        return True, solution
+
+    def _resolver_bitboard(self, board, pairs):
+        """Resuelve con el motor de bitboards (ordenación dinámica propia)"""
+        self._debug_print("\n--- Motor bitboard ---")
+        engine = BitboardEngine(
+            board, pairs,
+            require_all_cells=self.require_all_cells,
+            deadline=self._deadline,
+        )
+        paths = engine.solve()
+        self.nodes_explored = engine.nodes_explored
+        if paths is None:
+            self._debug_print("\n=== NO SE ENCONTRÓ SOLUCIÓN ===")
+            self._debug_print(f"Nodos explorados: {self.nodes_explored}")
+            return False, []
+        self._debug_print("\n¡SOLUCIÓN ENCONTRADA con el motor bitboard!")
+        self.solutions_found = 1
+        return True, paths
+
     # ------------------------------------------------------------------------- #
     # HEURÍSTICAS DE ORDEN DE PARES
     # ------------------------------------------------------------------------- #
@@ -119,10 +649,10 @@ class NumberLinkSolver:
         def flex(pair):
             start, end, _ = pair
             start_deg = len(
-                [n for n in board.get_neighbors(*start) if board.grid[n[0]][n[1]] == Board.EMPTY]
+                [n for n in board.get_neighbors(*start) if board.get_cell(*n) == Board.EMPTY]
             )
             end_deg = len(
-                [n for n in board.get_neighbors(*end) if board.grid[n[0]][n[1]] == Board.EMPTY]
+                [n for n in board.get_neighbors(*end) if board.get_cell(*n) == Board.EMPTY]
             )
             return min(start_deg, end_deg)
         return sorted(pairs, key=flex)
@@ -130,123 +660,616 @@ class NumberLinkSolver:
     # ------------------------------------------------------------------------- #
     # BACKTRACKING EXHAUSTIVO
     # ------------------------------------------------------------------------- #
-    def _resolver_exhaustivo(self, idx, board, pairs, paths):
-        if time.time() - self.start_time > self.time_limit:
-            self._debug_print("Tiempo límite alcanzado", idx)
+    def _resolver_exhaustivo(self, board, pairs, paths):
+        """
+        Backtracking iterativo sobre la pila explícita ``self._pila``
+
+        Cada nivel es un ``SearchFrame`` con el iterador de candidatos de su
+        par; el candidato en curso está marcado en el tablero. Si
+        ``self._pendiente`` es True falta entrar en el nivel siguiente a la
+        cima. Al cortarse por tiempo o cancelación la pila queda intacta, de
+        modo que la búsqueda se puede continuar volviendo a llamar a este
+        método (o reconstruirse con ``_reconstruir_pila``).
+
+        Returns:
+            bool: True si ``paths`` contiene una solución
+        """
+        stack = self._pila
+        deadline = self._deadline
+        tt = self.transposition
+        while True:
+            if self._pendiente:
+                self._pendiente = False
+                if self._entrar(len(stack), board, pairs):
+                    return True
+                if self._aborted:
+                    return False
+            if not stack:
+                return False
+
+            frame = stack[-1]
+            if frame.placed:
+                self._retirar(frame, board, pairs, paths)
+            # Los candidatos descartados por la poda no llegan a entrar en un
+            # nivel: también se comprueba el plazo entre candidatos
+            if deadline.tick():
+                self._aborted = True
+                return False
+            if frame.candidates is None:
+                frame.candidates = self._regenerar_candidatos(frame, board, pairs)
+            path = next(frame.candidates, None)
+
+            if path is None:
+                # La enumeración de candidatos también se corta al vencer el
+                # plazo: el nivel se conserva y se regenerará al reanudar
+                if deadline.reason is not None:
+                    frame.candidates = None
+                    self._aborted = True
+                    return False
+                # Solo se registra si la rama se exploró completa
+                if tt is not None:
+                    tt.add(board.state_hash())
+                stack.pop()
+                continue
+
+            frame.position += 1
+            self._pendiente = self._colocar(frame, path, board, pairs, paths)
+
+    def _entrar(self, idx, board, pairs):
+        """
+        Visita el nodo del nivel ``idx``: comprueba las podas y, si sigue
+        abierto, apila su ``SearchFrame``
+
+        Returns:
+            bool: True solo si el nodo es una solución completa
+        """
+        # El reloj y la cancelación solo se consultan cada pocos nodos
+        if self._deadline.tick():
+            if not self._aborted:
+                self._debug_print(f"Búsqueda detenida ({self._deadline.reason})", idx)
+            self._aborted = True
+            self._pendiente = True
             return False
 
         self.nodes_explored += 1
         if self.nodes_explored % 5000 == 0:
             self._debug_print(f"Progreso: {self.nodes_explored} nodos", idx)
+        if idx > self.best_depth:
+            self.best_depth = idx
 
         # Caso base
         if idx == len(pairs):
-            if self.require_all_cells and not board.is_complete():
+            return not self.require_all_cells or self._tablero_completo(board)
+
+        # Poda por conteo: no quedan celdas libres suficientes para los pares pendientes
+        if board.empty_count < self._min_free_cells[idx]:
+            return False
+
+        # Estado ya explorado sin éxito por otro camino
+        tt = self.transposition
+        if tt is not None and tt.contains(board.state_hash()):
+            return False
+
+        if self._dynamic_order:
+            best = self._elegir_par_mrv(board, pairs, idx)
+            if best is None:
                 return False
-            return True
+            self._intercambiar_par(pairs, idx, best)
 
         start, end, number = pairs[idx]
         if self.debug and (idx < 2 or self.nodes_explored % 1000 == 1):
             self._debug_print(f"Nodo {self.nodes_explored}: Par {idx+1}/{len(pairs)} Nº{number}", idx)
 
-        caminos = self._buscar_caminos_exhaustivo(start, end, board, number)
-        if not caminos:
+        # Los caminos se consumen de uno en uno: si una rama tiene éxito no se
+        # generan los candidatos restantes
+        candidates = self._iterar_caminos(start, end, board, number, self._deadline)
+        self._pila.append(SearchFrame(idx, candidates, board.trail_depth()))
+        return False
+
+    def _colocar(self, frame, path, board, pairs, paths):
+        """
+        Marca el candidato ``path`` del nivel ``frame`` y aplica los
+        movimientos forzados y la poda global sobre los pares pendientes
+
+        Returns:
+            bool: True si hay que entrar en el nivel siguiente
+        """
+        idx = frame.idx
+        self._marcar_camino(path, board)
+        paths.append(path)
+        frame.placed = True
+        if self.forced_moves != "nodo":
+            # Poda de conectividad y bolsas aisladas sobre todos los pares pendientes
+            return self._poda_global(board, pairs, idx + 1)
+
+        pending, undo = self._forzar(board, pairs, idx + 1)
+        if pending is None:
+            frame.forced = (undo, None, None)
             return False
+        self.forced_in_search += undo[3]
+        frame.forced = (undo, pairs[idx + 1:], self._min_free_cells[idx + 1:])
+        pairs[idx + 1:] = pending
+        self._min_free_cells[idx + 1:] = self._cota_celdas_libres(pending)
+        return self._poda_global(board, pairs, idx + 1)
 
-        for path in caminos:
-            self._marcar_camino(path, board)
-            paths.append(path)
+    def _retirar(self, frame, board, pairs, paths):
+        """Deshace el candidato en curso de ``frame`` (y sus movimientos forzados)"""
+        if frame.forced is not None:
+            undo, saved_pairs, saved_bounds = frame.forced
+            if saved_pairs is not None:
+                pairs[frame.idx + 1:] = saved_pairs
+                self._min_free_cells[frame.idx + 1:] = saved_bounds
+            self._deshacer_forzados(board, undo)
+            frame.forced = None
+        while board.trail_depth() > frame.mark:
+            self._desmarcar_camino(paths[-1], board)
+        paths.pop()
+        frame.placed = False
 
-            # Poda rápida de conectividad para 1-2 pares siguientes
-            ok = True
-            for nxt in pairs[idx+1:idx+3]:
-                if not self._conectividad_basica(nxt[0], nxt[1], board, nxt[2]):
-                    ok = False
-                    break
+    def _regenerar_candidatos(self, frame, board, pairs):
+        """
+        Iterador de candidatos de ``frame`` ya avanzado ``frame.position``
+        posiciones (el tablero debe estar como al entrar en el nivel)
+        """
+        start, end, number = pairs[frame.idx]
+        candidates = self._iterar_caminos(start, end, board, number, self._deadline)
+        skipped = sum(1 for _ in islice(candidates, frame.position))
+        if skipped < frame.position and self._deadline.reason is None:
+            raise ValueError("El estado de búsqueda no corresponde a este tablero")
+        return candidates
 
-            if ok and self._resolver_exhaustivo(idx + 1, board, pairs, paths):
-                return True
+    def _reconstruir_pila(self, board, pairs, paths, positions, pending):
+        """
+        Rehace la pila de un ``search_state`` recolocando el candidato elegido
+        en cada nivel
 
-            self._desmarcar_camino(path, board)
-            paths.pop()
+        La enumeración, el orden dinámico y los movimientos forzados son
+        deterministas, así que basta con la posición de cada nivel. Los
+        iteradores quedan a None y se regeneran cuando su nivel vuelve a la
+        cima. No cuenta nodos ni consulta el plazo.
+        """
+        stack = self._pila
+        last = len(positions) - 1
+        for idx, position in enumerate(positions):
+            if self._dynamic_order:
+                best = self._elegir_par_mrv(board, pairs, idx)
+                if best is None:
+                    raise ValueError("El estado de búsqueda no corresponde a este tablero")
+                self._intercambiar_par(pairs, idx, best)
+            frame = SearchFrame(idx, None, board.trail_depth())
+            frame.position = position
+            stack.append(frame)
+            if idx == last and not pending:
+                break
+            start, end, number = pairs[idx]
+            candidates = self._iterar_caminos(start, end, board, number)
+            path = next(islice(candidates, position - 1, None), None)
+            if path is None:
+                raise ValueError("El estado de búsqueda no corresponde a este tablero")
+            self._colocar(frame, path, board, pairs, paths)
+        self._pendiente = pending
 
-        return False
+    def _tablero_completo(self, board):
+        """True si no queda ninguna celda vacía"""
+        return board.is_complete()
+
+    def _elegir_par_mrv(self, board, pairs, idx):
+        """
+        Índice (>= idx) del par pendiente más restringido en el tablero actual
+
+        Se usa el menor número de salidas utilizables de sus extremos (celdas
+        vacías o el otro extremo) y, a igualdad, la menor distancia. Devuelve
+        None si algún par tiene un extremo sin salidas.
+        """
+        cells = board.cells
+        neighbors = board.neighbors
+        cols = board.cols
+        empty = Board.EMPTY
+        best = None
+        best_key = None
+        for i in range(idx, len(pairs)):
+            start, end, _ = pairs[i]
+            if start == end:
+                return i
+            a = start[0] * cols + start[1]
+            b = end[0] * cols + end[1]
+            deg_a = sum(1 for n in neighbors[a] if cells[n] == empty or n == b)
+            deg_b = sum(1 for n in neighbors[b] if cells[n] == empty or n == a)
+            degree = min(deg_a, deg_b)
+            if degree == 0:
+                return None
+            key = (degree, abs(start[0] - end[0]) + abs(start[1] - end[1]))
+            if best_key is None or key < best_key:
+                best, best_key = i, key
+        return best
+
+    def _intercambiar_par(self, pairs, idx, best):
+        """
+        Lleva el par elegido por MRV al nivel ``idx``
+
+        La cota de celdas libres de los niveles siguientes depende de qué
+        pares quedan detrás, así que se recalcula con el nuevo orden.
+        """
+        if best == idx:
+            return
+        pairs[idx], pairs[best] = pairs[best], pairs[idx]
+        self._min_free_cells[idx + 1:] = self._cota_celdas_libres(pairs[idx + 1:])
+
+    def _cota_celdas_libres(self, pairs):
+        """
+        Para cada índice i, mínimo de celdas vacías que consumirán los pares[i:]
+
+        Un camino entre extremos a distancia Manhattan d ocupa al menos d-1
+        celdas intermedias, que hoy están vacías.
+        """
+        suffix = [0] * (len(pairs) + 1)
+        for i in range(len(pairs) - 1, -1, -1):
+            start, end, _ = pairs[i]
+            dist = abs(start[0] - end[0]) + abs(start[1] - end[1])
+            suffix[i] = suffix[i + 1] + max(0, dist - 1)
+        return suffix
 
     # ------------------------------------------------------------------------- #
-    # GENERACIÓN DE CAMINOS (BFS AMPLIO)
+    # MOVIMIENTOS FORZADOS
     # ------------------------------------------------------------------------- #
-    def _buscar_caminos_exhaustivo(self, start, end, board, number):
-        if start == end:
-            return [[start]]
+    def _forzar(self, board, pairs, first):
+        """
+        Aplica movimientos forzados a pairs[first:] hasta un punto fijo
 
-        max_paths = 200
-        manhattan = abs(start[0] - end[0]) + abs(start[1] - end[1])
-        max_len = manhattan * 8 + 15
+        - Una cabeza con una única salida (celda vacía o la otra cabeza del
+          par) avanza por ella; sin ninguna, el estado es imposible.
+        - Si no hay que cubrir el tablero, dos cabezas vecinas del mismo par
+          se unen directamente: cualquier otro camino entre ellas solo ocupa
+          más celdas.
+        - Si hay que cubrir el tablero, una celda vacía con menos de dos
+          vecinos utilizables (vacíos o cabezas) hace el estado imposible, y
+          una con exactamente dos, uno de ellos una cabeza, es el siguiente
+          paso de esa cabeza.
 
-        res = []
-        queue = [(start, [start], {start})]
+        Al avanzar, la celda de la cabeza pasa a VISITED y la nueva toma el
+        número (``push_values``), y el prefijo del par crece en
+        ``self._prefijos``. Los pares unidos salen de la lista y se anotan en
+        ``self._cerrados``.
 
-        while queue and len(res) < max_paths:
-            cur, path, visited = queue.pop(0)
-            if len(path) > max_len:
-                continue
-            if cur == end:
-                res.append(path)
+        Returns:
+            tuple: (pares_pendientes o None si el estado es imposible,
+            deshacer). ``deshacer`` es [marcas, [(numero, lado)], cerrados
+            previos, celdas fijadas] y se pasa a ``_deshacer_forzados``.
+        """
+        cols = board.cols
+        cells = board.cells
+        neighbors = board.neighbors
+        empty = Board.EMPTY
+        visited = Board.VISITED
+        require = self.require_all_cells
+        prefixes = self._prefijos
+        closed = self._cerrados
+        undo = [0, [], len(closed), 0]
+
+        def advance(pair, side, cell):
+            head = pair[side]
+            number = pair[2]
+            board.push_values([
+                (head // cols, head % cols, visited),
+                (cell // cols, cell % cols, number),
+            ])
+            prefixes[number][side].append((cell // cols, cell % cols))
+            undo[0] += 1
+            undo[1].append((number, side))
+            undo[3] += 1
+            pair[side] = cell
+
+        pending = [
+            [start[0] * cols + start[1], end[0] * cols + end[1], number]
+            for start, end, number in pairs[first:]
+        ]
+        grid = BitGrid.for_size(board.rows, cols) if require else None
+
+        progress = True
+        while progress and pending:
+            progress = False
+            survivors = []
+            for pair in pending:
+                joined = False
+                for side in (0, 1):
+                    while True:
+                        head = pair[side]
+                        other = pair[1 - side]
+                        exits = [cell for cell in neighbors[head] if cells[cell] == empty]
+                        touching = other in neighbors[head]
+                        if touching and (not require or not exits):
+                            joined = True
+                        elif not exits:
+                            return None, undo
+                        elif len(exits) == 1 and not touching:
+                            advance(pair, side, exits[0])
+                            progress = True
+                            continue
+                        break
+                    if joined:
+                        break
+                if joined:
+                    # El par queda cerrado; su número entra en el hash igual
+                    # que si se hubiera colocado con push_path
+                    board.push_values([], label=pair[2])
+                    undo[0] += 1
+                    closed.append(pair[2])
+                    progress = True
+                else:
+                    survivors.append(pair)
+            pending = survivors
+
+            if require and pending and not progress:
+                heads = 0
+                for a, b, _ in pending:
+                    heads |= (1 << a) | (1 << b)
+                free = board.empty_mask
+                at_least_two, at_least_three = grid.neighbor_counts(free | heads)
+                if free & ~at_least_two:
+                    return None, undo
+                corridors = free & ~at_least_three
+                for pair in pending if corridors else ():
+                    for side in (0, 1):
+                        forced = grid.neighbors(1 << pair[side]) & corridors
+                        if forced:
+                            advance(pair, side, (forced & -forced).bit_length() - 1)
+                            progress = True
+                            break
+                    if progress:
+                        break
+
+        return [
+            ((a // cols, a % cols), (b // cols, b % cols), number)
+            for a, b, number in pending
+        ], undo
+
+    def _deshacer_forzados(self, board, undo):
+        """Revierte un ``_forzar``: tablero, prefijos y pares cerrados"""
+        marks, extended, closed_before, _ = undo
+        for _ in range(marks):
+            board.pop_path()
+        for number, side in reversed(extended):
+            self._prefijos[number][side].pop()
+        del self._cerrados[closed_before:]
+
+    def _componer_caminos(self, board, paths):
+        """
+        Caminos completos de la solución: cada camino buscado entre cabezas se
+        une a los prefijos fijados por los movimientos forzados, y se añaden
+        los pares que los movimientos forzados cerraron
+        """
+        result = []
+        for path in paths:
+            start_prefix, end_prefix = self._prefijos[board.get_cell(*path[0])]
+            result.append(start_prefix[:-1] + path + end_prefix[-2::-1])
+        for number in self._cerrados:
+            start_prefix, end_prefix = self._prefijos[number]
+            result.append(start_prefix + end_prefix[::-1])
+        return result
+
+    # ------------------------------------------------------------------------- #
+    # CONTEO DE SOLUCIONES
+    # ------------------------------------------------------------------------- #
+    def count_solutions(self, board, limit=None):
+        """
+        Cuenta las soluciones distintas del tablero (hasta ``limit`` si se indica)
+
+        Usa el mismo backtracking por pares, pero con todos los caminos
+        candidatos de cada par (sin MAX_PATHS) y memorizando cuántas
+        soluciones completa cada estado intermedio: dos ramas que llegan al
+        mismo tablero con los mismos pares colocados solo se exploran una vez.
+        Respeta ``require_all_cells``, el límite de tiempo y la cancelación; si
+        la búsqueda se corta, el resultado es una cota inferior y
+        ``get_statistics()["stop_reason"]`` lo indica.
+
+        Returns:
+            int: Número de soluciones encontradas (como mucho ``limit``)
+        """
+        self.start_time = time.perf_counter()
+        self._deadline = Deadline(self.time_limit, self.cancel_token, start=self.start_time)
+        self._reiniciar_estadisticas()
+
+        # Orden fijo: el conjunto de pares colocados queda determinado por el
+        # nivel, así que el hash del tablero identifica el subproblema
+        pairs = self._order_by_flexibility(board.get_pairs(), board)
+        working_board = board.copy()
+        self._min_free_cells = self._cota_celdas_libres(pairs)
+
+        if self._poda_global(working_board, pairs, 0):
+            self.solutions_found = self._contar_soluciones(0, working_board, pairs, limit, {})
+        self._debug_print(f"Soluciones: {self.solutions_found} (nodos: {self.nodes_explored})")
+        return self.solutions_found
+
+    def is_unique(self, board):
+        """
+        True si el tablero tiene exactamente una solución (se detiene en la
+        segunda). Si la búsqueda se corta antes de terminar, devuelve False.
+        """
+        return self.count_solutions(board, limit=2) == 1 and self._deadline.reason is None
+
+    def _contar_soluciones(self, idx, board, pairs, limit, memo):
+        """
+        Soluciones que completan el estado actual a partir de pairs[idx]
+
+        ``memo`` guarda el conteo exacto por hash de estado; los resultados
+        truncados por ``limit`` o por el plazo no se guardan.
+        """
+        if self._deadline.tick():
+            self._aborted = True
+            return 0
+        self.nodes_explored += 1
+
+        if idx == len(pairs):
+            if self.require_all_cells and not board.is_complete():
+                return 0
+            return 1
+        if board.empty_count < self._min_free_cells[idx]:
+            return 0
+
+        key = board.state_hash()
+        cached = memo.get(key)
+        if cached is not None:
+            return cached if limit is None else min(cached, limit)
+
+        start, end, number = pairs[idx]
+        cols = board.cols
+        free = board.empty_mask
+        total = 0
+        truncated = False
+        for path in iter_all_paths(board, start, end, number):
+            if self._deadline.tick():
+                self._aborted = True
+                break
+            # La poda se evalúa sobre el bitset antes de marcar el camino
+            used = 0
+            for r, c in path[1:-1]:
+                used |= 1 << (r * cols + c)
+            if not self._poda_global(board, pairs, idx + 1, free=free & ~used):
                 continue
-            for nbr in board.get_neighbors(*cur):
-                if nbr not in visited and board.is_valid_move(nbr[0], nbr[1], number):
-                    queue.append((nbr, path + [nbr], visited | {nbr}))
+            self._marcar_camino(path, board)
+            remaining = None if limit is None else limit - total
+            total += self._contar_soluciones(idx + 1, board, pairs, remaining, memo)
+            self._desmarcar_camino(path, board)
+            if limit is not None and total >= limit:
+                truncated = True
+                break
 
-        res.sort(key=len)
-        return res
+        if not truncated and not self._aborted:
+            memo[key] = total
+        return total
 
     # ------------------------------------------------------------------------- #
-    # PODA DE CONECTIVIDAD
+    # GENERACIÓN DE CAMINOS (BÚSQUEDA BIDIRECCIONAL)
     # ------------------------------------------------------------------------- #
-    def _conectividad_basica(self, start, end, board, number):
-        if start == end:
-            return True
+    MAX_PATHS = 200
 
-        visited = {start}
-        q = deque([start])
-        checks = 0
-        max_checks = board.rows * board.cols * 3
+    def _iterar_caminos(self, start, end, board, number, deadline=None):
+        """
+        Generador de hasta MAX_PATHS caminos candidatos, del más corto al más largo
 
-        while q and checks < max_checks:
-            cur = q.popleft()
-            checks += 1
-            for nbr in board.get_neighbors(*cur):
-                if nbr == end:
-                    return True
-                if nbr not in visited and board.is_valid_move(nbr[0], nbr[1], number):
-                    visited.add(nbr)
-                    q.append(nbr)
-        return False
+        Los caminos crecen desde los dos extremos a la vez (ver
+        ``iter_paths_bidirectional``). Con ``deadline`` la enumeración se
+        corta al vencer el plazo.
+        """
+        manhattan = abs(start[0] - end[0]) + abs(start[1] - end[1])
+        max_len = manhattan * 8 + 15
+        return iter_paths_bidirectional(board, start, end, number, max_len=max_len,
+                                        max_paths=self.MAX_PATHS, deadline=deadline)
+
+    # ------------------------------------------------------------------------- #
+    # PODA GLOBAL
+    # ------------------------------------------------------------------------- #
+    def _poda_global(self, board, pairs, first, free=None):
+        """
+        Comprueba en una sola pasada que los pares pendientes (pairs[first:])
+        siguen siendo resolubles
+
+        Se etiquetan las regiones de celdas vacías con un flood-fill sobre el
+        bitset ``board.empty_mask``. Cada par pendiente necesita una región que
+        toque sus dos extremos (o extremos vecinos). Si hay que cubrir todas
+        las celdas, además cada región debe poder ser recorrida por algún par
+        pendiente y toda celda vacía necesita al menos dos vecinos utilizables
+        (vacíos o extremos pendientes), porque será una celda intermedia.
+
+        ``free`` permite evaluar un estado hipotético (el bitset de celdas
+        vacías tras colocar un camino) sin marcarlo en el tablero.
+
+        Returns:
+            bool: False si el estado actual no puede llevar a una solución
+        """
+        grid = BitGrid.for_size(board.rows, board.cols)
+        if free is None:
+            free = board.empty_mask
+        cols = board.cols
+
+        pending = []
+        routed = []
+        ends = 0
+        for start, end, _ in pairs[first:]:
+            if start == end:
+                continue
+            a = 1 << (start[0] * cols + start[1])
+            b = 1 << (end[0] * cols + end[1])
+            pending.append((a, b))
+            routed.append(bool(grid.neighbors(a) & b))
+            ends |= a | b
+
+        if self.require_all_cells and free:
+            at_least_two, _ = grid.neighbor_counts(free | ends)
+            if free & ~at_least_two:
+                return False
+
+        for region in grid.regions(free):
+            border = grid.neighbors(region)
+            served = False
+            for i, (a, b) in enumerate(pending):
+                if border & a and border & b:
+                    routed[i] = True
+                    served = True
+            if self.require_all_cells and not served:
+                return False
+
+        return all(routed)
 
     # ------------------------------------------------------------------------- #
     # UTILIDADES DE MARCADO / DESMARCADO
     # ------------------------------------------------------------------------- #
     def _marcar_camino(self, path, board):
-        for r, c in path:
-            if board.original_grid[r][c] == Board.EMPTY:
-                board.mark_cell(r, c, Board.VISITED)
+        # Las celdas modificadas quedan en el trail del tablero; el número del
+        # par (valor del extremo inicial) entra en el hash del estado
+        start = path[0]
+        board.push_path(path, Board.VISITED, label=board.get_cell(*start))
 
     def _desmarcar_camino(self, path, board):
-        for r, c in path:
-            if board.original_grid[r][c] == Board.EMPTY:
-                board.unmark_cell(r, c)
+        # Deshace el último camino marcado (orden LIFO del backtracking)
+        board.pop_path()
 
     # ------------------------------------------------------------------------- #
     # ESTADÍSTICAS
     # ------------------------------------------------------------------------- #
     def get_statistics(self):
-        elapsed = time.time() - self.start_time if self.start_time else 0
+        elapsed = time.perf_counter() - self.start_time if self.start_time else 0
         return {
             "nodes_explored": self.nodes_explored,
             "solutions_found": self.solutions_found,
             "time_elapsed": elapsed,
             "order_used": self.order_used,
+            "engine": self._motor_efectivo(),
+            "stop_reason": None if self._deadline is None else self._deadline.reason,
+            "cache_hit": self.cache_hit,
+            "forced_cells": self.forced_cells,
+            "forced_in_search": self.forced_in_search,
+            "nodes_by_order": dict(self.nodes_by_order),
+            "transposition": (
+                None if self.transposition is None else self.transposition.get_statistics()
+            ),
             "order_name": (
                 None if self.order_used is None else self.order_names[self.order_used]
-            )
-        }
\ No newline at end of file
+            ),
+            "profile": None if self.profile is None else self.profile.to_dict(),
+        }
+
+
+def _trabajador_portafolio(board, sorted_pairs, order_idx, time_limit,
+                           require_all_cells, tt_size, forced_moves, stop_event, results):
+    """
+    Proceso del portafolio: resuelve con un único orden y publica el resultado
+
+    ``time_limit`` es el tiempo que le queda al proceso principal (los relojes
+    perf_counter no son comparables entre procesos) y ``stop_event`` actúa
+    como aviso de cancelación compartido. El resultado se publica siempre,
+    también si la búsqueda lanza una excepción (sin solución).
+    """
+    solver = NumberLinkSolver(time_limit=time_limit, require_all_cells=require_all_cells,
+                              tt_size=tt_size, cancel_token=CancellationToken(stop_event),
+                              forced_moves=forced_moves)
+    solver.start_time = time.perf_counter()
+    solver._deadline = Deadline(time_limit, solver.cancel_token, start=solver.start_time)
+    solver.transposition = TranspositionTable(tt_size) if tt_size else None
+    paths = None
+    try:
+        paths = solver._resolver_con_orden(board, sorted_pairs, order_idx)
+    finally:
+        tt_stats = None if solver.transposition is None else solver.transposition.get_statistics()
+        forced = (solver.forced_cells, solver.forced_in_search)
+        results.put((order_idx, paths, solver.nodes_explored, tt_stats, forced))
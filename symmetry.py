@@ -0,0 +1,100 @@
+"""
+Simetrías del tablero y forma canónica de un puzzle de NumberLink
+
+Dos puzzles son equivalentes si uno se obtiene del otro con una de las 8
+simetrías del cuadrado (rotaciones y reflexiones) y un renombrado de los
+números. La forma canónica es el representante mínimo de esa clase: se
+transforma cada par, se ordenan los pares por posición y los números pasan a
+ser el orden resultante, de modo que el renombrado desaparece.
+"""
+
+import hashlib
+
+# Simetrías: (r, c) en un tablero rows x cols -> celda del tablero transformado
+SYMMETRIES = (
+    "identidad",
+    "rotacion_90",
+    "rotacion_180",
+    "rotacion_270",
+    "espejo_horizontal",
+    "traspuesta",
+    "espejo_vertical",
+    "antitraspuesta",
+)
+
+# Simetría inversa de cada una (las rotaciones de 90 y 270 se deshacen entre sí)
+INVERSE = (0, 3, 2, 1, 4, 5, 6, 7)
+
+
+def transformed_size(sym, rows, cols):
+    """Dimensiones (filas, columnas) del tablero tras aplicar ``sym``"""
+    if sym in (1, 3, 5, 7):
+        return cols, rows
+    return rows, cols
+
+
+def transform_cell(cell, sym, rows, cols):
+    """Celda (r, c) de un tablero rows x cols tras aplicar la simetría ``sym``"""
+    r, c = cell
+    if sym == 0:
+        return r, c
+    if sym == 1:
+        return c, rows - 1 - r
+    if sym == 2:
+        return rows - 1 - r, cols - 1 - c
+    if sym == 3:
+        return cols - 1 - c, r
+    if sym == 4:
+        return r, cols - 1 - c
+    if sym == 5:
+        return c, r
+    if sym == 6:
+        return rows - 1 - r, c
+    return cols - 1 - c, rows - 1 - r
+
+
+def _transformed_pairs(board, sym):
+    """Pares transformados como tuplas ((celda_menor, celda_mayor), numero), ordenados"""
+    pairs = []
+    for number, ends in board.number_positions.items():
+        cells = sorted(transform_cell(cell, sym, board.rows, board.cols) for cell in ends)
+        pairs.append((tuple(cells), number))
+    pairs.sort()
+    return pairs
+
+
+def canonical_form(board):
+    """
+    Forma canónica del puzzle
+
+    Returns:
+        tuple: (clave, simetria, renombrado). ``clave`` es
+        ``(filas, columnas, pares)`` con los pares como tuplas de celdas
+        ordenadas y sin números; ``simetria`` es el índice en SYMMETRIES que
+        lleva el tablero a la forma canónica y ``renombrado`` asocia cada
+        número original con su número canónico (1..n).
+    """
+    best = None
+    for sym in range(len(SYMMETRIES)):
+        rows, cols = transformed_size(sym, board.rows, board.cols)
+        pairs = _transformed_pairs(board, sym)
+        key = (rows, cols, tuple(cells for cells, _ in pairs))
+        if best is None or key < best[0]:
+            relabel = {number: i for i, (_, number) in enumerate(pairs, 1)}
+            best = (key, sym, relabel)
+    return best
+
+
+def canonical_hash(board):
+    """
+    Huella hexadecimal de la forma canónica
+
+    Es estable entre procesos y ejecuciones, así que sirve como clave en disco.
+    """
+    key, _, _ = canonical_form(board)
+    return hash_key(key)
+
+
+def hash_key(key):
+    """Huella hexadecimal de una clave de ``canonical_form``"""
+    return hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
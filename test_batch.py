@@ -0,0 +1,53 @@
+"""
+Pruebas de la resolución en lote y de la CLI
+"""
+
+import json
+import os
+import tempfile
+
+from batch_solver import expand_inputs, iter_batch
+import numberlink
+
+
+def test_expandir_entradas():
+    """Patrones y directorios se expanden a archivos sin duplicados"""
+    files = expand_inputs(["ejemplo*.txt", "ejemplo1.txt"])
+    assert files == ["ejemplo1.txt", "ejemplo2.txt", "ejemplo3.txt"]
+
+
+def test_lote_en_paralelo():
+    """El lote resuelve con varios procesos y marca los archivos erróneos"""
+    print("=== Test: Lote en paralelo ===")
+    files = ["example.txt", "generated_4x4_easy.txt", "no_existe.txt"]
+    results = {r["file"]: r for r in iter_batch(files, workers=2, time_limit=30,
+                                                 engine="bitboard")}
+    for name, result in sorted(results.items()):
+        print(f"  {name}: {'ÉXITO' if result['success'] else 'FALLO'} {result['error'] or ''}")
+
+    assert results["example.txt"]["success"]
+    assert set(results["example.txt"]["paths"]) == {"1", "2", "3", "4", "5"}
+    assert results["generated_4x4_easy.txt"]["success"]
+    assert not results["no_existe.txt"]["success"]
+    assert results["no_existe.txt"]["error"].startswith("FileNotFoundError")
+
+
+def test_cli_solve():
+    """`python -m numberlink solve` escribe una línea JSON por tablero"""
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, "resultados.jsonl")
+        code = numberlink.main(["solve", "generated_*.txt", "-j", "1",
+                                "--time-limit", "10", "-o", output])
+        with open(output) as f:
+            lines = [json.loads(line) for line in f]
+
+    assert code == 0
+    assert sorted(r["file"] for r in lines) == expand_inputs(["generated_*.txt"])
+    assert all(r["success"] for r in lines)
+
+
+if __name__ == "__main__":
+    test_expandir_entradas()
+    test_lote_en_paralelo()
+    test_cli_solve()
+    print("\nTodas las pruebas del lote pasaron")
@@ -0,0 +1,50 @@
+"""
+Pruebas del benchmark reproducible
+"""
+
+import benchmark
+
+
+def test_corpus_reproducible():
+    """La misma semilla genera el mismo corpus"""
+    first = benchmark.generate_corpus([4, 5], [0.15], per_config=2, seed=3)
+    second = benchmark.generate_corpus([4, 5], [0.15], per_config=2, seed=3)
+    assert [b.puzzle_hash() for _, _, b in first] == [b.puzzle_hash() for _, _, b in second]
+    assert [(s, d) for s, d, _ in first] == [(4, 0.15)] * 2 + [(5, 0.15)] * 2
+
+
+def test_percentil_rango_mas_cercano():
+    """Rango ceil(p * n): en un límite exacto no se redondea hacia arriba"""
+    values = list(range(1, 21))
+    assert benchmark._percentile(values, 0.95) == 19
+    assert benchmark._percentile(values, 0.5) == 10
+    assert benchmark._percentile(values, 0.96) == 20
+    assert benchmark._percentile(values, 0.0) == 1
+    assert benchmark._percentile(values, 1.0) == 20
+    assert benchmark._percentile([7], 0.95) == 7
+
+
+def test_regresiones_contra_linea_base():
+    """Solo se reportan empeoramientos por encima de la tolerancia"""
+    print("=== Test: Comparación con línea base ===")
+    report = benchmark.benchmark_report(sizes=[4], densities=[0.15], per_config=1, repeat=1,
+                                        time_limit=5, configs=["bitboard"],
+                                        require_modes=[False])
+    result = report["results"][0]
+    print(f"Resultado: {result}")
+    assert result["boards"] == 1
+    assert result["median_time"] <= result["p95_time"]
+
+    assert benchmark.compare_to_baseline(report["results"], report) == []
+
+    faster = dict(result, median_time=result["median_time"] / 10 - 1.0, solved=result["solved"] + 1)
+    regressions = benchmark.compare_to_baseline(report["results"], {"results": [faster]})
+    print(f"Regresiones: {regressions}")
+    assert len(regressions) == 2
+
+
+if __name__ == "__main__":
+    test_corpus_reproducible()
+    test_percentil_rango_mas_cercano()
+    test_regresiones_contra_linea_base()
+    print("\nTodas las pruebas del benchmark pasaron")
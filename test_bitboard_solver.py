@@ -0,0 +1,97 @@
+"""
+Pruebas del motor de bitboards
+"""
+
+import time
+from board import Board
+from board_generator import BoardGenerator
+from solver import NumberLinkSolver
+from loader import load_board_from_file
+from solution_check import check_solution
+
+
+def test_ejemplos_incluidos():
+    """El motor bitboard resuelve los ejemplos 7x7 incluidos"""
+    print("=== Test: Motor bitboard con los ejemplos ===")
+    for filename, require_all_cells in [
+        ("example.txt", True),
+        ("ejemplo1.txt", True),
+        ("ejemplo3.txt", False),
+        ("generated_7x7_hard.txt", False),
+    ]:
+        board = Board(*load_board_from_file(filename))
+        solver = NumberLinkSolver(time_limit=30, require_all_cells=require_all_cells,
+                                  engine="bitboard")
+        start_time = time.time()
+        success, paths = solver.resolver_tablero(board)
+        print(f"  {filename}: {'ÉXITO' if success else 'FALLO'} "
+              f"({time.time() - start_time:.3f}s, {solver.nodes_explored} nodos)")
+        assert success
+        # Sin cobertura total resuelve el motor exhaustivo
+        expected = "bitboard" if require_all_cells else "exhaustivo"
+        assert solver.get_statistics()["engine"] == expected
+        check_solution(board, paths, require_all_cells)
+
+
+def test_generados_grandes():
+    """Tableros generados de 12x12 y 14x14, cubriendo todo y sin cubrir, en poco tiempo"""
+    print("\n=== Test: Motor bitboard en tableros generados grandes ===")
+    for size in (12, 14):
+        board = BoardGenerator(size, size, seed=1,
+                               method="constructivo").generate_with_difficulty("hard")
+        for require_all_cells in (True, False):
+            if size == 14 and require_all_cells:
+                continue    # Fuera del alcance de ambos motores en pocos segundos
+            solver = NumberLinkSolver(time_limit=30, require_all_cells=require_all_cells,
+                                      engine="bitboard")
+            start_time = time.time()
+            success, paths = solver.resolver_tablero(board)
+            elapsed = time.time() - start_time
+            print(f"  {size}x{size} require_all_cells={require_all_cells}: {elapsed:.3f}s, "
+                  f"{solver.nodes_explored} nodos")
+            assert success
+            assert elapsed < 2
+            check_solution(board, paths, require_all_cells)
+
+
+def test_coincide_con_exhaustivo():
+    """Ambos motores coinciden en tableros sin solución con cobertura total"""
+    print("\n=== Test: Motor bitboard vs exhaustivo ===")
+    board = Board(*load_board_from_file("generated_6x6_hard.txt"))
+    for engine in NumberLinkSolver.ENGINES:
+        solver = NumberLinkSolver(time_limit=30, require_all_cells=True, engine=engine)
+        success, _ = solver.resolver_tablero(board)
+        print(f"  {engine}: {'ÉXITO' if success else 'FALLO'} (esperado: FALLO)")
+        assert not success
+
+
+def test_tablero_grande():
+    """La búsqueda no depende de la pila de Python: un nivel por celda en 40x40"""
+    print("\n=== Test: Motor bitboard en 40x40 ===")
+    n = 40
+    board_data = [[0] * n for _ in range(n)]
+    board_data[0][0] = board_data[n - 1][0] = 1
+    board = Board(board_data, {1: [(0, 0), (n - 1, 0)]})
+    solver = NumberLinkSolver(time_limit=30, require_all_cells=True, engine="bitboard")
+    success, paths = solver.resolver_tablero(board)
+    print(f"  {'ÉXITO' if success else 'FALLO'} ({solver.nodes_explored} nodos)")
+    assert success
+    check_solution(board, paths, True)
+
+
+def test_motor_desconocido():
+    """Un motor inexistente se rechaza al construir el solver"""
+    try:
+        NumberLinkSolver(engine="sat")
+    except ValueError:
+        return
+    assert False, "Se esperaba ValueError"
+
+
+if __name__ == "__main__":
+    test_ejemplos_incluidos()
+    test_generados_grandes()
+    test_coincide_con_exhaustivo()
+    test_tablero_grande()
+    test_motor_desconocido()
+    print("\nTodas las pruebas del motor bitboard pasaron")
@@ -0,0 +1,169 @@
+"""
+Pruebas de la representación plana del tablero
+"""
+
+from board import Board
+
+
+def _tablero_3x3():
+    board_data = [
+        [1, 0, 2],
+        [0, 0, 0],
+        [1, 0, 2]
+    ]
+    number_positions = {
+        1: [(0, 0), (2, 0)],
+        2: [(0, 2), (2, 2)]
+    }
+    return Board(board_data, number_positions)
+
+
+def test_api_compatible():
+    """La API clásica sigue funcionando sobre el arreglo plano"""
+    print("=== Test: API del tablero ===")
+    board = _tablero_3x3()
+
+    assert board.grid == [[1, 0, 2], [0, 0, 0], [1, 0, 2]]
+    assert board.is_valid_move(1, 1, 1)
+    assert board.is_valid_move(2, 0, 1)
+    assert not board.is_valid_move(0, 2, 1)
+    assert not board.is_valid_move(-1, 0, 1)
+    assert sorted(board.get_neighbors(0, 0)) == [(0, 1), (1, 0)]
+    assert len(board.get_neighbors(1, 1)) == 4
+
+    board.mark_cell(1, 1, Board.VISITED)
+    assert not board.is_valid_move(1, 1, 1)
+    assert str(board).splitlines()[1] == ". * ."
+    board.unmark_cell(1, 1)
+    assert board.get_cell(1, 1) == Board.EMPTY
+
+
+def test_push_pop_path():
+    """push_path/pop_path deshacen exactamente lo marcado, en orden LIFO"""
+    print("\n=== Test: Trail de deshacer ===")
+    board = _tablero_3x3()
+    before = list(board.cells)
+
+    board.push_path([(0, 0), (1, 0), (2, 0)])
+    board.push_path([(0, 2), (0, 1), (1, 1), (1, 2), (2, 2)])
+    assert board.get_cell(1, 0) == Board.VISITED
+    assert board.get_cell(0, 0) == 1  # Los extremos no se tocan
+    assert board.trail_depth() == 2
+
+    board.pop_path()
+    assert board.get_cell(1, 1) == Board.EMPTY
+    assert board.get_cell(1, 0) == Board.VISITED
+    board.pop_path()
+    assert list(board.cells) == before
+
+
+def test_push_values():
+    """push_values mueve la cabeza de un camino y se deshace con pop_path"""
+    print("\n=== Test: Movimiento de cabezas ===")
+    board = _tablero_3x3()
+    before = list(board.cells)
+    empty_before = board.empty_count
+
+    board.push_values([(0, 0, Board.VISITED), (1, 0, 1)])
+    assert board.get_cell(0, 0) == Board.VISITED
+    assert board.get_cell(1, 0) == 1
+    assert board.empty_count == empty_before - 1
+    assert board.state_hash() != 0
+
+    board.pop_path()
+    assert list(board.cells) == before
+    assert board.empty_count == empty_before
+    assert board.state_hash() == 0
+
+
+def test_copy_independiente():
+    """La copia no comparte estado mutable con el original"""
+    print("\n=== Test: Copia del tablero ===")
+    board = _tablero_3x3()
+    clone = board.copy()
+    clone.push_path([(0, 0), (1, 0), (2, 0)])
+    clone.number_positions[1].append((1, 1))
+
+    assert board.get_cell(1, 0) == Board.EMPTY
+    assert len(board.number_positions[1]) == 2
+    assert clone.original_grid == board.original_grid
+
+
+def test_contador_celdas_vacias():
+    """empty_count y empty_mask siguen a mark/unmark y push/pop"""
+    print("\n=== Test: Contador de celdas vacías ===")
+    board = _tablero_3x3()
+    assert board.empty_count == 5
+    assert not board.is_complete()
+
+    board.push_path([(0, 0), (1, 0), (2, 0)])
+    assert board.empty_count == 4
+    assert not board.empty_mask & (1 << board.index(1, 0))
+    board.push_path([(0, 2), (0, 1), (1, 1), (1, 2), (2, 2)])
+    board.mark_cell(2, 1, Board.VISITED)
+    assert board.empty_count == 0
+    assert board.empty_mask == 0
+    assert board.is_complete()
+
+    board.unmark_cell(2, 1)
+    board.pop_path()
+    board.pop_path()
+    assert board.empty_count == 5
+    assert board.empty_mask == _tablero_3x3().empty_mask
+
+
+def test_hash_zobrist():
+    """state_hash se mantiene de forma incremental y vuelve al valor inicial"""
+    print("\n=== Test: Hash Zobrist del estado ===")
+    board = _tablero_3x3()
+    assert board.state_hash() == 0
+
+    board.push_path([(0, 0), (1, 0), (2, 0)], label=1)
+    h1 = board.state_hash()
+    board.push_path([(0, 2), (1, 2), (2, 2)], label=2)
+    h2 = board.state_hash()
+    assert len({0, h1, h2}) == 3
+
+    # Mismas celdas con otra etiqueta dan otro hash
+    other = _tablero_3x3()
+    other.push_path([(0, 0), (1, 0), (2, 0)], label=2)
+    assert other.state_hash() != h1
+
+    # mark/unmark celda a celda es coherente con push/pop
+    board.mark_cell(1, 1, Board.VISITED)
+    assert board.state_hash() != h2
+    board.unmark_cell(1, 1)
+    assert board.state_hash() == h2
+
+    board.pop_path()
+    assert board.state_hash() == h1
+    board.pop_path()
+    assert board.state_hash() == 0
+
+
+def test_hash_del_puzzle():
+    """puzzle_hash no depende del orden de los pares y distingue puzzles"""
+    board = _tablero_3x3()
+    reordered = Board(
+        [[1, 0, 2], [0, 0, 0], [1, 0, 2]],
+        {2: [(2, 2), (0, 2)], 1: [(2, 0), (0, 0)]}
+    )
+    swapped = Board(
+        [[2, 0, 1], [0, 0, 0], [2, 0, 1]],
+        {1: [(0, 2), (2, 2)], 2: [(0, 0), (2, 0)]}
+    )
+    assert board.puzzle_hash() == reordered.puzzle_hash()
+    assert board.puzzle_hash() != swapped.puzzle_hash()
+    board.push_path([(0, 0), (1, 0), (2, 0)], label=1)
+    assert board.puzzle_hash() == reordered.puzzle_hash()
+
+
+if __name__ == "__main__":
+    test_api_compatible()
+    test_push_pop_path()
+    test_push_values()
+    test_copy_independiente()
+    test_contador_celdas_vacias()
+    test_hash_zobrist()
+    test_hash_del_puzzle()
+    print("\nTodas las pruebas del tablero pasaron")
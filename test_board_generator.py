@@ -0,0 +1,61 @@
+"""
+Pruebas del generador de tableros
+"""
+
+from board_generator import BoardGenerator
+from solution_check import is_path
+from solver import NumberLinkSolver
+
+
+def test_camino_hamiltoniano():
+    """El recorrido aleatorio visita cada celda una vez con pasos ortogonales"""
+    print("=== Test: Camino hamiltoniano aleatorio ===")
+    generator = BoardGenerator(8, 5, seed=1)
+    walk = generator._random_hamiltonian_path()
+    assert len(walk) == 64 and len(set(walk)) == 64
+    assert is_path(walk)
+    # Los movimientos backbite deshacen la serpiente inicial
+    assert walk[:8] != [(0, c) for c in range(8)]
+
+
+def test_tablero_constructivo():
+    """Los pares salen de una partición del tablero en caminos de 3+ celdas"""
+    print("\n=== Test: Tablero constructivo ===")
+    for difficulty in ("easy", "medium", "hard"):
+        generator = BoardGenerator(7, 6, seed=difficulty, method="constructivo")
+        board = generator.generate_with_difficulty(difficulty)
+        paths = generator.last_solution
+        print(f"{difficulty}: {len(paths)} pares, longitudes {sorted(map(len, paths))}")
+
+        cells = [cell for path in paths for cell in path]
+        assert len(cells) == len(set(cells)) == 49
+        for number, path in enumerate(paths, 1):
+            assert len(path) >= BoardGenerator.MIN_PATH_LEN and is_path(path)
+            assert board.number_positions[number] == [path[0], path[-1]]
+
+    assert len(BoardGenerator(7, 6, seed=0, method="constructivo").generate_with_difficulty("hard").get_pairs()) == 7
+    assert BoardGenerator(3, 4, seed=0, method="constructivo").generate_random_board() is None
+
+
+def test_tableros_resolubles():
+    """Todo tablero constructivo se resuelve cubriendo todas las celdas"""
+    print("\n=== Test: Resolubilidad por construcción ===")
+    for seed in range(5):
+        board = BoardGenerator(6, 5, seed=seed, method="constructivo").generate_random_board()
+        solver = NumberLinkSolver(time_limit=10, engine="bitboard", require_all_cells=True)
+        success, _ = solver.resolver_tablero(board)
+        assert success
+
+    # Sin method se mantiene el muestreo con rechazo de siempre
+    generator = BoardGenerator(4, 2, seed=0)
+    assert generator.method == "aleatorio"
+    board = generator.generate_random_board()
+    assert NumberLinkSolver(time_limit=10).resolver_tablero(board)[0]
+    assert generator.last_solution is None
+
+
+if __name__ == "__main__":
+    test_camino_hamiltoniano()
+    test_tablero_constructivo()
+    test_tableros_resolubles()
+    print("\nTodas las pruebas del generador pasaron")
@@ -0,0 +1,52 @@
+"""
+Pruebas de la generación masiva de tableros
+"""
+
+import os
+import tempfile
+
+from bulk_generator import iter_bulk, write_bulk
+from loader import iter_boards
+from symmetry import canonical_hash
+
+
+def test_generacion_sin_duplicados():
+    """Se escriben exactamente N puzzles distintos salvo simetría"""
+    print("=== Test: Generación masiva ===")
+    stats = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "corpus.txt")
+        written = write_bulk(
+            iter_bulk(5, 60, difficulty="easy", num_pairs=3, workers=1, chunk_size=20, stats=stats),
+            path, batch_size=7,
+        )
+        boards = list(iter_boards(path))
+    print(f"Escritos: {written}, estadísticas: {stats}")
+    assert written == len(boards) == 60
+    assert len({canonical_hash(board) for board in boards}) == 60
+    assert stats["duplicates"] > 0
+
+
+def test_reproducible_con_pool():
+    """El resultado no depende del número de procesos"""
+    print("\n=== Test: Generación reproducible ===")
+    inline = list(iter_bulk(5, 30, workers=1, chunk_size=10, seed=4))
+    pooled = list(iter_bulk(5, 30, workers=2, chunk_size=10, seed=4))
+    assert inline == pooled
+
+
+def test_filtro_de_unicidad():
+    """Con unique=True solo quedan puzzles de solución única"""
+    print("\n=== Test: Filtro de unicidad ===")
+    stats = {}
+    puzzles = list(iter_bulk(4, 5, num_pairs=3, workers=1, chunk_size=10, unique=True, stats=stats))
+    print(f"Estadísticas: {stats}")
+    assert len(puzzles) == 5
+    assert stats["not_unique"] > 0
+
+
+if __name__ == "__main__":
+    test_generacion_sin_duplicados()
+    test_reproducible_con_pool()
+    test_filtro_de_unicidad()
+    print("\nTodas las pruebas de generación masiva pasaron")
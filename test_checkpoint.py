@@ -0,0 +1,108 @@
+"""
+Pruebas de los puntos de control de la búsqueda
+"""
+
+import os
+import signal
+import tempfile
+import threading
+
+from batch_solver import solve_file
+from board import Board
+from board_generator import format_board
+from checkpoint import CheckpointFormatError, cancel_on_signals, load_checkpoint
+from deadline import CancellationToken
+from loader import load_board_from_file
+from solver import NumberLinkSolver
+from test_deadline import _tablero_dificil
+from test_new_solver import _AvisoTrasNodos
+
+
+def test_ida_y_vuelta():
+    """El estado guardado se lee igual y el archivo corrupto se rechaza"""
+    print("=== Test: Punto de control en disco ===")
+    board = _tablero_dificil()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "dificil.nlck")
+        solver = NumberLinkSolver(time_limit=0.5, require_all_cells=True, checkpoint_path=path)
+        assert solver.resolver_tablero(board) == (False, [])
+        state = solver.search_state
+        print(f"Niveles: {len(state['positions'])}, claves: {len(state['transposition'])}, "
+              f"bytes: {os.path.getsize(path)}")
+        assert state["transposition"]
+
+        loaded_board, loaded_state = load_checkpoint(path)
+        assert loaded_board.puzzle_hash() == board.puzzle_hash()
+        assert loaded_state == state
+
+        with open(path, "r+b") as f:
+            f.truncate(os.path.getsize(path) - 1)
+        try:
+            load_checkpoint(path)
+        except CheckpointFormatError:
+            pass
+        else:
+            assert False, "Se esperaba CheckpointFormatError"
+
+
+def test_resolucion_por_tramos():
+    """Cortar y reanudar desde disco explora los mismos nodos que de una vez"""
+    print("\n=== Test: Resolución por tramos ===")
+    board = Board(*load_board_from_file("generated_7x7_hard.txt"))
+    options = dict(time_limit=30, require_all_cells=True, orders=["distancia"],
+                   forced_moves="ninguno")
+    solver = NumberLinkSolver(**options)
+    expected = solver.resolver_tablero(board)
+    nodes = solver.nodes_explored
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "tramos.nlck")
+        solver = NumberLinkSolver(checkpoint_path=path, **options)
+        solver.cancel_token = CancellationToken(_AvisoTrasNodos(solver, 3))
+        result = solver.resolver_tablero(board)
+        total, slices = solver.nodes_explored, 1
+        while os.path.exists(path):
+            # Otro proceso: solo conoce el archivo
+            solver = NumberLinkSolver(time_limit=30, checkpoint_path=path)
+            solver.cancel_token = CancellationToken(_AvisoTrasNodos(solver, 3))
+            result = solver.resume(path)
+            total += solver.nodes_explored
+            slices += 1
+    print(f"{nodes} nodos en {slices} tramos")
+    assert slices > 1
+    assert result == expected
+    assert total == nodes
+
+
+def test_senal_y_lote():
+    """Una señal guarda el punto de control; el lote lo continúa"""
+    print("\n=== Test: Señal y lote ===")
+    board = _tablero_dificil()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "senal.nlck")
+        solver = NumberLinkSolver(time_limit=60, require_all_cells=True, checkpoint_path=path)
+        timer = threading.Timer(0.2, os.kill, (os.getpid(), signal.SIGTERM))
+        with cancel_on_signals(solver):
+            timer.start()
+            assert solver.resolver_tablero(board) == (False, [])
+        timer.join()
+        assert solver.get_statistics()["stop_reason"] == "cancelled"
+        assert os.path.exists(path)
+
+        board_path = os.path.join(tmp, "dificil.txt")
+        with open(board_path, "w") as f:
+            f.write(format_board(board))
+        first = solve_file(board_path, time_limit=0.3, require_all_cells=True,
+                           checkpoint_dir=tmp)
+        second = solve_file(board_path, time_limit=0.3, require_all_cells=True,
+                            checkpoint_dir=tmp)
+        assert not first["resumed"] and first["checkpoint"]
+        assert second["resumed"] and second["checkpoint"] == first["checkpoint"]
+        assert os.path.exists(first["checkpoint"])
+
+
+if __name__ == "__main__":
+    test_ida_y_vuelta()
+    test_resolucion_por_tramos()
+    test_senal_y_lote()
+    print("\nTodas las pruebas de los puntos de control pasaron")
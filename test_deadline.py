@@ -0,0 +1,120 @@
+"""
+Pruebas del plazo de búsqueda y de la cancelación cooperativa
+"""
+
+import threading
+import time
+
+from board import Board
+from deadline import CancellationToken, Deadline
+from solver import NumberLinkSolver
+
+
+def _tablero_dificil():
+    """Tablero 10x10 que el solver exhaustivo no cierra en pocos segundos (todas las celdas)"""
+    positions = {
+        1: [(5, 1), (5, 3)], 2: [(8, 5), (2, 2)], 3: [(4, 6), (7, 0)],
+        4: [(8, 9), (9, 9)], 5: [(8, 6), (9, 4)], 6: [(4, 7), (1, 1)],
+        7: [(5, 6), (8, 4)], 8: [(6, 5), (1, 3)],
+    }
+    data = [[0] * 10 for _ in range(10)]
+    for number, cells in positions.items():
+        for r, c in cells:
+            data[r][c] = number
+    return Board(data, positions)
+
+
+def _tablero_12x12():
+    """Tablero 12x12 sin cubrir todas las celdas cuya unión de caminos parciales es costosa"""
+    positions = {
+        1: [(10, 5), (8, 3)], 2: [(2, 0), (4, 1)], 3: [(4, 2), (4, 3)],
+        4: [(2, 3), (3, 2)], 5: [(3, 8), (0, 9)], 6: [(7, 9), (5, 10)],
+        7: [(9, 3), (10, 1)], 8: [(6, 10), (7, 11)], 9: [(6, 11), (4, 9)],
+        10: [(3, 3), (9, 5)], 11: [(4, 4), (7, 8)], 12: [(4, 8), (3, 7)],
+        13: [(0, 8), (2, 4)],
+    }
+    data = [[0] * 12 for _ in range(12)]
+    for number, cells in positions.items():
+        for r, c in cells:
+            data[r][c] = number
+    return Board(data, positions)
+
+
+def test_deadline_basico():
+    """El plazo vence por tiempo o por cancelación y adapta su intervalo"""
+    print("=== Test: Deadline ===")
+    deadline = Deadline(time_limit=None)
+    for _ in range(10000):
+        assert not deadline.tick()
+    print(f"Intervalo tras 10000 nodos rápidos: {deadline.stride}")
+    assert deadline.stride > 1
+    assert deadline.remaining() is None
+
+    deadline = Deadline(time_limit=0.05)
+    while not deadline.tick():
+        pass
+    assert deadline.reason == "timeout"
+    assert deadline.elapsed() >= 0.05
+    assert deadline.tick()            # vencido, sigue informándolo
+
+    token = CancellationToken()
+    deadline = Deadline(time_limit=60, token=token)
+    assert not deadline.expired()
+    token.cancel()
+    assert deadline.expired() and deadline.cancelled
+
+
+def test_limite_de_tiempo():
+    """El solver respeta el límite de tiempo con un margen pequeño"""
+    print("\n=== Test: Límite de tiempo ===")
+    solver = NumberLinkSolver(time_limit=1, require_all_cells=True, orders=["distancia"])
+    start = time.perf_counter()
+    success, _ = solver.resolver_tablero(_tablero_dificil())
+    elapsed = time.perf_counter() - start
+    stats = solver.get_statistics()
+    print(f"Tiempo: {elapsed:.2f}s, motivo: {stats['stop_reason']}")
+    assert not success
+    assert stats["stop_reason"] == "timeout"
+    assert elapsed < 2
+
+    # La enumeración de caminos también consulta el plazo al unir las dos mitades
+    solver = NumberLinkSolver(time_limit=2)
+    start = time.perf_counter()
+    solver.resolver_tablero(_tablero_12x12())
+    elapsed = time.perf_counter() - start
+    print(f"12x12: {elapsed:.2f}s, motivo: {solver.get_statistics()['stop_reason']}")
+    assert elapsed < 2.5
+
+
+def test_cancelacion():
+    """Otro hilo puede abortar resolver_tablero en cualquier motor"""
+    print("\n=== Test: Cancelación ===")
+    board = _tablero_dificil()
+
+    # Aviso ya activado: no se explora nada
+    token = CancellationToken()
+    token.cancel()
+    solver = NumberLinkSolver(require_all_cells=True, cancel_token=token)
+    assert solver.resolver_tablero(board) == (False, [])
+    assert solver.nodes_explored == 0
+    assert solver.get_statistics()["stop_reason"] == "cancelled"
+
+    for options in ({"engine": "exhaustivo"}, {"engine": "exhaustivo", "portfolio": True}):
+        solver = NumberLinkSolver(time_limit=60, require_all_cells=True, **options)
+        timer = threading.Timer(0.2, solver.cancel)
+        timer.start()
+        start = time.perf_counter()
+        success, _ = solver.resolver_tablero(board)
+        elapsed = time.perf_counter() - start
+        timer.join()
+        print(f"{options}: cancelado en {elapsed:.2f}s")
+        assert not success
+        assert solver.get_statistics()["stop_reason"] == "cancelled"
+        assert elapsed < 5
+
+
+if __name__ == "__main__":
+    test_deadline_basico()
+    test_limite_de_tiempo()
+    test_cancelacion()
+    print("\nTodas las pruebas del plazo de búsqueda pasaron")
@@ -0,0 +1,69 @@
+"""
+Pruebas del cargador de tableros en texto
+"""
+
+import os
+import tempfile
+
+from loader import BoardFormatError, iter_boards, iter_puzzles, load_board_from_file
+
+
+def _error(lines):
+    """Mensaje y línea del BoardFormatError que provoca ``lines``"""
+    try:
+        list(iter_puzzles(lines, source="prueba.txt"))
+    except BoardFormatError as e:
+        print(f"  {e}")
+        return e.line, e.message
+    assert False, "Se esperaba BoardFormatError"
+
+
+def test_varios_puzzles():
+    """Cada línea de dos campos abre un puzzle; se toleran espacios y líneas vacías"""
+    print("=== Test: Archivo con varios puzzles ===")
+    lines = ["2, 2\n", "1,1,1\n", " 2 ,2, 1\n", "\n", "3,3\n", "1,1,1\n", "3,3,1\n"]
+    puzzles = list(iter_puzzles(lines))
+    assert len(puzzles) == 2
+    assert puzzles[0] == ([[1, 0], [0, 1]], {1: [(0, 0), (1, 1)]})
+    assert puzzles[1][1] == {1: [(0, 0), (2, 2)]}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "multi.txt")
+        with open(path, "w") as f:
+            f.writelines(lines)
+        assert [board.rows for board in iter_boards(path)] == [2, 3]
+        try:
+            load_board_from_file(path)
+        except BoardFormatError as e:
+            assert e.line == 5
+        else:
+            assert False, "Se esperaba BoardFormatError"
+
+
+def test_errores_con_numero_de_linea():
+    """Los errores indican la línea exacta del problema"""
+    print("\n=== Test: Errores de formato ===")
+    assert _error(["3,3\n", "1,1,1\n", "4,1,1\n"])[0] == 3          # fuera del tablero
+    assert _error(["3,3\n", "1,1,1\n", "1,1,2\n"])[0] == 3          # celda repetida
+    assert _error(["3,3\n", "1,1,1\n", "1,2,2\n", "3,3,1\n"])[0] == 3  # el 2 aparece una vez
+    assert _error(["3,3\n", "1,1,1\n", "1,2,1\n", "1,3,1\n"])[0] == 4  # el 1 aparece tres veces
+    assert _error(["1,1,1\n"])[0] == 1                               # falta la cabecera
+    assert _error(["3,3\n", "1,x,1\n"])[0] == 2                      # no es un entero
+    assert _error(["3,3\n", "1,1\n", "1,2,3,4\n"])[0] == 3           # campos de más
+    assert _error(["3,3\n", "1,1,0\n"])[0] == 2                      # número fuera de rango
+    line, message = _error(["3,3\n", "1,1,1\n", "2,2,1\n", "2,2\n", "1,1,7\n"])
+    assert line == 5 and "7" in message                              # fallo en el 2.º puzzle
+
+
+def test_ejemplos_del_repositorio():
+    """Los tableros incluidos siguen cargando igual"""
+    board_data, number_positions = load_board_from_file("example.txt")
+    assert len(board_data) == 7 and len(number_positions) == 5
+    assert all(len(positions) == 2 for positions in number_positions.values())
+
+
+if __name__ == "__main__":
+    test_varios_puzzles()
+    test_errores_con_numero_de_linea()
+    test_ejemplos_del_repositorio()
+    print("\nTodas las pruebas del cargador pasaron")
@@ -3,8 +3,14 @@ Pruebas específicas para el solver mejorado
 """
 
 from board import Board
+import solver as solver_module
 from solver import NumberLinkSolver
+from deadline import CancellationToken
 from loader import load_board_from_file
+from solution_check import check_solution
+import json
+import os
+import random
 import time
 
 def test_example_7x7_mejorado():
@@ -120,6 +126,312 @@ def test_impossible_board():
     
     return not success  # Éxito si no encuentra solución
 
+def test_portfolio_mode():
+    """El modo portafolio resuelve con procesos paralelos y reporta cada orden"""
+    print("\n=== Test: Modo portafolio ===")
+
+    board_data, number_positions = load_board_from_file("example.txt")
+    board = Board(board_data, number_positions)
+
+    solver = NumberLinkSolver(time_limit=30, require_all_cells=True, portfolio=True)
+    start_time = time.time()
+    success, paths = solver.resolver_tablero(board)
+    end_time = time.time()
+
+    stats = solver.get_statistics()
+    print(f"Resultado: {'ÉXITO' if success else 'FALLO'}")
+    print(f"Tiempo: {end_time - start_time:.3f}s")
+    print(f"Heurística ganadora: {stats['order_name']}")
+    print(f"Nodos por heurística: {stats['nodes_by_order']}")
+
+    assert success
+    assert stats["order_name"] in stats["nodes_by_order"]
+    assert stats["nodes_explored"] == sum(stats["nodes_by_order"].values())
+
+    check_solution(board, paths, require_all_cells=True)
+
+_trabajador_original = solver_module._trabajador_portafolio
+
+def _trabajador_que_falla(board, sorted_pairs, order_idx, *args):
+    """Orden 0: el proceso muere sin publicar; orden 1: la búsqueda lanza una excepción"""
+    if order_idx == 0:
+        os._exit(1)
+    if order_idx == 1:
+        sorted_pairs = None
+    _trabajador_original(board, sorted_pairs, order_idx, *args)
+
+def test_portafolio_con_procesos_caidos():
+    """Un proceso que muere o falla no hace esperar al portafolio hasta el límite"""
+    print("\n=== Test: Portafolio con procesos caídos ===")
+
+    # Sin solución: los procesos sanos terminan enseguida
+    board = Board([[1, 2, 0], [0, 0, 0], [2, 1, 0]], {1: [(0, 0), (2, 1)], 2: [(0, 1), (2, 0)]})
+    solver_module._trabajador_portafolio = _trabajador_que_falla
+    try:
+        solver = NumberLinkSolver(time_limit=30, require_all_cells=True, portfolio=True)
+        start_time = time.perf_counter()
+        success, _ = solver.resolver_tablero(board)
+        elapsed = time.perf_counter() - start_time
+    finally:
+        solver_module._trabajador_portafolio = _trabajador_original
+    print(f"Tiempo: {elapsed:.3f}s")
+    assert not success
+    assert elapsed < 10
+
+def test_poda_global():
+    """La poda global detecta bolsas aisladas, celdas sin salida y pares cortados"""
+    print("\n=== Test: Poda global ===")
+
+    board_data = [
+        [1, 0, 0, 2],
+        [0, 0, 0, 0],
+        [1, 0, 0, 2],
+        [0, 0, 0, 0]
+    ]
+    number_positions = {
+        1: [(0, 0), (2, 0)],
+        2: [(0, 3), (2, 3)]
+    }
+    board = Board(board_data, number_positions)
+    pairs = board.get_pairs()
+
+    solver = NumberLinkSolver(require_all_cells=True)
+    assert solver._poda_global(board, pairs, 0)
+
+    # Ocupar el centro de la fila 2 deja la fila 3 como bolsa que ningún par recorre
+    board.push_path([(2, 1), (2, 2)])
+    assert not solver._poda_global(board, pairs, 0)
+    assert NumberLinkSolver(require_all_cells=False)._poda_global(board, pairs, 0)
+    board.pop_path()
+
+    # (3,0) queda con un único vecino utilizable: callejón sin salida
+    board.push_path([(3, 1)])
+    assert not solver._poda_global(board, pairs, 0)
+    board.pop_path()
+
+    # El extremo (2,0) queda encerrado: el par 1 ya no puede conectarse
+    board.push_path([(1, 0), (1, 1), (1, 2), (1, 3), (3, 0), (3, 1), (3, 2), (3, 3)])
+    board.push_path([(2, 1), (2, 2)])
+    assert not NumberLinkSolver(require_all_cells=False)._poda_global(board, pairs, 0)
+
+def test_dynamic_ordering():
+    """El orden dinámico (MRV) se puede seleccionar y queda registrado"""
+    print("\n=== Test: Orden dinámico ===")
+
+    board_data, number_positions = load_board_from_file("example.txt")
+    board = Board(board_data, number_positions)
+
+    solver = NumberLinkSolver(time_limit=30, require_all_cells=True, orders=["dinamico"])
+    success, paths = solver.resolver_tablero(board)
+    stats = solver.get_statistics()
+    print(f"Resultado: {'ÉXITO' if success else 'FALLO'}")
+    print(f"Nodos explorados: {stats['nodes_explored']}")
+
+    assert success
+    assert stats["order_name"] == "dinamico"
+    assert list(stats["nodes_by_order"]) == ["dinamico"]
+
+    try:
+        NumberLinkSolver(orders=["aleatorio"])
+    except ValueError:
+        pass
+    else:
+        assert False, "Se esperaba ValueError"
+
+def _tablero_aleatorio(rng, n, num_pairs):
+    cells = rng.sample([(r, c) for r in range(n) for c in range(n)], 2 * num_pairs)
+    board_data = [[0] * n for _ in range(n)]
+    number_positions = {}
+    for number in range(1, num_pairs + 1):
+        a, b = cells[2 * number - 2], cells[2 * number - 1]
+        board_data[a[0]][a[1]] = board_data[b[0]][b[1]] = number
+        number_positions[number] = [a, b]
+    return Board(board_data, number_positions)
+
+def test_dinamico_completo():
+    """El orden dinámico encuentra solución si y solo si count_solutions la cuenta"""
+    print("\n=== Test: Completitud del orden dinámico ===")
+
+    # El par 2 pasa delante por MRV: la cota de celdas libres debe seguir al nuevo orden
+    board = Board([[0, 1, 2], [2, 1, 0], [0, 0, 0]], {1: [(0, 1), (1, 1)], 2: [(0, 2), (1, 0)]})
+    assert NumberLinkSolver(orders=["dinamico"], forced_moves="ninguno").resolver_tablero(board)[0]
+
+    rng = random.Random(0)
+    for _ in range(150):
+        board = _tablero_aleatorio(rng, rng.choice((3, 4)), rng.randint(2, 3))
+        for require_all_cells in (False, True):
+            count = NumberLinkSolver(time_limit=30, require_all_cells=require_all_cells
+                                     ).count_solutions(board)
+            for mode in ("ninguno", "nodo"):
+                solver = NumberLinkSolver(time_limit=30, require_all_cells=require_all_cells,
+                                          orders=["dinamico"], forced_moves=mode)
+                assert solver.resolver_tablero(board)[0] == (count > 0), str(board)
+
+def test_count_solutions():
+    """Conteo de soluciones con límite y comprobación de unicidad"""
+    print("\n=== Test: Conteo de soluciones ===")
+
+    # 3x3 vacío con un par en esquinas opuestas: 12 caminos simples, 2 hamiltonianos
+    board_data = [[1, 0, 0], [0, 0, 0], [0, 0, 1]]
+    board = Board(board_data, {1: [(0, 0), (2, 2)]})
+
+    solver = NumberLinkSolver(time_limit=30)
+    assert solver.count_solutions(board) == 12
+    assert solver.get_statistics()["solutions_found"] == 12
+    assert solver.count_solutions(board, limit=3) == 3
+    assert NumberLinkSolver(time_limit=30, require_all_cells=True).count_solutions(board) == 2
+    assert not NumberLinkSolver(time_limit=30, require_all_cells=True).is_unique(board)
+
+    # Las estadísticas del conteo no arrastran las de una resolución anterior
+    solver = NumberLinkSolver(time_limit=30, require_all_cells=True)
+    assert solver.resolver_tablero(Board(*load_board_from_file("example.txt")))[0]
+    assert solver.get_statistics()["nodes_by_order"]
+    solver.count_solutions(board)
+    stats = solver.get_statistics()
+    assert stats["nodes_by_order"] == {} and stats["order_used"] is None
+    assert stats["forced_cells"] == stats["forced_in_search"] == 0
+    assert stats["transposition"]["hits"] == stats["transposition"]["misses"] == 0
+
+    # El ejemplo 7x7 tiene solución única cubriendo todas las celdas
+    board = Board(*load_board_from_file("example.txt"))
+    solver = NumberLinkSolver(time_limit=30, require_all_cells=True)
+    unique = solver.is_unique(board)
+    print(f"example.txt único: {unique} ({solver.nodes_explored} nodos)")
+    assert unique
+
+def test_forced_moves():
+    """Los movimientos forzados fijan celdas antes y durante la búsqueda"""
+    print("\n=== Test: Movimientos forzados ===")
+
+    # En ejemplo1 el 1 parte de una esquina con una sola salida
+    board = Board(*load_board_from_file("ejemplo1.txt"))
+    for require in (False, True):
+        solver = NumberLinkSolver(time_limit=10, require_all_cells=require, forced_moves="raiz")
+        success, paths = solver.resolver_tablero(board)
+        stats = solver.get_statistics()
+        print(f"Todas las celdas={require}: fijadas {stats['forced_cells']}")
+        assert success
+        assert stats["forced_cells"] > 0
+        check_solution(board, paths, require)
+
+    # Mismo resultado en los tres modos sobre el ejemplo 7x7
+    board = Board(*load_board_from_file("example.txt"))
+    for mode in NumberLinkSolver.FORCED_MODES:
+        solver = NumberLinkSolver(time_limit=30, require_all_cells=True, forced_moves=mode)
+        success, paths = solver.resolver_tablero(board)
+        stats = solver.get_statistics()
+        print(f"Modo {mode}: {stats['nodes_explored']} nodos, "
+              f"{stats['forced_cells']} + {stats['forced_in_search']} celdas fijadas")
+        assert success
+        check_solution(board, paths, True)
+        if mode == "ninguno":
+            assert stats["forced_cells"] == stats["forced_in_search"] == 0
+
+    # Una esquina sin salida hace el tablero imposible sin buscar
+    board = Board([[1, 2, 0], [2, 0, 0], [0, 0, 1]], {1: [(0, 0), (2, 2)], 2: [(0, 1), (1, 0)]})
+    solver = NumberLinkSolver(time_limit=10)
+    assert solver.resolver_tablero(board) == (False, [])
+    assert solver.get_statistics()["nodes_explored"] == 0
+
+    try:
+        NumberLinkSolver(forced_moves="siempre")
+    except ValueError:
+        pass
+    else:
+        assert False, "Se esperaba ValueError"
+
+
+class _AvisoTrasNodos:
+    """Evento de cancelación que se activa cuando el solver explora ``nodes`` nodos"""
+
+    def __init__(self, solver, nodes):
+        self.solver = solver
+        self.nodes = nodes
+
+    def is_set(self):
+        return self.solver.nodes_explored >= self.nodes
+
+
+def _solver_con_pausa(nodes, **options):
+    solver = NumberLinkSolver(**options)
+    solver.cancel_token = CancellationToken(_AvisoTrasNodos(solver, nodes))
+    return solver
+
+
+def test_pausa_y_reanudacion():
+    """Una búsqueda cortada muchas veces y reanudada da el mismo resultado"""
+    print("\n=== Test: Pausa y reanudación ===")
+    boards = [
+        Board(*load_board_from_file("example.txt")),
+        Board(*load_board_from_file("generated_7x7_hard.txt")),
+    ]
+    for board in boards:
+        for order in ("distancia", "dinamico"):
+            for mode in ("ninguno", "nodo"):
+                options = dict(time_limit=30, require_all_cells=True, tt_size=0,
+                               orders=[order], forced_moves=mode)
+                solver = NumberLinkSolver(**options)
+                expected = solver.resolver_tablero(board)
+                nodes = solver.nodes_explored
+
+                state, total, pauses = None, 0, 0
+                while True:
+                    solver = _solver_con_pausa(2, **options)
+                    result = solver.resolver_tablero(board, resume_from=state)
+                    total += solver.nodes_explored
+                    state = solver.search_state
+                    if state is None:
+                        break
+                    state = json.loads(json.dumps(state))   # como si viniera de disco
+                    pauses += 1
+                print(f"{order}/{mode}: {nodes} nodos, {pauses} pausas")
+                assert result == expected
+                assert total == nodes
+
+    board = boards[0]
+    solver = _solver_con_pausa(2, require_all_cells=True, orders=["dinamico"])
+    solver.resolver_tablero(board)
+    state = solver.search_state
+    assert state is not None and state["order"] == "dinamico"
+    for options in ({"require_all_cells": False}, {"engine": "bitboard"}, {"orders": ["borde"]}):
+        try:
+            NumberLinkSolver(**dict({"require_all_cells": True}, **options)).resolver_tablero(
+                board, resume_from=state)
+        except ValueError:
+            pass
+        else:
+            assert False, "Se esperaba ValueError"
+
+
+def test_eventos_de_progreso():
+    """Con un oyente se reciben eventos de progreso; sin él no cambia nada"""
+    print("\n=== Test: Eventos de progreso ===")
+    from test_deadline import _tablero_dificil
+
+    events = []
+    solver = NumberLinkSolver(time_limit=0.5, require_all_cells=True, orders=["distancia"],
+                              progress=events.append, progress_interval=0.05)
+    assert solver.resolver_tablero(_tablero_dificil()) == (False, [])
+    kinds = [event["type"] for event in events]
+    print(f"Eventos: {len(events)}, último: {events[-1]}")
+    assert kinds[0] == "order" and kinds[-1] == "done"
+    assert kinds.count("progress") >= 3
+    progress = [event for event in events if event["type"] == "progress"]
+    assert all(a["nodes"] <= b["nodes"] for a, b in zip(progress, progress[1:]))
+    assert all(event["order"] == "distancia" and event["pairs_total"] == 8 for event in events)
+    assert all(event["depth"] <= event["best_depth"] <= 8 for event in progress)
+    assert events[-1]["stop_reason"] == "timeout" and not events[-1]["success"]
+    assert events[-1]["best_depth"] == solver.best_depth > 0
+
+    events = []
+    board = Board(*load_board_from_file("example.txt"))
+    solver = NumberLinkSolver(time_limit=30, require_all_cells=True, engine="bitboard",
+                              progress=events.append)
+    assert solver.resolver_tablero(board)[0]
+    assert [event["type"] for event in events] == ["done"]
+    assert events[0]["success"] and events[0]["stop_reason"] is None
+
+
 def run_all_tests():
     """Ejecuta todas las pruebas del solver mejorado"""
     print("="*60)
@@ -134,6 +446,29 @@ def run_all_tests():
     # Test de rendimiento
     test_performance_comparison()
     
+    # Test de la poda global
+    test_poda_global()
+
+    # Test del orden dinámico
+    test_dynamic_ordering()
+    test_dinamico_completo()
+
+    # Test del conteo de soluciones
+    test_count_solutions()
+
+    # Test de los movimientos forzados
+    test_forced_moves()
+
+    # Test de la pausa y reanudación de la búsqueda
+    test_pausa_y_reanudacion()
+
+    # Test de los eventos de progreso
+    test_eventos_de_progreso()
+
+    # Test del modo portafolio
+    test_portfolio_mode()
+    test_portafolio_con_procesos_caidos()
+
     # Test de tablero imposible
     results.append(("Tablero imposible", test_impossible_board()))
     
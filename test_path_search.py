@@ -0,0 +1,84 @@
+"""
+Pruebas del enumerador perezoso de caminos
+"""
+
+from board import Board
+from path_search import iter_all_paths, iter_paths, iter_paths_bidirectional
+
+
+def _tablero_vacio(rows, cols, start, end):
+    board_data = [[0] * cols for _ in range(rows)]
+    board_data[start[0]][start[1]] = 1
+    board_data[end[0]][end[1]] = 1
+    return Board(board_data, {1: [start, end]})
+
+
+def test_orden_por_longitud():
+    """Los caminos salen del más corto al más largo y son simples"""
+    print("=== Test: Orden de los caminos ===")
+    board = _tablero_vacio(3, 3, (0, 0), (2, 2))
+    paths = list(iter_paths(board, (0, 0), (2, 2), 1))
+
+    lengths = [len(p) for p in paths]
+    assert lengths == sorted(lengths)
+    assert lengths[0] == 5
+    assert len([p for p in paths if len(p) == 5]) == 6  # C(4,2) caminos mínimos
+    for path in paths:
+        assert path[0] == (0, 0) and path[-1] == (2, 2)
+        assert len(set(path)) == len(path)
+
+
+def test_limites_y_bloqueos():
+    """max_len y max_paths cortan la enumeración; las celdas ocupadas se evitan"""
+    print("\n=== Test: Límites del enumerador ===")
+    board = _tablero_vacio(3, 3, (0, 0), (0, 2))
+    assert all(len(p) <= 5 for p in iter_paths(board, (0, 0), (0, 2), 1, max_len=5))
+    assert len(list(iter_paths(board, (0, 0), (0, 2), 1, max_paths=2))) == 2
+
+    board.push_path([(0, 1), (1, 1)])
+    paths = list(iter_paths(board, (0, 0), (0, 2), 1))
+    assert paths == [[(0, 0), (1, 0), (2, 0), (2, 1), (2, 2), (1, 2), (0, 2)]]
+
+
+def test_enumeracion_completa():
+    """iter_all_paths genera exactamente los mismos caminos que el BFS sin límites"""
+    print("\n=== Test: Enumeración completa en profundidad ===")
+    board = _tablero_vacio(3, 4, (0, 0), (2, 3))
+    dfs = sorted(map(tuple, iter_all_paths(board, (0, 0), (2, 3), 1)))
+    bfs = sorted(map(tuple, iter_paths(board, (0, 0), (2, 3), 1)))
+    print(f"Caminos: {len(dfs)}")
+    assert dfs == bfs
+
+    board.push_path([(1, 0), (1, 1), (1, 2)])
+    paths = list(iter_all_paths(board, (0, 0), (2, 3), 1))
+    assert paths == [[(0, 0), (0, 1), (0, 2), (0, 3), (1, 3), (2, 3)]]
+
+
+def test_bidireccional():
+    """La búsqueda bidireccional da los mismos caminos, por longitud, que el BFS"""
+    print("\n=== Test: Búsqueda bidireccional ===")
+    board = _tablero_vacio(4, 4, (0, 0), (3, 2))
+    for max_len in (None, 6, 9):
+        bfs = list(iter_paths(board, (0, 0), (3, 2), 1, max_len=max_len))
+        bidir = list(iter_paths_bidirectional(board, (0, 0), (3, 2), 1, max_len=max_len))
+        assert [len(p) for p in bidir] == sorted(len(p) for p in bidir)
+        assert sorted(map(tuple, bidir)) == sorted(map(tuple, bfs))
+    print(f"Caminos: {len(bfs)}")
+
+    assert len(list(iter_paths_bidirectional(board, (0, 0), (3, 2), 1, max_paths=3))) == 3
+
+    board = _tablero_vacio(3, 3, (0, 0), (0, 1))
+    assert next(iter_paths_bidirectional(board, (0, 0), (0, 1), 1)) == [(0, 0), (0, 1)]
+
+    board = _tablero_vacio(3, 3, (0, 0), (0, 2))
+    board.push_path([(0, 1), (1, 1)])
+    paths = list(iter_paths_bidirectional(board, (0, 0), (0, 2), 1))
+    assert paths == [[(0, 0), (1, 0), (2, 0), (2, 1), (2, 2), (1, 2), (0, 2)]]
+
+
+if __name__ == "__main__":
+    test_orden_por_longitud()
+    test_limites_y_bloqueos()
+    test_enumeracion_completa()
+    test_bidireccional()
+    print("\nTodas las pruebas del enumerador pasaron")
@@ -0,0 +1,61 @@
+"""
+Pruebas del perfilado de la búsqueda
+"""
+
+import json
+import os
+import tempfile
+
+from board import Board
+from loader import load_board_from_file
+from solver import NumberLinkSolver
+
+
+def test_perfil_de_la_busqueda():
+    """Los contadores cuadran con la búsqueda y se exportan en ambos formatos"""
+    print("=== Test: Perfilado ===")
+    board = Board(*load_board_from_file("generated_7x7_hard.txt"))
+    solver = NumberLinkSolver(time_limit=30, require_all_cells=True, profile=True,
+                              orders=["distancia", "dinamico"], forced_moves="ninguno")
+    solver.resolver_tablero(board)
+    stats = solver.get_statistics()
+    report = stats["profile"]
+    print(f"Fases: {sorted(report['phases']['distancia'])}")
+
+    assert set(report["totals"]) == {"distancia", "dinamico"}
+    assert sum(level["nodes"] for level in report["depths"]) == stats["nodes_explored"]
+    phases = report["phases"]["dinamico"]
+    assert {"enumeracion", "poda_global", "marcado", "desmarcado", "mrv"} <= set(phases)
+    assert phases["marcado"]["calls"] == phases["desmarcado"]["calls"]
+    assert 0 <= phases["poda_global"]["hit_rate"] <= 1
+    first = report["depths"][0]
+    assert first["expanded"] == 2          # una vez por heurística
+    assert sum(first["candidates"].values()) == 2
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "perfil.json")
+        folded_path = os.path.join(tmp, "perfil.folded")
+        solver.profile.save_json(json_path)
+        solver.profile.save_collapsed(folded_path)
+        with open(json_path) as f:
+            assert json.load(f) == report
+        with open(folded_path) as f:
+            lines = f.read().splitlines()
+    for line in lines:
+        stack, micros = line.rsplit(" ", 1)
+        assert stack.startswith("resolver_tablero;") and int(micros) >= 0
+    assert "resolver_tablero;dinamico;enumeracion" in {line.rsplit(" ", 1)[0] for line in lines}
+
+
+def test_sin_perfilado():
+    """Sin perfilado no se instala ningún envoltorio"""
+    solver = NumberLinkSolver(time_limit=30)
+    assert solver.resolver_tablero(Board(*load_board_from_file("example.txt")))[0]
+    assert solver.get_statistics()["profile"] is None
+    assert "_poda_global" not in vars(solver) and "_entrar" not in vars(solver)
+
+
+if __name__ == "__main__":
+    test_perfil_de_la_busqueda()
+    test_sin_perfilado()
+    print("\nTodas las pruebas del perfilado pasaron")
@@ -0,0 +1,126 @@
+"""
+Pruebas del contenedor binario de puzzles
+"""
+
+import os
+import tempfile
+
+from batch_solver import expand_inputs, iter_batch
+from board import Board
+from board_generator import BoardGenerator
+import numberlink
+from loader import MAX_NUMBER, BoardFormatError, load_board_from_file
+from puzzle_pack import PackFormatError, PackReader, PackWriter, pack_to_text, text_to_pack
+
+
+FILES = ["ejemplo1.txt", "example.txt", "generated_4x4_easy.txt", "otro_test.txt"]
+
+
+def test_ida_y_vuelta_con_texto():
+    """texto -> binario -> texto conserva cada puzzle"""
+    print("=== Test: Conversión texto <-> binario ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        pack_path = os.path.join(tmp, "corpus.nlpk")
+        text_path = os.path.join(tmp, "corpus.txt")
+        assert text_to_pack(FILES, pack_path) == len(FILES)
+        assert pack_to_text(pack_path, text_path) == len(FILES)
+
+        with PackReader(pack_path) as reader:
+            assert len(reader) == len(FILES)
+            # Acceso aleatorio sin recorrer los anteriores
+            for i in (3, 0, 2, 1, -1):
+                original = Board(*load_board_from_file(FILES[i]))
+                assert reader[i].puzzle_hash() == original.puzzle_hash()
+                assert reader.solution(i) is None
+
+        with open(text_path) as f:
+            headers = [line for line in f if line.count(",") == 1]
+        assert len(headers) == len(FILES)
+
+
+def test_soluciones_y_errores():
+    """Las soluciones se guardan como colores por celda; un archivo ajeno se rechaza"""
+    print("\n=== Test: Soluciones empaquetadas ===")
+    generator = BoardGenerator(6, 5, seed=3, method="constructivo")
+    boards = [(generator.generate_random_board(), list(generator.last_solution)) for _ in range(3)]
+    with tempfile.TemporaryDirectory() as tmp:
+        pack_path = os.path.join(tmp, "solved.nlpk")
+        with PackWriter(pack_path) as writer:
+            for board, paths in boards:
+                writer.add(board, paths)
+            writer.add(Board(*load_board_from_file("example.txt")))
+
+        with PackReader(pack_path) as reader:
+            for i, (board, paths) in enumerate(boards):
+                grid = reader.solution(i)
+                for path in paths:
+                    number = board.get_cell(*path[0])
+                    assert all(grid[r][c] == number for r, c in path)
+            assert reader.solution(3) is None
+
+        bogus = os.path.join(tmp, "bogus.nlpk")
+        for content in (b"5,5\n1,1,1\n" * 4, b"NLPK", b""):
+            with open(bogus, "wb") as f:
+                f.write(content)
+            try:
+                PackReader(bogus)
+            except PackFormatError:
+                pass
+            else:
+                assert False, "Se esperaba PackFormatError"
+
+
+def test_entradas_no_validas():
+    """Números fuera del rango de Board y entradas mal formadas no dejan contenedor"""
+    print("\n=== Test: Entradas no válidas ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        pack_path = os.path.join(tmp, "corpus.nlpk")
+        with PackWriter(pack_path) as writer:
+            # Board no admite en sus celdas números por encima de MAX_NUMBER
+            for number in (MAX_NUMBER + 1, 0):
+                board = Board([[0, 0]], {number: [(0, 0), (0, 1)]})
+                try:
+                    writer.add(board)
+                except ValueError:
+                    pass
+                else:
+                    assert False, "Se esperaba ValueError"
+            writer.add(Board([[MAX_NUMBER, MAX_NUMBER]], {MAX_NUMBER: [(0, 0), (0, 1)]}))
+        with PackReader(pack_path) as reader:
+            assert reader[0].get_cell(0, 1) == MAX_NUMBER
+
+        bad = os.path.join(tmp, "bad.txt")
+        with open(bad, "w") as f:
+            f.write("3,3\n1,1,1\n")
+        for inputs in (["example.txt", bad], ["example.txt", os.path.join(tmp, "falta.txt")]):
+            os.remove(pack_path)
+            assert numberlink.main(["pack", *inputs, "-o", pack_path]) == 1
+            assert not os.path.exists(pack_path)
+            try:
+                text_to_pack(inputs, pack_path)
+            except (BoardFormatError, OSError):
+                pass
+            else:
+                assert False, "Se esperaba un error"
+            assert not os.path.exists(pack_path)
+            open(pack_path, "w").close()
+
+
+def test_lote_sobre_contenedor():
+    """El lote resuelve entradas archivo.nlpk#N"""
+    print("\n=== Test: Lote sobre contenedor ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        pack_path = os.path.join(tmp, "corpus.nlpk")
+        text_to_pack(["example.txt", "otro_test.txt"], pack_path)
+        entries = expand_inputs([pack_path])
+        assert entries == [f"{pack_path}#0", f"{pack_path}#1"]
+        results = list(iter_batch(entries, workers=1, time_limit=30))
+    assert all(result["success"] for result in results)
+
+
+if __name__ == "__main__":
+    test_ida_y_vuelta_con_texto()
+    test_soluciones_y_errores()
+    test_entradas_no_validas()
+    test_lote_sobre_contenedor()
+    print("\nTodas las pruebas del contenedor binario pasaron")
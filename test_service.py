@@ -0,0 +1,125 @@
+"""
+Pruebas del servicio local de resolución
+"""
+
+import os
+import tempfile
+import threading
+import time
+
+from board import Board
+from board_generator import format_board
+from loader import load_board_from_file
+from service import BackgroundService, ServiceClient, ServiceError
+from test_deadline import _tablero_dificil
+
+
+def _resolver_en_hilo(client, board, **options):
+    """Lanza client.solve en un hilo; devuelve (hilo, lista donde queda la respuesta)"""
+    out = []
+    thread = threading.Thread(target=lambda: out.append(client.solve(board, **options)))
+    thread.start()
+    return thread, out
+
+
+def test_resolucion_por_tcp():
+    """Texto, JSON y errores de formato sobre TCP"""
+    print("=== Test: Servicio por TCP ===")
+    board = Board(*load_board_from_file("example.txt"))
+    with BackgroundService(port=0, workers=2) as service:
+        client = ServiceClient(*service.address, timeout=30)
+
+        result = client.solve(board, require_all_cells=True, time_limit=30)
+        print(f"Texto: {result['success']} en {result['elapsed']:.3f}s")
+        assert result["success"] and set(result["paths"]) == {"1", "2", "3", "4", "5"}
+        assert result["statistics"]["nodes_explored"] > 0
+        assert result["stop_reason"] is None and result["error"] is None
+
+        pairs = {str(number): [list(cell) for cell in cells]
+                 for number, cells in board.number_positions.items()}
+        spec = {"rows": board.rows, "cols": board.cols, "pairs": pairs}
+        again = client.solve(spec, require_all_cells=True, engine="bitboard", job_id="json")
+        assert again["id"] == "json" and again["success"]
+
+        for bad, options in (("3,3\n1,1,1\n", {}), (format_board(board), {"engine": "x"}),
+                             (format_board(board), {"tiempo": 1})):
+            try:
+                client.solve(bad, **options)
+            except ServiceError as e:
+                assert e.status == 400
+            else:
+                assert False, "Se esperaba ServiceError"
+
+        # Las opciones booleanas no admiten textos ambiguos: "false" es False
+        adjacent = {"rows": 3, "cols": 3, "pairs": {"1": [[0, 0], [0, 1]]}}
+        assert client.solve(adjacent, require_all_cells="false")["success"]
+        assert not client.solve(adjacent, require_all_cells="true")["success"]
+        for value in ("quizás", 1, None):
+            try:
+                client.solve(adjacent, require_all_cells=value)
+            except ServiceError as e:
+                assert e.status == 400
+            else:
+                assert False, "Se esperaba ServiceError"
+
+        status = client.status()
+        assert status["workers"] == status["alive"] == 2
+        assert status["completed"] == 4 and status["queued"] == 0
+
+
+def test_plazo_y_cancelacion():
+    """Cada petición respeta su plazo y se puede cancelar en cola o en curso"""
+    print("\n=== Test: Plazo y cancelación ===")
+    hard = _tablero_dificil()
+    with BackgroundService(port=0, workers=1) as service:
+        client = ServiceClient(*service.address, timeout=30)
+
+        start = time.perf_counter()
+        result = client.solve(hard, require_all_cells=True, time_limit=0.5)
+        assert result["stop_reason"] == "timeout" and not result["success"]
+        assert time.perf_counter() - start < 2
+
+        # Con un solo proceso la segunda petición espera en cola
+        running, first = _resolver_en_hilo(client, hard, require_all_cells=True,
+                                           time_limit=60, job_id="larga")
+        while client.status()["running"] != ["larga"]:
+            time.sleep(0.05)
+        queued, second = _resolver_en_hilo(client, hard, require_all_cells=True,
+                                           time_limit=60, job_id="en cola")
+        while client.status()["queued"] < 1:
+            time.sleep(0.05)
+        assert client.cancel("en cola")
+        queued.join()
+        assert second[0]["stop_reason"] == "cancelled" and second[0]["statistics"] is None
+
+        start = time.perf_counter()
+        assert client.cancel("larga")
+        running.join()
+        print(f"Cancelada en {time.perf_counter() - start:.3f}s")
+        assert first[0]["stop_reason"] == "cancelled"
+        assert time.perf_counter() - start < 2
+
+        try:
+            client.cancel("larga")
+        except ServiceError as e:
+            assert e.status == 404
+        else:
+            assert False, "Se esperaba ServiceError"
+
+
+def test_socket_unix():
+    """El mismo servicio sobre un socket Unix"""
+    print("\n=== Test: Servicio por socket Unix ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "numberlink.sock")
+        with BackgroundService(unix_path=path, workers=1):
+            client = ServiceClient(unix_path=path, timeout=30)
+            result = client.solve(Board(*load_board_from_file("ejemplo1.txt")))
+            assert result["success"]
+
+
+if __name__ == "__main__":
+    test_resolucion_por_tcp()
+    test_plazo_y_cancelacion()
+    test_socket_unix()
+    print("\nTodas las pruebas del servicio pasaron")
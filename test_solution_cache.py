@@ -0,0 +1,63 @@
+"""
+Pruebas de la caché persistente de soluciones
+"""
+
+import os
+import tempfile
+
+from board import Board
+from loader import load_board_from_file
+from solution_cache import SolutionCache
+from solution_check import check_solution
+from solver import NumberLinkSolver
+from symmetry import SYMMETRIES
+from test_symmetry import _transformar
+
+
+def test_simetrias_reutilizan_la_solucion():
+    """Un tablero rotado, reflejado y renombrado se resuelve desde la caché"""
+    print("=== Test: Caché por forma canónica ===")
+    board = Board(*load_board_from_file("example.txt"))
+    cache = SolutionCache(":memory:")
+
+    solver = NumberLinkSolver(time_limit=30, require_all_cells=True, solution_cache=cache)
+    success, _ = solver.resolver_tablero(board)
+    assert success and not solver.cache_hit
+
+    numbers = sorted(board.number_positions)
+    relabel = dict(zip(numbers, reversed(numbers)))
+    for sym in range(len(SYMMETRIES)):
+        variant = _transformar(board, sym, relabel)
+        solver = NumberLinkSolver(time_limit=30, require_all_cells=True, solution_cache=cache)
+        success, paths = solver.resolver_tablero(variant)
+        assert success and solver.get_statistics()["cache_hit"]
+        assert solver.nodes_explored == 0
+        check_solution(variant, paths, require_all_cells=True)
+
+    # Cada modo tiene su propia entrada
+    solver = NumberLinkSolver(time_limit=30, solution_cache=cache)
+    solver.resolver_tablero(board)
+    assert not solver.cache_hit
+    print(f"Estadísticas: {cache.get_statistics()}")
+    assert cache.get_statistics() == {"hits": 8, "misses": 2, "entries": 2}
+
+
+def test_persistencia_en_disco():
+    """La caché sobrevive entre instancias que comparten archivo"""
+    print("\n=== Test: Caché en disco ===")
+    board = Board(*load_board_from_file("ejemplo1.txt"))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "cache.sqlite")
+        with SolutionCache(path) as cache:
+            NumberLinkSolver(time_limit=30, solution_cache=cache).resolver_tablero(board)
+        solver = NumberLinkSolver(time_limit=30, solution_cache=path)
+        success, paths = solver.resolver_tablero(board)
+        solver.solution_cache.close()
+    assert success and solver.cache_hit
+    check_solution(board, paths, require_all_cells=False)
+
+
+if __name__ == "__main__":
+    test_simetrias_reutilizan_la_solucion()
+    test_persistencia_en_disco()
+    print("\nTodas las pruebas de la caché de soluciones pasaron")
@@ -0,0 +1,54 @@
+"""
+Pruebas de las simetrías y la forma canónica
+"""
+
+from board import Board
+from loader import load_board_from_file
+from symmetry import INVERSE, SYMMETRIES, canonical_hash, transform_cell, transformed_size
+
+
+def _transformar(board, sym, relabel=None):
+    """Tablero transformado por ``sym`` con los números renombrados"""
+    rows, cols = transformed_size(sym, board.rows, board.cols)
+    data = [[0] * cols for _ in range(rows)]
+    positions = {}
+    for number, ends in board.number_positions.items():
+        new_number = relabel[number] if relabel else number
+        cells = [transform_cell(cell, sym, board.rows, board.cols) for cell in ends]
+        for r, c in cells:
+            data[r][c] = new_number
+        positions[new_number] = cells
+    return Board(data, positions)
+
+
+def test_inversas():
+    """Cada simetría seguida de su inversa deja la celda igual"""
+    print("=== Test: Simetrías inversas ===")
+    rows, cols = 3, 5
+    for sym in range(len(SYMMETRIES)):
+        new_rows, new_cols = transformed_size(sym, rows, cols)
+        for r in range(rows):
+            for c in range(cols):
+                cell = transform_cell((r, c), sym, rows, cols)
+                assert 0 <= cell[0] < new_rows and 0 <= cell[1] < new_cols
+                assert transform_cell(cell, INVERSE[sym], new_rows, new_cols) == (r, c)
+
+
+def test_huella_canonica():
+    """Rotaciones, reflexiones y renombrados comparten huella; otro puzzle no"""
+    print("\n=== Test: Huella canónica ===")
+    board = Board(*load_board_from_file("example.txt"))
+    numbers = sorted(board.number_positions)
+    relabel = dict(zip(numbers, reversed(numbers)))
+    reference = canonical_hash(board)
+    for sym in range(len(SYMMETRIES)):
+        assert canonical_hash(_transformar(board, sym, relabel)) == reference
+
+    other = Board(*load_board_from_file("ejemplo1.txt"))
+    assert canonical_hash(other) != reference
+
+
+if __name__ == "__main__":
+    test_inversas()
+    test_huella_canonica()
+    print("\nTodas las pruebas de simetría pasaron")
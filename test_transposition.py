@@ -0,0 +1,56 @@
+"""
+Pruebas de la tabla de transposición
+"""
+
+from board import Board
+from solver import NumberLinkSolver
+from loader import load_board_from_file
+from transposition import TranspositionTable
+from zobrist import cell_keys, number_key
+
+
+def test_lru_y_contadores():
+    """La tabla descarta el estado menos reciente y cuenta aciertos/fallos"""
+    print("=== Test: Tabla de transposición LRU ===")
+    table = TranspositionTable(capacity=2)
+    table.add(1)
+    table.add(2)
+    assert table.contains(1)       # 1 pasa a ser el más reciente
+    table.add(3)                   # se descarta 2
+    assert not table.contains(2)
+    assert table.contains(3)
+    stats = table.get_statistics()
+    print(f"Estadísticas: {stats}")
+    assert stats == {"hits": 2, "misses": 1, "evictions": 1, "entries": 2, "capacity": 2}
+
+
+def test_claves_deterministas():
+    """Las claves Zobrist no dependen del proceso ni del orden de uso"""
+    assert cell_keys(49) == cell_keys(49)
+    assert len(set(cell_keys(49))) == 49
+    assert number_key(3) == number_key(3) != number_key(4)
+
+
+def test_estadisticas_del_solver():
+    """El solver publica los contadores de la tabla y sigue resolviendo igual"""
+    print("\n=== Test: Tabla de transposición en el solver ===")
+    board = Board(*load_board_from_file("ejemplo1.txt"))
+
+    # Sin movimientos forzados la búsqueda repite estados y la tabla acierta
+    with_tt = NumberLinkSolver(time_limit=30, forced_moves="ninguno")
+    without_tt = NumberLinkSolver(time_limit=30, tt_size=0, forced_moves="ninguno")
+    success, _ = with_tt.resolver_tablero(board)
+    success_plain, _ = without_tt.resolver_tablero(board)
+
+    stats = with_tt.get_statistics()["transposition"]
+    print(f"Con tabla: {stats}")
+    assert success and success_plain
+    assert stats["hits"] > 0
+    assert without_tt.get_statistics()["transposition"] is None
+
+
+if __name__ == "__main__":
+    test_lru_y_contadores()
+    test_claves_deterministas()
+    test_estadisticas_del_solver()
+    print("\nTodas las pruebas de la tabla de transposición pasaron")
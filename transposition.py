@@ -0,0 +1,67 @@
+"""
+Tabla de transposición para el solver de NumberLink
+"""
+
+from collections import OrderedDict
+
+
+class TranspositionTable:
+    """
+    Conjunto acotado de estados ya explorados sin éxito
+
+    Las claves son hashes Zobrist del estado (celdas ocupadas y pares ya
+    colocados). Al superar ``capacity`` se descarta el estado usado hace más
+    tiempo (LRU).
+    """
+
+    def __init__(self, capacity=100000):
+        self.capacity = capacity
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def contains(self, key):
+        """True si ``key`` está registrado como estado sin salida"""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True
+        self.misses += 1
+        return False
+
+    def add(self, key):
+        """Registra ``key`` como estado sin salida"""
+        if self.capacity <= 0:
+            return
+        entries = self._entries
+        entries[key] = None
+        entries.move_to_end(key)
+        if len(entries) > self.capacity:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+    def keys(self):
+        """Estados registrados, del usado hace más tiempo al más reciente"""
+        return list(self._entries)
+
+    def load(self, keys):
+        """Registra ``keys`` en ese orden (p. ej. las de ``keys()`` de otra tabla)"""
+        for key in keys:
+            self.add(key)
+
+    def clear(self):
+        """Vacía la tabla (los contadores se conservan)"""
+        self._entries.clear()
+
+    def get_statistics(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "capacity": self.capacity,
+        }
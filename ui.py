@@ -3,6 +3,7 @@ from tkinter import filedialog, messagebox
 from loader import load_board_from_file
 from board import Board
 from solver import NumberLinkSolver
+from deadline import CancellationToken
 import threading
 import time
 
@@ -29,6 +30,10 @@ class NumberLinkUI:
                                      command=self.solve_automatically, state=tk.DISABLED)
         self.solve_button.pack(side=tk.LEFT, padx=5, pady=5)
         
+        self.cancel_button = tk.Button(control_frame, text="Cancelar",
+                                      command=self.cancel_solver, state=tk.DISABLED)
+        self.cancel_button.pack(side=tk.LEFT, padx=5, pady=5)
+        
         self.clear_button = tk.Button(control_frame, text="Limpiar Caminos",
                                      command=self.clear_paths, state=tk.DISABLED)
         self.clear_button.pack(side=tk.LEFT, padx=5, pady=5)
@@ -66,6 +71,7 @@ class NumberLinkUI:
         # Variables para el solver
         self.solver = None
         self.solving = False
+        self.cancel_token = None
 
         # Vinculación de eventos del ratón al canvas
         self.canvas.bind("<Button-1>", self.on_click_start)
@@ -104,12 +110,23 @@ class NumberLinkUI:
         # Deshabilitar controles durante la resolución
         self.solving = True
         self.solve_button.config(state=tk.DISABLED)
+        self.cancel_button.config(state=tk.NORMAL)
         self.clear_paths()
         
+        # El aviso se crea antes del thread para poder cancelar desde el primer momento
+        self.cancel_token = CancellationToken()
+        
         # Crear thread para no bloquear la UI
-        solver_thread = threading.Thread(target=self._run_solver)
+        solver_thread = threading.Thread(target=self._run_solver, daemon=True)
         solver_thread.start()
     
+    def cancel_solver(self):
+        """Detiene la resolución en curso"""
+        if self.solving and self.cancel_token is not None:
+            self.cancel_token.cancel()
+            self.cancel_button.config(state=tk.DISABLED)
+            self.status_label.config(text="Cancelando...")
+    
     def _run_solver(self):
         """Ejecuta el solver en un thread separado"""
         try:
@@ -118,20 +135,38 @@ class NumberLinkUI:
             
             # Usar la opción seleccionada por el usuario
             require_all_cells = self.complete_all_var.get()
-            self.solver = NumberLinkSolver(time_limit=30, require_all_cells=require_all_cells)
+            mode_text = "todas las celdas" if require_all_cells else "solo conexiones"
+
+            def on_progress(event):
+                # Llega desde el thread del solver: la etiqueta se actualiza en el de Tk
+                if event["type"] != "progress":
+                    return
+                text = (f"Resolviendo ({mode_text}): {event['nodes']} nodos, "
+                        f"{event['nodes_per_sec']:.0f} nodos/s, "
+                        f"pares {event['pairs_routed']}/{event['pairs_total']} "
+                        f"(máx. {event['best_depth']}), orden {event['order']}")
+                self.root.after(0, lambda: self.status_label.config(text=text))
+
+            self.solver = NumberLinkSolver(time_limit=30, require_all_cells=require_all_cells,
+                                           cancel_token=self.cancel_token,
+                                           progress=on_progress)
             
             # Actualizar estado
-            mode_text = "todas las celdas" if require_all_cells else "solo conexiones"
             self.root.after(0, lambda: self.status_label.config(text=f"Resolviendo ({mode_text})..."))
             
             # Resolver
-            start_time = time.time()
+            start_time = time.perf_counter()
             success, paths = self.solver.resolver_tablero(board)
-            elapsed_time = time.time() - start_time
+            elapsed_time = time.perf_counter() - start_time
             
             if success:
                 # Convertir paths a formato de UI
                 self._display_solution(paths, elapsed_time)
+            elif self.cancel_token.is_cancelled():
+                time_str = f"{elapsed_time:.2f}s"
+                self.root.after(0, lambda: self.status_label.config(
+                    text=f"Resolución cancelada (tiempo: {time_str})"
+                ))
             else:
                 # Capturar valores en variables locales para el lambda
                 nodes = self.solver.nodes_explored
@@ -154,6 +189,7 @@ class NumberLinkUI:
         finally:
             self.solving = False
             self.root.after(0, lambda: self.solve_button.config(state=tk.NORMAL))
+            self.root.after(0, lambda: self.cancel_button.config(state=tk.DISABLED))
     
     def _display_solution(self, paths, elapsed_time):
         """Muestra la solución encontrada"""
@@ -0,0 +1,41 @@
+"""
+Claves Zobrist del tablero de NumberLink
+
+Las usan ``Board`` (hash incremental del estado y hash del puzzle) y, a
+través de esos hashes, la tabla de transposición y la caché de soluciones.
+"""
+
+import random
+
+# Claves Zobrist por tamaño de tablero y por número de par. Se generan con una
+# semilla fija para que el mismo estado tenga el mismo hash en cualquier proceso.
+_CELL_KEYS = {}
+_NUMBER_KEYS = {}
+_SEED = 0x4E4C494E4B  # "NLINK"
+
+
+def cell_keys(size):
+    """Tupla de claves de 64 bits, una por celda de un tablero de ``size`` celdas"""
+    keys = _CELL_KEYS.get(size)
+    if keys is None:
+        rng = random.Random(_SEED ^ size)
+        keys = tuple(rng.getrandbits(64) for _ in range(size))
+        _CELL_KEYS[size] = keys
+    return keys
+
+
+def number_key(number):
+    """Clave de 64 bits asociada a un número de par"""
+    key = _NUMBER_KEYS.get(number)
+    if key is None:
+        key = random.Random((_SEED << 16) ^ number).getrandbits(64)
+        _NUMBER_KEYS[number] = key
+    return key
+
+
+def mix64(value):
+    """Finalizador de splitmix64: mezcla no lineal de un entero de 64 bits"""
+    value &= 0xFFFFFFFFFFFFFFFF
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+    return value ^ (value >> 31)